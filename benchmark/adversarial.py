@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Worst-case input benchmark and linear-scaling check for unscript.
+
+This script builds pathological inputs (megabyte-long tokens without whitespace,
+thousands of decimal numbers, emoji floods, repeated characters, huge URL- and
+email-like runs) and times every function at size n and 2n. Runtime must grow
+linearly: if doubling the input multiplies the time by more than --max-ratio,
+the case is reported as failing and the script exits with status 1.
+
+Results are written as JSON (performance_adversarial.json) in the format read by
+benchmark/compare.py.
+
+Usage:
+    python benchmark/adversarial.py                  # n = 256 KB
+    python benchmark/adversarial.py --size 1048576   # megabyte-long inputs
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path so we can import unscript
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from unscript import unscript, clean_script, clean_text, detect_script
+
+from scale import metadata, write_results
+
+# Keep numbers so the decimal-number handling of clean_script is exercised
+SCRIPT_CONFIG = {"numbers": True}
+
+# Benchmarked functions: name -> (callable taking one document, script or None)
+FUNCTIONS = {
+    "clean_text": (clean_text, None),
+    "clean_script": (lambda doc: clean_script("Latn", doc, SCRIPT_CONFIG), "Latn"),
+    "unscript": (lambda doc: unscript("Latn", doc, SCRIPT_CONFIG), "Latn"),
+    "clean_script_foreign": (
+        lambda doc: clean_script("Latn", doc, {"max_foreign_words": 1000}),
+        "Latn",
+    ),
+    "detect_script": (detect_script, None),
+}
+
+
+def _repeat(unit, size):
+    """Repeat ``unit`` up to ``size`` characters."""
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+# Worst-case inputs: name -> function building a text of about ``size`` characters
+CASES = {
+    "long_token": lambda size: _repeat("abcdefghij", size),
+    "long_mixed_token": lambda size: _repeat("abcمرحبا你好123", size),
+    "decimals": lambda size: _repeat("12.50 1,234.5 ", size),
+    "packed_decimals": lambda size: _repeat("1.5,", size),
+    "decimal_placeholders": lambda size: _repeat("__DECIMAL_0__ ", size),
+    "emoji_flood": lambda size: _repeat("😀👍🏽‍❤️#️⃣", size),
+    "repeated_chars": lambda size: _repeat("cooooool!!!!!! ", size),
+    "single_char": lambda size: "a" * size,
+    "url_run": lambda size: "https://" + _repeat("example.com/", size),
+    "www_run": lambda size: "www." + _repeat("a.b", size),
+    "email_like": lambda size: _repeat("a", size // 2) + "@" + _repeat("b", size // 2),
+    "at_flood": lambda size: _repeat("@a.", size),
+    "mentions": lambda size: _repeat("@user #tag ", size),
+}
+
+
+def time_case(func, text, repeats):
+    """Time ``func(text)`` ``repeats`` times; returns the list of durations."""
+    times = []
+    perf_counter = time.perf_counter
+    for _ in range(repeats):
+        start = perf_counter()
+        func(text)
+        times.append(perf_counter() - start)
+    return times
+
+
+def run_suite(size, cases, functions, repeats=3, max_ratio=3.0):
+    """
+    Time every (case, function) pair at ``size`` and ``2 * size`` characters.
+
+    Returns:
+        tuple: (records, failures), where failures lists the (case, function,
+               ratio) triples whose runtime grew by more than ``max_ratio``
+    """
+    records = []
+    failures = []
+    for case in cases:
+        small = CASES[case](size)
+        large = CASES[case](2 * size)
+        for name in functions:
+            func, script = FUNCTIONS[name]
+            func(small[:64])  # warm up lazily built tables and caches
+            small_times = time_case(func, small, repeats)
+            large_times = time_case(func, large, repeats)
+            # The fastest run is the least disturbed by the rest of the system
+            ratio = min(large_times) / max(min(small_times), 1e-9)
+            ok = ratio <= max_ratio
+            for text, times in ((small, small_times), (large, large_times)):
+                records.append(
+                    {
+                        "function": name,
+                        "scenario": f"{case}/{len(text)}",
+                        "script": script,
+                        "config": "numbers" if script else "default",
+                        "size_chars": len(text),
+                        "repeats": repeats,
+                        "times": times,
+                    }
+                )
+            if not ok:
+                failures.append((case, name, ratio))
+            print(
+                f"{case:<21} {name:<21} {min(small_times) * 1e3:9.2f} ms -> "
+                f"{min(large_times) * 1e3:9.2f} ms  x{ratio:.2f}"
+                f"{'' if ok else '  NOT LINEAR'}"
+            )
+    return records, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--size", type=int, default=256 << 10, help="Input size n in characters"
+    )
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument(
+        "--functions", nargs="+", choices=list(FUNCTIONS), default=list(FUNCTIONS)
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=3.0,
+        help="Largest allowed time(2n) / time(n) (default: 3.0; linear is 2.0)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(__file__).parent.parent / "performance_adversarial.json",
+    )
+    args = parser.parse_args()
+
+    records, failures = run_suite(
+        args.size, args.cases, args.functions, args.repeats, args.max_ratio
+    )
+    meta = metadata("adversarial", size=args.size, max_ratio=args.max_ratio)
+    write_results(args.output, meta, records)
+    if failures:
+        print(f"\n{len(failures)} case(s) do not scale linearly:")
+        for case, name, ratio in failures:
+            print(f"  {case} / {name}: x{ratio:.2f}")
+        sys.exit(1)
+    print("\nAll cases scale linearly.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Compare two JSON benchmark runs and flag regressions.
+
+Works with the JSON written by benchmark/full.py (performance.json) and by the
+other suites (e.g. benchmark/scale.py). Records are matched by function,
+scenario, script and config; for each pair the median times give the speedup,
+and the run-to-run spread of both runs decides whether the change is real:
+
+    noise     = sqrt(spread_baseline^2 + spread_candidate^2)
+    threshold = max(--threshold, --noise-factor * noise)
+
+where spread is the median absolute deviation of the times divided by their
+median. Changes within the threshold are reported as "~" (no change). Records
+with a single repeat in either run have unknown noise and are reported as "?";
+records present in only one run are reported as "added" or "removed".
+
+Usage:
+    python benchmark/compare.py baseline.json candidate.json
+    python benchmark/full.py compare baseline.json candidate.json --report
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+
+
+def load_results(path):
+    """Load a JSON results file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record_key(record):
+    """The identity of a measurement across runs."""
+    return (
+        record["function"],
+        record.get("scenario") or "-",
+        record.get("script") or "-",
+        record.get("config") or "-",
+    )
+
+
+def relative_spread(times):
+    """
+    Median absolute deviation of the times, relative to their median.
+
+    Returns None when the spread cannot be measured (fewer than 2 repeats).
+    """
+    if len(times) < 2:
+        return None
+    median = statistics.median(times)
+    if median <= 0:
+        return 0.0
+    return statistics.median(abs(t - median) for t in times) / median
+
+
+def compare_runs(baseline, candidate, threshold=0.05, noise_factor=3.0):
+    """
+    Compare the records of two runs.
+
+    Args:
+        baseline (dict): Results loaded from the baseline JSON
+        candidate (dict): Results loaded from the candidate JSON
+        threshold (float): Minimum relative change considered significant
+        noise_factor (float): Multiple of the combined spread a change must exceed
+
+    Returns:
+        list: One row per record with ``key``, ``baseline_s``, ``candidate_s``,
+              ``speedup``, ``noise`` and ``verdict``: "faster", "slower", "~",
+              "?" (a run has a single repeat, so the noise is unknown), or
+              "added"/"removed" for records present in only one run (their
+              missing time, speedup and noise are None)
+    """
+    candidate_records = {record_key(r): r for r in candidate["results"]}
+    baseline_keys = set()
+    rows = []
+    for base in baseline["results"]:
+        key = record_key(base)
+        baseline_keys.add(key)
+        base_median = statistics.median(base["times"])
+        cand = candidate_records.get(key)
+        if cand is None:
+            rows.append(_unmatched_row(key, base_median, None, "removed"))
+            continue
+        cand_median = statistics.median(cand["times"])
+        speedup = base_median / cand_median if cand_median > 0 else math.inf
+        spreads = (relative_spread(base["times"]), relative_spread(cand["times"]))
+        if None in spreads:
+            noise = None
+            verdict = "?"
+        else:
+            noise = math.hypot(*spreads)
+            limit = max(threshold, noise_factor * noise)
+            if speedup > 1 + limit:
+                verdict = "faster"
+            elif speedup < 1 / (1 + limit):
+                verdict = "slower"
+            else:
+                verdict = "~"
+        rows.append(
+            {
+                "key": key,
+                "baseline_s": base_median,
+                "candidate_s": cand_median,
+                "speedup": speedup,
+                "noise": noise,
+                "verdict": verdict,
+            }
+        )
+    for cand in candidate["results"]:
+        key = record_key(cand)
+        if key not in baseline_keys:
+            median = statistics.median(cand["times"])
+            rows.append(_unmatched_row(key, None, median, "added"))
+    return rows
+
+
+def _unmatched_row(key, baseline_s, candidate_s, verdict):
+    """A comparison row for a record present in only one of the runs."""
+    return {
+        "key": key,
+        "baseline_s": baseline_s,
+        "candidate_s": candidate_s,
+        "speedup": None,
+        "noise": None,
+        "verdict": verdict,
+    }
+
+
+def format_time(seconds):
+    """Format a duration with a readable unit ("-" for a missing time)."""
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def generate_report(rows, baseline_meta, candidate_meta):
+    """Format comparison rows as markdown, one table per function."""
+    report = ["# Benchmark Comparison", ""]
+    report.append(
+        f"**Baseline:** {baseline_meta.get('version', '?')} "
+        f"({baseline_meta.get('timestamp', '?')})"
+    )
+    report.append(
+        f"**Candidate:** {candidate_meta.get('version', '?')} "
+        f"({candidate_meta.get('timestamp', '?')})"
+    )
+    report.append("")
+    counts = {
+        verdict: 0 for verdict in ("faster", "slower", "~", "?", "added", "removed")
+    }
+    for row in rows:
+        counts[row["verdict"]] += 1
+    report.append(
+        f"{counts['faster']} faster, {counts['slower']} slower, "
+        f"{counts['~']} within noise, {counts['?']} unknown noise (single repeat), "
+        f"{counts['added']} added, {counts['removed']} removed"
+    )
+    report.append("")
+
+    functions = []
+    for row in rows:
+        if row["key"][0] not in functions:
+            functions.append(row["key"][0])
+    for function in functions:
+        report.append(f"## {function}")
+        report.append("")
+        report.append(
+            "| Scenario | Script | Config | Baseline | Candidate | Speedup | Noise | Verdict |"
+        )
+        report.append(
+            "|----------|--------|--------|----------|-----------|---------|-------|---------|"
+        )
+        for row in rows:
+            if row["key"][0] != function:
+                continue
+            _, scenario, script, config = row["key"]
+            speedup = "-" if row["speedup"] is None else f"{row['speedup']:.2f}x"
+            noise = "-" if row["noise"] is None else f"±{row['noise'] * 100:.1f}%"
+            report.append(
+                f"| {scenario} | {script} | {config} | {format_time(row['baseline_s'])} | "
+                f"{format_time(row['candidate_s'])} | {speedup} | {noise} | "
+                f"{row['verdict']} |"
+            )
+        report.append("")
+    return "\n".join(report)
+
+
+def add_arguments(parser):
+    """Add the compare command's arguments to an argparse parser."""
+    parser.add_argument("baseline", help="Baseline JSON results")
+    parser.add_argument("candidate", help="Candidate JSON results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Minimum relative change to report (default: 0.05 = 5%%)",
+    )
+    parser.add_argument(
+        "--noise-factor",
+        type=float,
+        default=3.0,
+        help="Changes must exceed this multiple of the measured spread (default: 3)",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Also prepend the comparison tables to performance.md",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if anything is significantly slower",
+    )
+
+
+def run_compare(args):
+    """Run the compare command; returns the process exit status."""
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+    rows = compare_runs(baseline, candidate, args.threshold, args.noise_factor)
+    report = generate_report(rows, baseline["metadata"], candidate["metadata"])
+    print(report)
+    if args.report:
+        from full import update_performance_md
+
+        update_performance_md(report)
+    if args.fail_on_regression and any(row["verdict"] == "slower" for row in rows):
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    add_arguments(parser)
+    sys.exit(run_compare(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,17 @@ This script benchmarks all core functions with various script scenarios
 and generates a comprehensive performance report in performance.md.
 """
 
+import argparse
+import cProfile
+import pstats
 import time
 import statistics
 import random
 import string
 import datetime
+import json
+import platform
+import unicodedata
 from pathlib import Path
 import sys
 import os
@@ -19,6 +25,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from unscript import unscript, clean_script, clean_text, detect_script, ranges, in_range
+from unscript.script_ranges import SCRIPT_CORE_RANGES
 
 
 def get_version():
@@ -56,8 +63,10 @@ class TestDataGenerator:
         "Guru": "ਸਤ ਸ੍ਰੀ ਅਕਾਲ ਸੰਸਾਰ! ਇਹ ਗੁਰਮੁਖੀ ਵਿੱਚ ਇੱਕ ਨਮੂਨਾ ਪਾਠ ਹੈ। ਇਸ ਵਿੱਚ ਵੱਖ-ਵੱਖ ਅੱਖਰ, ਸੰਖਿਆਵਾਂ ੧੨੩ ਅਤੇ ਵਿਰਾਮ ਚਿੰਨ੍ਹ ਹਨ।",
     }
 
-    def __init__(self):
+    def __init__(self, seed=0):
         self.available_scripts = list(self.SCRIPT_SAMPLES.keys())
+        # Seeded so that every run benchmarks exactly the same texts
+        self.rng = random.Random(seed)
 
     def generate_mono_script_text(self, script, length_multiplier=1):
         """Generate text for a single script."""
@@ -66,6 +75,39 @@ class TestDataGenerator:
         repeated_text = (base_text + " ") * length_multiplier
         return repeated_text.strip()
 
+    def generate_script_text(self, script, length):
+        """
+        Generate about ``length`` characters of text in any supported script.
+
+        Scripts with a sample text repeat it; for the others, words are built
+        from the script's letters, with some digits and punctuation.
+        """
+        if script in self.SCRIPT_SAMPLES:
+            sample = self.SCRIPT_SAMPLES[script]
+            return self.generate_mono_script_text(script, length // len(sample) + 1)
+        chars = [
+            chr(cp)
+            for start, end in SCRIPT_CORE_RANGES[script]
+            for cp in range(start, end + 1)
+            if unicodedata.category(chr(cp))[0] in "LMS"
+        ]
+        # Prefer characters detected as this script (Viet letters resolve to Latn,
+        # Braille patterns are symbols: those scripts use the whole range)
+        letters = [ch for ch in chars if ranges.script_of(ch) == script] or chars
+        words = []
+        total = 0
+        while total < length:
+            word = "".join(
+                self.rng.choice(letters) for _ in range(self.rng.randint(2, 8))
+            )
+            if self.rng.random() < 0.1:
+                word += self.rng.choice([".", ",", "!", "?"])
+            elif self.rng.random() < 0.05:
+                word = str(self.rng.randint(1, 999))
+            words.append(word)
+            total += len(word) + 1
+        return " ".join(words)
+
     def generate_mixed_script_text(self, scripts, length_multiplier=1):
         """Generate mixed script text."""
         if not scripts:
@@ -77,7 +119,7 @@ class TestDataGenerator:
             mixed_parts.append(text)
 
         # Randomly interleave the scripts
-        random.shuffle(mixed_parts)
+        self.rng.shuffle(mixed_parts)
         return " ".join(mixed_parts)
 
     def generate_text_with_noise(self, base_text):
@@ -99,8 +141,8 @@ class TestDataGenerator:
         words = base_text.split()
         # Insert noise elements randomly
         for _ in range(min(5, len(words) // 10)):
-            insert_pos = random.randint(0, len(words))
-            words.insert(insert_pos, random.choice(noise_elements))
+            insert_pos = self.rng.randint(0, len(words))
+            words.insert(insert_pos, self.rng.choice(noise_elements))
 
         return " ".join(words)
 
@@ -128,6 +170,33 @@ class PerformanceBenchmark:
             "max": max(times),
             "std_dev": statistics.stdev(times) if len(times) > 1 else 0,
             "iterations": iterations,
+            "times": times,
+        }
+
+    def time_calls(self, func, *args, number=2000, repeats=15):
+        """
+        Time batches of ``number`` back-to-back calls, for very fast calls.
+
+        Timing each call separately would mostly measure the timer; the batch
+        time divided by ``number`` gives the per-call time of each repeat.
+        """
+        times = []
+        calls = range(number)
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            for _ in calls:
+                func(*args)
+            end_time = time.perf_counter()
+            times.append((end_time - start_time) / number)
+
+        return {
+            "mean": statistics.mean(times),
+            "median": statistics.median(times),
+            "min": min(times),
+            "max": max(times),
+            "std_dev": statistics.stdev(times) if len(times) > 1 else 0,
+            "iterations": number * repeats,
+            "times": times,
         }
 
     def benchmark_clean_text(self):
@@ -274,6 +343,80 @@ class PerformanceBenchmark:
 
         return results
 
+    def benchmark_script_matrix(self, scripts=None, length=800):
+        """Benchmark throughput per script for every script in SCRIPT_CORE_RANGES."""
+        print("Benchmarking script matrix...")
+        results = {}
+
+        functions = [
+            ("clean_script", lambda script, text: clean_script(script, text)),
+            ("unscript", lambda script, text: unscript(script, text)),
+            ("detect_script", lambda script, text: detect_script(text)),
+        ]
+        for script in scripts or SCRIPT_CORE_RANGES:
+            test_text = self.data_generator.generate_script_text(script, length)
+            script_results = {}
+            for function_name, func in functions:
+                timing = self.time_function(func, script, test_text, iterations=30)
+                script_results[function_name] = {
+                    "timing": timing,
+                    "text_length": len(test_text),
+                    "chars_per_second": len(test_text) / timing["mean"],
+                }
+            results[script] = script_results
+
+        return results
+
+    def _latin_functions(self):
+        """The core functions as single-argument callables (Latin script)."""
+        return [
+            ("clean_text", clean_text),
+            ("clean_script", lambda text: clean_script("Latn", text)),
+            ("unscript", lambda text: unscript("Latn", text)),
+            ("detect_script", detect_script),
+        ]
+
+    def benchmark_call_overhead(self):
+        """Benchmark fixed per-call overhead (ns/call) on empty, 1-char and tweet input."""
+        print("Benchmarking per-call overhead...")
+        results = {}
+
+        tweet = self.data_generator.generate_text_with_noise(
+            self.data_generator.generate_mono_script_text("Latn", 2)
+        )[:140]
+        inputs = [("empty", ""), ("one_char", "a"), ("tweet", tweet)]
+
+        for function_name, func in self._latin_functions():
+            function_results = {}
+            for input_name, test_text in inputs:
+                timing = self.time_calls(func, test_text)
+                function_results[input_name] = {
+                    "timing": timing,
+                    "text_length": len(test_text),
+                    "ns_per_call": timing["median"] * 1e9,
+                }
+            results[function_name] = function_results
+
+        return results
+
+    def benchmark_long_document(self, length=100_000):
+        """Benchmark asymptotic throughput on one long (100K character) document."""
+        print("Benchmarking long-document throughput...")
+        results = {}
+
+        test_text = self.data_generator.generate_text_with_noise(
+            self.data_generator.generate_script_text("Latn", length)
+        )
+        for function_name, func in self._latin_functions():
+            timing = self.time_function(func, test_text, iterations=10)
+            results[function_name] = {
+                "timing": timing,
+                "text_length": len(test_text),
+                "chars_per_second": len(test_text) / timing["median"],
+            }
+
+        return results
+
     def benchmark_in_range(self):
         """Benchmark in_range function."""
         print("Benchmarking in_range...")
@@ -330,15 +473,20 @@ class PerformanceBenchmark:
 
         self.results = {
             "metadata": {
+                "suite": "full",
                 "version": get_version(),
                 "timestamp": datetime.datetime.now().isoformat(),
                 "python_version": sys.version,
+                "platform": platform.platform(),
             },
             "clean_text": self.benchmark_clean_text(),
             "clean_script": self.benchmark_clean_script(),
             "unscript": self.benchmark_unscript(),
             "detect_script": self.benchmark_detect_script(),
             "in_range": self.benchmark_in_range(),
+            "script_matrix": self.benchmark_script_matrix(),
+            "call_overhead": self.benchmark_call_overhead(),
+            "long_document": self.benchmark_long_document(),
         }
 
         print("All benchmarks completed!")
@@ -390,6 +538,8 @@ class ReportGenerator:
         self._add_unscript_section(report)
         self._add_detect_script_section(report)
         self._add_in_range_section(report)
+        self._add_script_matrix_section(report)
+        self._add_overhead_section(report)
 
         # Add benchmark notes
         report.append("")
@@ -580,6 +730,113 @@ class ReportGenerator:
                 f"| {case_name} | {timing['mean_ms']} | {timing['median_ms']} | {timing['std_ms']} | {calls_per_sec} |"
             )
 
+    def _add_script_matrix_section(self, report):
+        """Add per-script throughput matrix section."""
+        report.append("")
+        report.append("### Per-script Throughput")
+        report.append("")
+        report.append(
+            "| Script | Length | clean_script (chars/sec) | unscript (chars/sec) | detect_script (chars/sec) |"
+        )
+        report.append(
+            "|--------|--------|--------------------------|----------------------|---------------------------|"
+        )
+
+        for script, script_data in self.results["script_matrix"].items():
+            length = script_data["clean_script"]["text_length"]
+            rates = " | ".join(
+                f"{script_data[function]['chars_per_second']:,.0f}"
+                for function in ("clean_script", "unscript", "detect_script")
+            )
+            report.append(f"| {script} | {length:,} | {rates} |")
+
+    def _add_overhead_section(self, report):
+        """Add per-call overhead and long-document throughput sections."""
+        report.append("")
+        report.append("### Per-call Overhead")
+        report.append("")
+        report.append("Median time of one call on very short input (ns/call).")
+        report.append("")
+        report.append("| Function | Empty | 1 char | Tweet (140 chars) |")
+        report.append("|----------|-------|--------|-------------------|")
+
+        for function, data in self.results["call_overhead"].items():
+            report.append(
+                f"| {function} | {data['empty']['ns_per_call']:,.0f} | "
+                f"{data['one_char']['ns_per_call']:,.0f} | "
+                f"{data['tweet']['ns_per_call']:,.0f} |"
+            )
+
+        report.append("")
+        report.append("### Long-document Throughput")
+        report.append("")
+        report.append("| Function | Length | Median (ms) | Chars/sec |")
+        report.append("|----------|--------|-------------|-----------|")
+
+        for function, data in self.results["long_document"].items():
+            timing = self.format_timing(data["timing"])
+            report.append(
+                f"| {function} | {data['text_length']:,} | {timing['median_ms']} | {data['chars_per_second']:,.0f} |"
+            )
+
+
+def to_records(results):
+    """
+    Flatten nested benchmark results into the record list used by the JSON files.
+
+    Each record is keyed by function, scenario, script and config, and keeps the
+    raw per-iteration times so runs can be compared with benchmark/compare.py.
+    """
+    records = []
+
+    def add(function, scenario, script, config, data):
+        timing = data["timing"]
+        records.append(
+            {
+                "function": function,
+                "scenario": scenario,
+                "script": script,
+                "config": config,
+                "text_length": data.get("text_length"),
+                "times": timing["times"],
+                "median_s": timing["median"],
+            }
+        )
+
+    for size_name, data in results["clean_text"].items():
+        add("clean_text", size_name, None, "default", data)
+    for function in ("clean_script", "unscript"):
+        for script, configs in results[function].items():
+            for config_name, data in configs.items():
+                add(function, "mono_script", script, config_name, data)
+    for script, modes in results["detect_script"]["mono_script"].items():
+        for mode_name, data in modes.items():
+            add("detect_script", "mono_script", script, mode_name, data)
+    for scenario_name, data in results["detect_script"]["mixed_script"].items():
+        add("detect_script", scenario_name, None, "basic", data)
+    for case_name, data in results["in_range"].items():
+        add("in_range", case_name, None, "default", data)
+    for script, functions in results.get("script_matrix", {}).items():
+        for function, data in functions.items():
+            add(function, "script_matrix", script, "default", data)
+    for function, inputs in results.get("call_overhead", {}).items():
+        for input_name, data in inputs.items():
+            add(function, f"overhead/{input_name}", None, "default", data)
+    for function, data in results.get("long_document", {}).items():
+        add(function, "long_document", None, "default", data)
+    return records
+
+
+def write_json_results(results, path):
+    """Write the run as JSON (metadata + flat records) for later comparison."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"metadata": results["metadata"], "results": to_records(results)},
+            f,
+            indent=2,
+        )
+    print(f"JSON results written to {path}")
+
 
 def update_performance_md(new_report):
     """Update performance.md with the new report, keeping historical data."""
@@ -607,8 +864,41 @@ def update_performance_md(new_report):
     print(f"Performance report updated in {performance_file}")
 
 
-def main():
-    """Main function to run benchmarks and generate report."""
+# Scenarios that can be run under cProfile: name -> PerformanceBenchmark method
+PROFILE_SCENARIOS = {
+    "clean_text": "benchmark_clean_text",
+    "clean_script": "benchmark_clean_script",
+    "unscript": "benchmark_unscript",
+    "detect_script": "benchmark_detect_script",
+    "in_range": "benchmark_in_range",
+    "script_matrix": "benchmark_script_matrix",
+    "call_overhead": "benchmark_call_overhead",
+    "long_document": "benchmark_long_document",
+}
+
+
+def run_profile(scenario, output=None, top=25, sort="cumulative"):
+    """
+    Run one benchmark scenario under cProfile.
+
+    Dumps the raw stats to ``output`` (default: profile_<scenario>.pstats, for
+    ``python -m pstats`` or snakeviz) and prints the ``top`` hottest functions.
+    """
+    benchmark = PerformanceBenchmark()
+    method = getattr(benchmark, PROFILE_SCENARIOS[scenario])
+    method()  # warm up lazily built tables so they do not dominate the profile
+
+    profiler = cProfile.Profile()
+    profiler.runcall(method)
+
+    output = output or Path(f"profile_{scenario}.pstats")
+    profiler.dump_stats(output)
+    print(f"\nProfile written to {output}\n")
+    pstats.Stats(profiler).strip_dirs().sort_stats(sort).print_stats(top)
+
+
+def run(json_path):
+    """Run the benchmarks, update performance.md and write the JSON results."""
     print("Unscript Performance Benchmarking")
     print("=" * 40)
     print()
@@ -624,10 +914,56 @@ def main():
 
     # Update performance.md
     update_performance_md(report)
+    write_json_results(results, json_path)
 
     print("\nBenchmarking completed successfully!")
     print("Results saved to performance.md")
 
 
+def main():
+    """Main function: run the benchmarks (default) or compare two JSON runs."""
+    parser = argparse.ArgumentParser(description="Unscript performance benchmarks")
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=Path("performance.json"),
+        help="Where to write the machine-readable results (default: performance.json)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two JSON benchmark results"
+    )
+    from compare import add_arguments, run_compare
+
+    add_arguments(compare_parser)
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILE_SCENARIOS),
+        help="Run one scenario under cProfile instead of the full suite",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        help="Where to dump the .pstats file (default: profile_<scenario>.pstats)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=25, help="Hot functions to print (default: 25)"
+    )
+    parser.add_argument(
+        "--sort",
+        default="cumulative",
+        choices=["cumulative", "tottime", "calls"],
+        help="Sort order of the hot-function summary (default: cumulative)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(run_compare(args))
+    if args.profile:
+        run_profile(args.profile, args.profile_output, args.top, args.sort)
+        return
+    run(args.json)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Large-corpus benchmark suite for unscript.
+
+This script generates seeded multi-script corpora from 1 KB to 100 MB, either as
+many tweet-sized documents (50-280 characters) or as one book-sized document, and
+measures for each function:
+
+- throughput in MB/s (UTF-8 input bytes per second, 1 MB = 2^20 bytes)
+- per-call latency percentiles (p50/p95/p99)
+- peak memory allocated while processing the corpus (tracemalloc)
+
+Results are written as machine-readable JSON next to performance.md
+(performance_scale.json) and can be prepended to performance.md as markdown.
+
+Usage:
+    python benchmark/scale.py                     # 1 KB .. 1 MB
+    python benchmark/scale.py --max-size 100MB    # full suite
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path so we can import unscript
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from unscript import unscript, clean_script, clean_text, detect_script, WordCache
+
+from full import TestDataGenerator, get_version, update_performance_md
+
+MB = 1 << 20
+
+# Corpus sizes in UTF-8 bytes
+SIZES = {
+    "1KB": 1 << 10,
+    "10KB": 10 << 10,
+    "100KB": 100 << 10,
+    "1MB": 1 << 20,
+    "10MB": 10 << 20,
+    "100MB": 100 << 20,
+}
+
+SHAPES = ("tweet", "book")
+
+# Share of each script in the generated corpora
+DEFAULT_MIX = {"Latn": 0.6, "Arab": 0.15, "Hans": 0.1, "Cyrl": 0.1, "Deva": 0.05}
+
+# Script that clean_script and unscript keep (the dominant script of the mix)
+TARGET_SCRIPT = "Latn"
+
+NOISE_ELEMENTS = [
+    "@user123",
+    "#hashtag",
+    "https://example.com/path?q=1",
+    "www.example.org",
+    "user@email.com",
+    "😊",
+    "🌍",
+    "12.50",
+    "2024",
+]
+
+# Token cache shared by the runs of the cached variant (warm after the first pass)
+WORD_CACHE = WordCache()
+
+# Benchmarked functions: name -> (callable taking one document, script or None)
+FUNCTIONS = {
+    "clean_text": (clean_text, None),
+    "clean_script": (lambda doc: clean_script(TARGET_SCRIPT, doc), TARGET_SCRIPT),
+    "clean_script_cached": (
+        lambda doc: clean_script(TARGET_SCRIPT, doc, word_cache=WORD_CACHE),
+        TARGET_SCRIPT,
+    ),
+    "unscript": (lambda doc: unscript(TARGET_SCRIPT, doc), TARGET_SCRIPT),
+    "detect_script": (detect_script, None),
+}
+
+# Default location of the JSON results (next to performance.md)
+DEFAULT_OUTPUT = Path(__file__).parent.parent / "performance_scale.json"
+
+
+def parse_size(value):
+    """Parse a size label such as "10MB" (must be one of SIZES)."""
+    label = value.upper()
+    if label not in SIZES:
+        raise argparse.ArgumentTypeError(
+            f"Unknown size {value!r}. Choose from: {', '.join(SIZES)}"
+        )
+    return SIZES[label]
+
+
+class CorpusGenerator:
+    """Generate reproducible multi-script corpora of a given size and shape."""
+
+    def __init__(self, seed=0, mix=None):
+        self.seed = seed
+        self.mix = mix or DEFAULT_MIX
+        self.scripts = list(self.mix)
+        self.weights = [self.mix[script] for script in self.scripts]
+        self.words = {}
+        for script in self.scripts:
+            sample = TestDataGenerator.SCRIPT_SAMPLES[script]
+            words = sample.split()
+            if len(words) < 10:
+                # Scripts written without spaces: use short character runs as words
+                words = [sample[i : i + 3] for i in range(0, len(sample), 3)]
+            self.words[script] = words
+        self._pools = {}
+
+    def _words(self, rng, script, count):
+        words = self.words[script]
+        return " ".join(rng.choice(words) for _ in range(count))
+
+    def _document(self, rng, min_words, max_words, foreign_rate, noise_rate):
+        script = rng.choices(self.scripts, self.weights)[0]
+        parts = [self._words(rng, script, rng.randint(min_words, max_words))]
+        if rng.random() < foreign_rate:
+            other = rng.choice(self.scripts)
+            parts.insert(rng.randint(0, 1), self._words(rng, other, rng.randint(2, 6)))
+        if rng.random() < noise_rate:
+            parts.insert(rng.randint(0, len(parts)), rng.choice(NOISE_ELEMENTS))
+        return " ".join(parts)
+
+    def tweet(self, rng):
+        """One tweet-sized document (50-280 characters)."""
+        text = self._document(rng, 6, 30, foreign_rate=0.3, noise_rate=0.5)
+        while len(text) < 50:
+            text += " " + self._words(rng, TARGET_SCRIPT, 3)
+        return text[:280]
+
+    def paragraph(self, rng):
+        """One book paragraph."""
+        return self._document(rng, 40, 120, foreign_rate=0.2, noise_rate=0.1)
+
+    def _pool(self, shape):
+        # A fixed pool of documents per shape, sampled to build corpora of any size
+        if shape not in self._pools:
+            rng = random.Random(f"{self.seed}:pool:{shape}")
+            if shape == "tweet":
+                self._pools[shape] = [self.tweet(rng) for _ in range(4096)]
+            else:
+                self._pools[shape] = [self.paragraph(rng) for _ in range(512)]
+        return self._pools[shape]
+
+    def corpus(self, size, shape):
+        """
+        Build a corpus of about ``size`` UTF-8 bytes.
+
+        Returns:
+            list: Tweet documents, or a single book document
+        """
+        rng = random.Random(f"{self.seed}:{shape}:{size}")
+        pool = self._pool(shape)
+        docs = []
+        total = 0
+        while total < size:
+            doc = rng.choice(pool)
+            docs.append(doc)
+            total += len(doc.encode("utf-8")) + 1
+        if shape == "book":
+            return ["\n\n".join(docs)]
+        return docs
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    index = math.ceil(q / 100 * len(sorted_values)) - 1
+    return sorted_values[min(max(index, 0), len(sorted_values) - 1)]
+
+
+def measure(func, docs, repeats):
+    """Time every call over ``repeats`` passes; return pass totals and latencies."""
+    totals = []
+    latencies = []
+    perf_counter = time.perf_counter
+    for _ in range(repeats):
+        pass_start = perf_counter()
+        for doc in docs:
+            start = perf_counter()
+            func(doc)
+            latencies.append(perf_counter() - start)
+        totals.append(perf_counter() - pass_start)
+    return totals, latencies
+
+
+def measure_peak_memory(func, docs):
+    """Peak bytes allocated while processing the corpus once (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        for doc in docs:
+            func(doc)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_suite(sizes, shapes, functions, seed=0, repeats=3, memory=True):
+    """
+    Run the benchmark matrix.
+
+    Returns:
+        list: One result record per (function, shape, size)
+    """
+    generator = CorpusGenerator(seed)
+    records = []
+    for shape in shapes:
+        for label, size in sizes:
+            docs = generator.corpus(size, shape)
+            n_bytes = sum(len(doc.encode("utf-8")) for doc in docs)
+            # One pass is plenty (and all we can afford) for the largest corpora
+            passes = repeats if size < 10 * MB else 1
+            for name in functions:
+                func, script = FUNCTIONS[name]
+                func(docs[0])  # warm up lazily built tables and caches
+                totals, latencies = measure(func, docs, passes)
+                latencies.sort()
+                record = {
+                    "function": name,
+                    "scenario": f"{shape}/{label}",
+                    "script": script,
+                    "config": "default",
+                    "shape": shape,
+                    "size_bytes": n_bytes,
+                    "docs": len(docs),
+                    "repeats": passes,
+                    "times": totals,
+                    "mb_per_s": n_bytes / MB / statistics.median(totals),
+                    "latency_ms": {
+                        "p50": percentile(latencies, 50) * 1e3,
+                        "p95": percentile(latencies, 95) * 1e3,
+                        "p99": percentile(latencies, 99) * 1e3,
+                        "max": latencies[-1] * 1e3,
+                    },
+                    "peak_bytes": measure_peak_memory(func, docs) if memory else None,
+                }
+                records.append(record)
+                print(
+                    f"{name:<20} {shape:<5} {label:>6}: {record['mb_per_s']:8.2f} MB/s, "
+                    f"p99 {record['latency_ms']['p99']:.3f} ms"
+                )
+    return records
+
+
+def metadata(suite, **extra):
+    """Common metadata stored with every JSON result file."""
+    return {
+        "suite": suite,
+        "version": get_version(),
+        "timestamp": datetime.datetime.now().isoformat(),
+        "python_version": sys.version,
+        "platform": platform.platform(),
+        **extra,
+    }
+
+
+def write_results(path, meta, records):
+    """Write benchmark results as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": meta, "results": records}, f, indent=2)
+    print(f"Results written to {path}")
+
+
+def load_results(path):
+    """Load a JSON results file written by write_results."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def generate_report(meta, records):
+    """Format scale results as markdown tables, one per corpus shape."""
+    report = [f"# Large-Corpus Benchmark - Version {meta['version']}", ""]
+    report.append(f"**Generated:** {meta['timestamp']}")
+    report.append(f"**Python Version:** {meta['python_version']}")
+    report.append(f"**Seed:** {meta['seed']}")
+    report.append("")
+    for shape in SHAPES:
+        shape_records = [r for r in records if r["shape"] == shape]
+        if not shape_records:
+            continue
+        report.append(f"## {shape.title()}-shaped corpora")
+        report.append("")
+        report.append(
+            "| Function | Size | Docs | MB/s | p50 (ms) | p95 (ms) | p99 (ms) | Peak memory (MB) |"
+        )
+        report.append(
+            "|----------|------|------|------|----------|----------|----------|------------------|"
+        )
+        for r in shape_records:
+            latency = r["latency_ms"]
+            peak = "-" if r["peak_bytes"] is None else f"{r['peak_bytes'] / MB:.2f}"
+            report.append(
+                f"| {r['function']} | {r['scenario'].split('/')[1]} | {r['docs']:,} | "
+                f"{r['mb_per_s']:.2f} | {latency['p50']:.4f} | {latency['p95']:.4f} | "
+                f"{latency['p99']:.4f} | {peak} |"
+            )
+        report.append("")
+    return "\n".join(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min-size", type=parse_size, default=SIZES["1KB"])
+    parser.add_argument("--max-size", type=parse_size, default=SIZES["1MB"])
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument(
+        "--functions", nargs="+", choices=list(FUNCTIONS), default=list(FUNCTIONS)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip tracemalloc measurements"
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--markdown", action="store_true", help="Also prepend tables to performance.md"
+    )
+    args = parser.parse_args()
+
+    sizes = [(l, s) for l, s in SIZES.items() if args.min_size <= s <= args.max_size]
+    records = run_suite(
+        sizes,
+        args.shapes,
+        args.functions,
+        seed=args.seed,
+        repeats=args.repeats,
+        memory=not args.no_memory,
+    )
+    meta = metadata("scale", seed=args.seed, sizes=[label for label, _ in sizes])
+    write_results(args.output, meta, records)
+    if args.markdown:
+        update_performance_md(generate_report(meta, records))
+
+
+if __name__ == "__main__":
+    main()
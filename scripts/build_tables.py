@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Regenerate the binary class table shipped with unscript.
+
+The table is derived from the ranges in src/unscript/script_ranges.py and must be
+rebuilt whenever those ranges change:
+
+    python scripts/build_tables.py          # rewrite src/unscript/class_table.bin
+    python scripts/build_tables.py --check  # exit with status 1 if it is stale
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_PATH))
+
+from unscript import script_ranges  # noqa: E402
+
+
+def build() -> bytes:
+    table = script_ranges.compute_class_table()
+    return script_ranges.serialize_class_table(table, script_ranges.table_fingerprint())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write anything; fail if the shipped table is out of date.",
+    )
+    args = parser.parse_args()
+
+    path = Path(script_ranges.CLASS_TABLE_FILE)
+    data = build()
+    current = path.read_bytes() if path.exists() else None
+
+    if args.check:
+        if current != data:
+            print(
+                f"{path} is stale. Run: python scripts/build_tables.py", file=sys.stderr
+            )
+            return 1
+        print(f"{path} is up to date.")
+        return 0
+
+    if current == data:
+        print(f"{path} is already up to date.")
+        return 0
+    path.write_bytes(data)
+    print(f"Wrote {path} ({len(data):,} bytes).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,111 @@
-from .unscript import clean_text, clean_script, unscript
-from .detect_script import (
-    detect_script,
-    detect_script_detailed,
-    get_dominant_script,
-    is_script_mixed,
-)
-from . import ranges
-from .ranges import in_range
+"""
+Unscript: a writing script-aware library for cleaning text.
+
+Public names are loaded lazily (PEP 562): importing the package is cheap, and each
+submodule is only imported when one of its attributes is first accessed.
+"""
+
+import importlib
+import sys
+import types
+
+# Public attribute -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    "clean_text": ".unscript",
+    "clean_script": ".unscript",
+    "unscript": ".unscript",
+    "clean_script_tokens": ".unscript",
+    "unscript_tokens": ".unscript",
+    "split_by_script": ".unscript",
+    "clean_script_variants": ".unscript",
+    "detect_script": ".detect_script",
+    "detect_script_detailed": ".detect_script",
+    "detect_script_matrix": ".detect_script",
+    "get_dominant_script": ".detect_script",
+    "is_script_mixed": ".detect_script",
+    "matches_script": ".detect_script",
+    "in_range": ".ranges",
+    "register_script": ".script_ranges",
+    "register_category": ".script_ranges",
+    "ScriptConfig": ".config",
+    "PunctuationLevel": ".config",
+    "profile": ".profiling",
+    "CleaningStats": ".stats",
+    "WordCache": ".cache",
+    "ResultCache": ".cache",
+    "Deduplicator": ".pipeline",
+    "unscript_stream": ".pipeline",
+    "filter_by_script": ".pipeline",
+    "ScriptRouter": ".pipeline",
+}
+
+# Public submodules
+_LAZY_SUBMODULES = {"ranges"}
 
 __all__ = [
     "clean_text",
     "clean_script",
     "unscript",
+    "clean_script_tokens",
+    "unscript_tokens",
+    "split_by_script",
+    "clean_script_variants",
     "detect_script",
     "detect_script_detailed",
+    "detect_script_matrix",
     "get_dominant_script",
     "is_script_mixed",
+    "matches_script",
     "ranges",
     "in_range",
+    "register_script",
+    "register_category",
+    "ScriptConfig",
+    "PunctuationLevel",
+    "profile",
+    "CleaningStats",
+    "WordCache",
+    "ResultCache",
+    "Deduplicator",
+    "unscript_stream",
+    "filter_by_script",
+    "ScriptRouter",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# Public functions named like the submodule that defines them
+_FUNCTION_SUBMODULES = {"unscript", "detect_script"}
+
+
+class _Package(types.ModuleType):
+    """
+    Keep ``unscript.unscript`` and ``unscript.detect_script`` bound to the functions.
+
+    Importing a submodule makes the import system set the package attribute of the
+    same name to the module object; for submodules named like a public function,
+    redirect it to the function the submodule defines, as the eager imports used to.
+    """
+
+    def __setattr__(self, name, value):
+        if name in _FUNCTION_SUBMODULES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,282 @@
+"""
+Memoization caches for repetitive corpora.
+
+Natural-language text is Zipfian: most tokens are occurrences of a comparatively
+small vocabulary. A WordCache passed to clean_script or unscript (``word_cache=``)
+stores the cleaned form of every whitespace-separated token for each
+configuration, so each distinct token is classified once instead of at every
+occurrence.
+
+Scrapes also contain many exact duplicate documents (retweets, boilerplate,
+templated messages). A ResultCache passed to unscript, clean_text or
+detect_script (``result_cache=``) stores whole results keyed by the document and
+the call's configuration, so a duplicate costs one lookup.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+class _LRUCache:
+    """LRU mapping bounded by entry count and approximate size, with hit metrics."""
+
+    def __init__(self, max_entries, max_bytes):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """Share of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        """
+        Get the cache metrics.
+
+        Returns:
+            dict: hits, misses, evictions, entries, bytes, hit_rate, the
+                  configured limits and any cache-specific counters
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hit_rate": self.hit_rate,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        """Drop every cached entry (metrics are kept)."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def _insert(self, key, value, size):
+        # Called with the lock held
+        entries = self._entries
+        if key in entries:
+            self.bytes -= self._sizes[key]
+        entries[key] = value
+        self._sizes[key] = size
+        self.bytes += size
+        max_entries = self.max_entries
+        max_bytes = self.max_bytes
+        while entries and (
+            (max_entries is not None and len(entries) > max_entries)
+            or (max_bytes is not None and self.bytes > max_bytes)
+        ):
+            old_key, _ = entries.popitem(last=False)
+            self.bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(entries={len(self._entries)}, hits={self.hits}, "
+            f"misses={self.misses}, evictions={self.evictions})"
+        )
+
+
+class WordCache(_LRUCache):
+    """
+    Bounded LRU cache of cleaned tokens for the token-level cleaning engine.
+
+    Entries are keyed by the configuration (script selection, config and class
+    table version) and the token, so calls with different configurations share
+    one cache and one entry and byte budget. The cache is only used when cleaning
+    per token gives the same result as cleaning the whole document, i.e. when
+    ``max_foreign_words`` is 0 and neither stats nor offsets are requested; other
+    calls are counted as bypassed.
+
+    Args:
+        max_entries (int): Maximum number of cached tokens. Defaults to 100,000.
+        max_bytes (int | None): Maximum approximate memory of the cached strings
+                                (``sys.getsizeof`` of tokens and values), or None
+                                for no limit. Defaults to None.
+        max_token_length (int): Longer tokens are cleaned without being cached.
+                                Defaults to 64.
+
+    Example:
+        >>> from unscript import WordCache, unscript
+        >>> cache = WordCache(max_entries=50_000)
+        >>> cleaned = [unscript("Latn", doc, word_cache=cache) for doc in docs]
+        >>> cache.info()["hit_rate"]
+        0.97
+    """
+
+    def __init__(self, max_entries=100_000, max_bytes=None, max_token_length=64):
+        super().__init__(max_entries, max_bytes)
+        self.max_token_length = max_token_length
+        # Configuration -> its cleaned space, which joins the cleaned chunks
+        self._separators = {}
+        self.bypassed = 0
+
+    def info(self):
+        info = super().info()
+        info["bypassed"] = self.bypassed
+        info["max_token_length"] = self.max_token_length
+        return info
+
+    def _clear(self):
+        super()._clear()
+        self._separators.clear()
+
+    def clean(self, plan, text, clean_chunk):
+        """
+        Clean ``text`` chunk by chunk, computing each distinct chunk only once.
+
+        The text is split on single spaces: cleaning works per character except for
+        decimal numbers, which never contain a space, so each chunk cleans alone.
+        Chunks missing from the cache are cleaned without holding the lock.
+
+        Args:
+            plan (tuple): Hashable key of the configuration the chunks are cleaned for
+            text (str): The text to clean
+            clean_chunk (callable): Cleans one chunk of text
+
+        Returns:
+            str: The cleaned chunks joined by the cleaned space
+        """
+        entries = self._entries
+        chunks = text.split(" ")
+        pieces = []
+        missing = {}
+        with self._lock:
+            get = entries.get
+            move_to_end = entries.move_to_end
+            separator = self._separators.get(plan)
+            for chunk in chunks:
+                key = (plan, chunk)
+                value = get(key)
+                if value is not None:
+                    move_to_end(key)
+                else:
+                    missing[chunk] = None
+                pieces.append(value)
+
+        # Clean the misses without blocking other threads
+        if separator is None:
+            separator = clean_chunk(" ")
+        for chunk in missing:
+            missing[chunk] = clean_chunk(chunk)
+
+        getsizeof = sys.getsizeof
+        max_length = self.max_token_length
+        with self._lock:
+            self._separators[plan] = separator
+            for chunk, value in missing.items():
+                if len(chunk) <= max_length:
+                    self._insert(
+                        (plan, chunk), value, getsizeof(chunk) + getsizeof(value)
+                    )
+            # Repeats of a missing chunk within the text reuse its cleaned value
+            self.hits += len(chunks) - len(missing)
+            self.misses += len(missing)
+        if missing:
+            pieces = [
+                missing[chunk] if value is None else value
+                for chunk, value in zip(chunks, pieces)
+            ]
+        return separator.join(pieces)
+
+
+class ResultCache(_LRUCache):
+    """
+    Bounded LRU cache of whole-document results.
+
+    Results are keyed by the document text itself (compared in full, so hash
+    collisions never return another document's result) and by the function and
+    configuration of the call, including the class table version. Documents
+    shorter than ``min_length`` (cheaper to clean than to cache) or longer than
+    ``max_length`` (unlikely duplicates that would crowd out the rest) are
+    processed without caching and counted as skipped, as are calls requesting
+    stats or offsets.
+
+    Args:
+        max_bytes (int): Maximum approximate memory of the cached documents and
+                         results (``sys.getsizeof``). Defaults to 64 MiB.
+        min_length (int): Shortest document that is cached. Defaults to 16.
+        max_length (int): Longest document that is cached. Defaults to 100,000.
+        max_entries (int | None): Optional limit on the number of results.
+
+    Example:
+        >>> from unscript import ResultCache, unscript
+        >>> cache = ResultCache(max_bytes=256 << 20)
+        >>> cleaned = [unscript("Latn", doc, result_cache=cache) for doc in docs]
+        >>> cache.hits, cache.misses, cache.evictions
+        (41250, 8750, 0)
+    """
+
+    def __init__(
+        self, max_bytes=64 << 20, min_length=16, max_length=100_000, max_entries=None
+    ):
+        super().__init__(max_entries, max_bytes)
+        self.min_length = min_length
+        self.max_length = max_length
+        self.skipped = 0
+
+    def info(self):
+        info = super().info()
+        info["skipped"] = self.skipped
+        info["min_length"] = self.min_length
+        info["max_length"] = self.max_length
+        return info
+
+    def lookup(self, text, config_key, compute):
+        """
+        Return the cached result for ``(text, config_key)``, computing it on a miss.
+
+        Args:
+            text: The document (anything that is not a str is never cached)
+            config_key (tuple): Hashable function name and configuration of the call
+            compute (callable): Computes the result when it is not cached
+
+        Returns:
+            The cached or computed result
+        """
+        if not isinstance(text, str) or not (
+            self.min_length <= len(text) <= self.max_length
+        ):
+            self.skipped += 1
+            return compute()
+        key = (text, config_key)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        result = compute()
+        with self._lock:
+            self.misses += 1
+            self._insert(key, result, sys.getsizeof(text) + _result_size(result))
+        return result
+
+
+def _result_size(result):
+    """Approximate memory of a cached result (a string or a flat dict)."""
+    size = sys.getsizeof(result)
+    if isinstance(result, dict):
+        for key, value in result.items():
+            size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
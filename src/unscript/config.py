@@ -0,0 +1,225 @@
+"""
+Configuration objects for script filtering.
+
+ScriptConfig is an immutable, hashable equivalent of the config dicts accepted by
+clean_script and unscript. Keys are validated and values normalized once, so a
+config can key caches of compiled cleaning plans or be shipped to worker processes.
+"""
+
+import enum
+
+from .script_ranges import SHARED_RANGES, BUILTIN_CATEGORIES
+
+# ScriptConfig fields, in constructor order
+_FIELDS = (
+    "spaces",
+    "numbers",
+    "punctuation",
+    "symbols",
+    "max_foreign_words",
+    "foreign_scripts",
+    "categories",
+)
+
+
+class PunctuationLevel(enum.Enum):
+    """Punctuation kept by clean_script (see PUNCTUATION_LEVELS)."""
+
+    NONE = "none"
+    ASCII = "ascii"
+    EXTENDED = "extended"
+    ALL = "all"
+
+    @classmethod
+    def coerce(cls, value):
+        """
+        Normalize a "punctuation" config value to a level.
+
+        Args:
+            value (PunctuationLevel | str | bool): Level, level name, or boolean
+                (True means ASCII, as in the dict config)
+
+        Returns:
+            PunctuationLevel: The level; unknown names mean NONE (no punctuation)
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            try:
+                return cls(value.lower())
+            except ValueError:
+                return cls.NONE
+        return cls.ASCII if value else cls.NONE
+
+
+class ScriptConfig:
+    """
+    Immutable, hashable configuration for clean_script and unscript.
+
+    Args:
+        spaces (bool): Keep spaces. Defaults to True.
+        numbers (bool): Keep numbers. Defaults to False.
+        punctuation (PunctuationLevel | str | bool): Punctuation level to keep.
+            Defaults to False (no punctuation).
+        symbols (bool): Keep symbols. Defaults to False.
+        max_foreign_words (int): Number of words from other scripts to keep.
+            Defaults to 0.
+        foreign_scripts (str | Iterable[str] | None): Scripts those words may come
+            from (None = any). Defaults to None.
+        categories (Iterable[str]): Custom categories (see register_category) whose
+            characters are kept. Defaults to none.
+
+    Raises:
+        ValueError: If a custom category is not registered
+
+    Example:
+        >>> from unscript import ScriptConfig, clean_script
+        >>> config = ScriptConfig(numbers=True, punctuation="extended")
+        >>> clean_script("Latn", "Hello, World! 123", config)
+        'Hello, World! 123'
+        >>> ScriptConfig.from_dict({"numbers": True, "punctuation": "extended"}) == config
+        True
+    """
+
+    __slots__ = _FIELDS + ("_hash",)
+
+    def __init__(
+        self,
+        spaces=True,
+        numbers=False,
+        punctuation=False,
+        symbols=False,
+        max_foreign_words=0,
+        foreign_scripts=None,
+        categories=(),
+    ):
+        if isinstance(foreign_scripts, str):
+            foreign_scripts = [foreign_scripts]
+        if foreign_scripts is not None:
+            foreign_scripts = frozenset(foreign_scripts)
+        categories = frozenset(categories)
+        for category in categories:
+            if category in BUILTIN_CATEGORIES or category not in SHARED_RANGES:
+                raise ValueError(f"Unknown custom category '{category}'")
+
+        values = (
+            bool(spaces),
+            bool(numbers),
+            PunctuationLevel.coerce(punctuation),
+            bool(symbols),
+            max(int(max_foreign_words or 0), 0),
+            foreign_scripts,
+            categories,
+        )
+        for name, value in zip(_FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", hash(values))
+
+    @classmethod
+    def from_dict(cls, config):
+        """
+        Build a config from a dict of overrides of DEFAULT_CONFIG.
+
+        Besides the ScriptConfig arguments, registered custom categories can be
+        enabled with ``{name: True}``, as in the dict config.
+
+        Args:
+            config (dict): Config overrides
+
+        Returns:
+            ScriptConfig: The equivalent config
+
+        Raises:
+            ValueError: If a key is neither an option nor a registered category
+        """
+        options = {}
+        categories = []
+        for key, value in config.items():
+            if key in _FIELDS and key != "categories":
+                options[key] = value
+            elif key in SHARED_RANGES and key not in BUILTIN_CATEGORIES:
+                if value:
+                    categories.append(key)
+            else:
+                raise ValueError(f"Unknown config key '{key}'")
+        return cls(categories=categories, **options)
+
+    @classmethod
+    def coerce(cls, config):
+        """
+        Accept a ScriptConfig, a config dict, or None (defaults).
+
+        Returns:
+            ScriptConfig: The config as a ScriptConfig
+        """
+        if isinstance(config, cls):
+            return config
+        if not config:
+            return _DEFAULT
+        return cls.from_dict(config)
+
+    def replace(self, **changes):
+        """
+        Return a copy of this config with some options changed.
+
+        Returns:
+            ScriptConfig: The new config
+        """
+        options = {name: getattr(self, name) for name in _FIELDS}
+        options.update(changes)
+        return ScriptConfig(**options)
+
+    def to_dict(self):
+        """
+        Convert back to a config dict.
+
+        Returns:
+            dict: Options (punctuation as a level name, or False) and enabled
+                  custom categories
+        """
+        config = {
+            "spaces": self.spaces,
+            "numbers": self.numbers,
+            "punctuation": (
+                self.punctuation.value
+                if self.punctuation is not PunctuationLevel.NONE
+                else False
+            ),
+            "symbols": self.symbols,
+            "max_foreign_words": self.max_foreign_words,
+            "foreign_scripts": (
+                sorted(self.foreign_scripts)
+                if self.foreign_scripts is not None
+                else None
+            ),
+        }
+        for category in sorted(self.categories):
+            config[category] = True
+        return config
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in _FIELDS)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScriptConfig is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ScriptConfig is immutable")
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, ScriptConfig):
+            return NotImplemented
+        return self._hash == other._hash and self._key() == other._key()
+
+    def __reduce__(self):
+        return ScriptConfig, self._key()
+
+    def __repr__(self):
+        options = ", ".join(f"{name}={getattr(self, name)!r}" for name in _FIELDS)
+        return f"ScriptConfig({options})"
+
+
+_DEFAULT = ScriptConfig()
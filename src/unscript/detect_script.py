@@ -5,10 +5,41 @@ This module provides the detect_script function that analyzes text and returns
 the percentage distribution of different Unicode scripts found.
 """
 
-from .script_ranges import SCRIPT_CORE_RANGES, is_char_in_script, is_char_in_category
+from collections import Counter
 
+from .script_ranges import (
+    SCRIPT_CORE_RANGES,
+    CATEGORIES_PRIORITY,
+    PAGE_SHIFT,
+    PAGE_MASK,
+    get_char_class,
+    get_class_table,
+    get_class_labels,
+    get_table_version,
+)
 
-def detect_script(text, include_categories=False, min_threshold=0.01):
+# Lazily built NumPy lookup table used by detect_script_matrix
+_MATRIX_TABLE = None
+
+# matches_script classifies the text in chunks that double from the first size up
+# to the largest one, checking after each chunk whether the outcome is decided
+_FIRST_CHUNK = 64
+_MAX_CHUNK = 4096
+
+
+def _char_labels(char):
+    """
+    Return the ``(script, category)`` labels of a single character.
+
+    The script is the first matching script in SCRIPT_CORE_RANGES order; characters
+    outside every script get the highest priority matching category.
+    """
+    return get_class_labels()[get_char_class(ord(char))]
+
+
+def detect_script(
+    text, include_categories=False, min_threshold=0.01, result_cache=None
+):
     """
     Analyze text and return percentage distribution of different scripts found.
 
@@ -21,6 +52,7 @@ def detect_script(text, include_categories=False, min_threshold=0.01):
                                  punctuation, symbols) in the analysis. Defaults to False.
         min_threshold (float): Minimum percentage threshold to include in results.
                              Scripts below this threshold are excluded. Defaults to 0.01 (1%).
+        result_cache (ResultCache, optional): Return cached results for repeated documents.
 
     Returns:
         dict: Dictionary mapping script codes to their percentages. When include_categories=True,
@@ -40,6 +72,17 @@ def detect_script(text, include_categories=False, min_threshold=0.01):
         >>> detect_script("你好世界")
         {'Hans': 100.0}
     """
+    if result_cache is not None:
+        key = ("detect_script", include_categories, min_threshold, get_table_version())
+        # Callers get their own copy of the cached dict
+        return dict(
+            result_cache.lookup(
+                text,
+                key,
+                lambda: detect_script(text, include_categories, min_threshold),
+            )
+        )
+
     if not isinstance(text, str) or not text:
         return {}
 
@@ -47,26 +90,13 @@ def detect_script(text, include_categories=False, min_threshold=0.01):
     script_counts = {}
     category_counts = {}
 
-    for char in text:
-        char_code = ord(char)
-
-        # Check which script this character belongs to
-        found_in_script = False
-        for script in SCRIPT_CORE_RANGES:
-            if is_char_in_script(char_code, script):
-                script_counts[script] = script_counts.get(script, 0) + 1
-                found_in_script = True
-                break
-
-        # If not found in any script and we're including categories, check categories
-        if not found_in_script and include_categories:
-            # Check categories in order of priority: punctuation > numbers > symbols > spaces
-            categories_priority = ["punctuation", "numbers", "symbols", "spaces"]
-
-            for category in categories_priority:
-                if is_char_in_category(char_code, category):
-                    category_counts[category] = category_counts.get(category, 0) + 1
-                    break
+    # Classify each distinct character once; Counter preserves first-seen order
+    for char, count in Counter(text).items():
+        script, category = _char_labels(char)
+        if script is not None:
+            script_counts[script] = script_counts.get(script, 0) + count
+        elif include_categories and category is not None:
+            category_counts[category] = category_counts.get(category, 0) + count
 
     # Calculate total characters for percentage calculation
     if include_categories:
@@ -155,30 +185,15 @@ def detect_script_detailed(text, normalize_whitespace=False):
             "category": None,
         }
 
-        # Check which script this character belongs to
-        found_in_script = False
-        for script in SCRIPT_CORE_RANGES:
-            if is_char_in_script(char_code, script):
-                char_info["script"] = script
-                script_counts[script] = script_counts.get(script, 0) + 1
-                if script not in script_chars:
-                    script_chars[script] = []
-                script_chars[script].append(char)
-                found_in_script = True
-                break
-
-        # If not found in any script, check categories
-        if not found_in_script:
-            categories_priority = ["punctuation", "numbers", "symbols", "spaces"]
-
-            for category in categories_priority:
-                if is_char_in_category(char_code, category):
-                    char_info["category"] = category
-                    category_counts[category] = category_counts.get(category, 0) + 1
-                    if category not in category_chars:
-                        category_chars[category] = []
-                    category_chars[category].append(char)
-                    break
+        script, category = _char_labels(char)
+        if script is not None:
+            char_info["script"] = script
+            script_counts[script] = script_counts.get(script, 0) + 1
+            script_chars.setdefault(script, []).append(char)
+        elif category is not None:
+            char_info["category"] = category
+            category_counts[category] = category_counts.get(category, 0) + 1
+            category_chars.setdefault(category, []).append(char)
 
         breakdown.append(char_info)
 
@@ -204,6 +219,106 @@ def detect_script_detailed(text, normalize_whitespace=False):
     }
 
 
+def _get_matrix_table(np):
+    """
+    Build (once) the NumPy lookup arrays used by detect_script_matrix.
+
+    The shared two-stage class table is wrapped as NumPy arrays without copying,
+    and every class is mapped to a column: the scripts in SCRIPT_CORE_RANGES
+    order followed by the categories in detection priority order. Classes with
+    no label map to -1. The arrays are rebuilt when the table version changes.
+    """
+    global _MATRIX_TABLE
+    version = get_table_version()
+    if _MATRIX_TABLE is not None and _MATRIX_TABLE[0] == version:
+        return _MATRIX_TABLE[1:]
+
+    scripts = list(SCRIPT_CORE_RANGES.keys())
+    columns = scripts + CATEGORIES_PRIORITY
+    column_index = {name: i for i, name in enumerate(columns)}
+
+    stage1, stage2 = get_class_table()
+    class_labels = get_class_labels()
+    class_columns = np.full(len(class_labels), -1, dtype=np.int16)
+    for class_id, (script, category) in enumerate(class_labels):
+        label = script if script is not None else category
+        if label is not None:
+            class_columns[class_id] = column_index[label]
+
+    _MATRIX_TABLE = (
+        version,
+        np.frombuffer(stage1, dtype=np.uint16).astype(np.int64),
+        np.frombuffer(stage2, dtype=np.uint16),
+        class_columns,
+        columns,
+        len(scripts),
+    )
+    return _MATRIX_TABLE[1:]
+
+
+def detect_script_matrix(texts, include_categories=False):
+    """
+    Count characters per script for a batch of documents in one vectorized pass.
+
+    All texts are concatenated, every code point is classified with a single
+    NumPy lookup, and per-document counts are accumulated with ``np.bincount``.
+    Characters are attributed exactly as in detect_script (first matching script,
+    then punctuation > numbers > symbols > spaces when categories are included).
+
+    Requires NumPy (``pip install unscript[numpy]``).
+
+    Args:
+        texts (Iterable[str]): The documents to analyze. Non-string items are
+                               treated as empty documents.
+        include_categories (bool): Whether to add columns for the shared categories
+                                   (punctuation, numbers, symbols, spaces).
+                                   Defaults to False.
+
+    Returns:
+        tuple: ``(counts, columns)`` where ``counts`` is an ``(n_docs, n_columns)``
+               int64 array of character counts and ``columns`` is the list of
+               script codes (and category names) labelling the columns.
+
+    Example:
+        >>> counts, columns = detect_script_matrix(["Hello", "مرحبا 123"])
+        >>> int(counts[0, columns.index("Latn")])
+        5
+        >>> int(counts[1, columns.index("Arab")])
+        5
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "detect_script_matrix requires NumPy. Install it with `pip install unscript[numpy]`."
+        ) from e
+
+    stage1, stage2, class_columns, columns, n_scripts = _get_matrix_table(np)
+    if not include_categories:
+        columns = columns[:n_scripts]
+    n_columns = len(columns)
+
+    docs = [text if isinstance(text, str) else "" for text in texts]
+    n_docs = len(docs)
+    if n_docs == 0:
+        return np.zeros((0, n_columns), dtype=np.int64), columns
+
+    lengths = np.fromiter((len(doc) for doc in docs), dtype=np.int64, count=n_docs)
+    code_points = np.frombuffer(
+        "".join(docs).encode("utf-32-le", "surrogatepass"), dtype="<u4"
+    )
+    pages = stage1[code_points >> PAGE_SHIFT] << PAGE_SHIFT
+    column_ids = class_columns[stage2[pages | (code_points & PAGE_MASK)]]
+    doc_ids = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+
+    # Drop unclassified code points (and categories when they are not requested)
+    keep = (column_ids >= 0) & (column_ids < n_columns)
+    flat_ids = doc_ids[keep] * n_columns + column_ids[keep]
+    counts = np.bincount(flat_ids, minlength=n_docs * n_columns)
+
+    return counts.reshape(n_docs, n_columns), columns
+
+
 def get_dominant_script(text, min_percentage=30.0):
     """
     Get the dominant script in the text, if any.
@@ -263,3 +378,81 @@ def is_script_mixed(text, threshold=10.0):
     )
 
     return significant_scripts > 1
+
+
+def matches_script(text, script, min_ratio=0.8):
+    """
+    Check whether at least ``min_ratio`` of the script characters of a text
+    belong to ``script``.
+
+    The ratio is the one detect_script reports (without categories), as a
+    fraction: characters of ``script`` over characters of any script. The text is
+    classified from the start in growing chunks, and scanning stops as soon as
+    the outcome is decided: when the ratio is reached even if every remaining
+    character belongs to another script, or can no longer be reached even if
+    every remaining character belongs to ``script``. Texts without script
+    characters never match.
+
+    Args:
+        text (str): The text to analyze
+        script (str | Iterable[str]): Script code, or several codes whose
+                                      characters count together
+        min_ratio (float): Required fraction, between 0 and 1. Defaults to 0.8.
+
+    Returns:
+        bool: True if the text reaches ``min_ratio``
+
+    Example:
+        >>> matches_script("مرحبا بالعالم hi", "Arab", 0.8)
+        True
+        >>> matches_script("Hello مرحبا", "Arab", 0.8)
+        False
+    """
+    if not 0 <= min_ratio <= 1:
+        raise ValueError("min_ratio must be between 0 and 1")
+    if not isinstance(text, str) or not text:
+        return False
+    targets = {script} if isinstance(script, str) else set(script)
+    labels = get_class_labels()
+    stage1, stage2 = get_class_table()
+
+    # Code point -> "\x01" (target script), "\x02" (other script) or None (no
+    # script, deleted by str.translate). Both markers have no script themselves.
+    kinds = {1: None, 2: None}
+    length = len(text)
+    matched = 0
+    in_scripts = 0
+    start = 0
+    size = _FIRST_CHUNK
+    while start < length:
+        chunk = text[start : start + size]
+        start += len(chunk)
+        marked = chunk.translate(kinds)
+        target = marked.count("\x01")
+        other = marked.count("\x02")
+        if target + other != len(marked):
+            # Characters not seen yet were left untouched: classify them
+            for char in set(marked) - {"\x01", "\x02"}:
+                cp = ord(char)
+                label = labels[
+                    stage2[(stage1[cp >> PAGE_SHIFT] << PAGE_SHIFT) | (cp & PAGE_MASK)]
+                ][0]
+                if label is None:
+                    kinds[cp] = None
+                else:
+                    kinds[cp] = "\x01" if label in targets else "\x02"
+            marked = chunk.translate(kinds)
+            target = marked.count("\x01")
+            other = len(marked) - target
+        matched += target
+        in_scripts += target + other
+        remaining = length - start
+        # Reached even if every remaining character is another script
+        if matched and matched >= min_ratio * (in_scripts + remaining):
+            return True
+        # Out of reach even if every remaining character is the target script
+        if matched + remaining < min_ratio * (in_scripts + remaining):
+            return False
+        size = min(size * 2, _MAX_CHUNK)
+    # Only left undecided when nothing matched and min_ratio is 0
+    return in_scripts > 0 and matched >= min_ratio * in_scripts
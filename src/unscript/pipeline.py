@@ -0,0 +1,440 @@
+"""
+Streaming stages for cleaning corpora in a single pass.
+
+The stages take an iterable of documents and lazily yield results, so a corpus is
+read once and never held in memory. unscript_stream cleans every document; with a
+Deduplicator it also drops cleaned outputs that were already emitted, which often
+happens when raw documents differ only by URLs, mentions or emojis.
+filter_by_script keeps the documents written mostly in a given script, and
+ScriptRouter writes each document, cleaned for its dominant script, to the sink of
+that script.
+"""
+
+import dbm
+import hashlib
+import os
+import threading
+
+from .config import ScriptConfig
+from .detect_script import get_dominant_script, matches_script
+from .unscript import clean_script, clean_text, unscript
+
+
+class Deduplicator:
+    """
+    Exact deduplication of documents by 64-bit BLAKE2b digest.
+
+    Only the digest of each document is stored (as an int in a set), not the
+    document itself. With ``spill_path``, the in-memory digests are moved to a
+    ``dbm`` database on disk each time there are ``max_in_memory`` of them, so
+    memory stays bounded however many documents are seen; the database can also be
+    reopened to dedupe across runs or shards.
+
+    With 64-bit digests, two different documents share a digest with probability
+    about ``n**2 / 2**65`` over ``n`` documents (one in ~37,000 for a billion
+    documents), in which case the second is wrongly dropped. Use a larger
+    ``digest_size`` when that matters.
+
+    Args:
+        spill_path (str | os.PathLike, optional): Path of the dbm database digests
+                                                  are spilled to. Defaults to None
+                                                  (digests stay in memory).
+        max_in_memory (int): Number of digests kept in memory before spilling
+                             (ignored without ``spill_path``). Defaults to 1,000,000.
+        digest_size (int): Digest size in bytes (1 to 64). Defaults to 8.
+
+    Example:
+        >>> from unscript import Deduplicator
+        >>> dedupe = Deduplicator()
+        >>> list(dedupe.filter(["hi there", "hello", "hi there"]))
+        ['hi there', 'hello']
+        >>> dedupe.seen, dedupe.duplicates
+        (3, 1)
+    """
+
+    def __init__(self, spill_path=None, max_in_memory=1_000_000, digest_size=8):
+        if max_in_memory < 1:
+            raise ValueError("max_in_memory must be at least 1")
+        if not 1 <= digest_size <= 64:
+            raise ValueError("digest_size must be between 1 and 64")
+        self.spill_path = spill_path
+        self.max_in_memory = max_in_memory
+        self.digest_size = digest_size
+        self._digests = set()
+        # Opened (or created) up front so digests of earlier runs are found
+        self._db = None if spill_path is None else dbm.open(str(spill_path), "c")
+        self._lock = threading.Lock()
+        self._closed = False
+        self.seen = 0
+        self.duplicates = 0
+        self.spilled = 0
+
+    @property
+    def unique(self):
+        """Number of distinct documents seen."""
+        return self.seen - self.duplicates
+
+    def _digest(self, text):
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=self.digest_size
+        ).digest()
+
+    def add(self, text):
+        """
+        Record a document.
+
+        Args:
+            text (str): The document
+
+        Returns:
+            bool: True if the document was not seen before, False for a repeat
+
+        Raises:
+            ValueError: If the Deduplicator is closed
+        """
+        digest = self._digest(text)
+        key = int.from_bytes(digest, "little")
+        with self._lock:
+            self._check_open()
+            self.seen += 1
+            if key in self._digests or (self._db is not None and digest in self._db):
+                self.duplicates += 1
+                return False
+            self._digests.add(key)
+            if self._db is not None and len(self._digests) >= self.max_in_memory:
+                self._spill()
+            return True
+
+    def __contains__(self, text):
+        digest = self._digest(text)
+        with self._lock:
+            self._check_open()
+            return int.from_bytes(digest, "little") in self._digests or (
+                self._db is not None and digest in self._db
+            )
+
+    def filter(self, texts):
+        """
+        Yield the documents of ``texts`` that were not seen before.
+
+        Args:
+            texts (Iterable[str]): Documents
+
+        Yields:
+            str: Each distinct document, at its first occurrence
+        """
+        add = self.add
+        for text in texts:
+            if add(text):
+                yield text
+
+    def _check_open(self):
+        # The spilled digests are no longer consulted once the database is closed
+        if self._closed:
+            raise ValueError("Deduplicator is closed")
+
+    def _spill(self):
+        # Called with the lock held
+        db = self._db
+        size = self.digest_size
+        for key in self._digests:
+            db[key.to_bytes(size, "little")] = b""
+        self.spilled += len(self._digests)
+        self._digests.clear()
+
+    def info(self):
+        """
+        Get the deduplication counts.
+
+        Returns:
+            dict: seen, unique, duplicates, in_memory and spilled digest counts
+        """
+        return {
+            "seen": self.seen,
+            "unique": self.unique,
+            "duplicates": self.duplicates,
+            "in_memory": len(self._digests),
+            "spilled": self.spilled,
+        }
+
+    def close(self):
+        """
+        Write the in-memory digests to the spill database (if any) and close it.
+
+        Adding or checking documents afterwards raises ValueError.
+        """
+        with self._lock:
+            self._closed = True
+            if self._db is not None:
+                self._spill()
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return (
+            f"Deduplicator(seen={self.seen}, duplicates={self.duplicates}, "
+            f"spilled={self.spilled})"
+        )
+
+
+def unscript_stream(
+    script,
+    texts,
+    config=None,
+    lowercase=True,
+    dedupe=None,
+    word_cache=None,
+    result_cache=None,
+):
+    """
+    Clean a stream of documents with unscript, optionally dropping repeats.
+
+    Args:
+        script (str): The Unicode script code (e.g., 'Latn', 'Arab', 'Hans')
+        texts (Iterable[str]): Documents to clean
+        config (ScriptConfig | dict, optional): Configuration for clean_script
+        lowercase (bool, optional): Whether to convert text to lowercase. Defaults to True.
+        dedupe (Deduplicator, optional): Drop cleaned outputs that were already
+                                         yielded; counts are kept on the Deduplicator.
+        word_cache (WordCache, optional): Clean each distinct token once
+        result_cache (ResultCache, optional): Reuse results of repeated raw documents
+
+    Yields:
+        str: The cleaned documents, in input order
+
+    Example:
+        >>> from unscript import Deduplicator, unscript_stream
+        >>> dedupe = Deduplicator()
+        >>> docs = ["Hi @ann see https://a.com", "Hi @bob see https://b.com"]
+        >>> list(unscript_stream("Latn", docs, dedupe=dedupe))
+        ['hi see']
+        >>> dedupe.duplicates
+        1
+    """
+    add = dedupe.add if dedupe is not None else None
+    for text in texts:
+        cleaned = unscript(
+            script,
+            text,
+            config,
+            lowercase,
+            word_cache=word_cache,
+            result_cache=result_cache,
+        )
+        if add is None or add(cleaned):
+            yield cleaned
+
+
+def filter_by_script(texts, script, min_ratio=0.8):
+    """
+    Keep the documents in which at least ``min_ratio`` of the script characters
+    belong to ``script``.
+
+    Each document is checked with matches_script, which stops classifying it as
+    soon as the outcome is decided, so long documents are usually decided after a
+    short prefix.
+
+    Args:
+        texts (Iterable[str]): Documents
+        script (str | Iterable[str]): Script code, or several codes whose
+                                      characters count together
+        min_ratio (float): Required fraction, between 0 and 1. Defaults to 0.8.
+
+    Returns:
+        Iterator[str]: The matching documents, in input order
+
+    Example:
+        >>> from unscript import filter_by_script
+        >>> docs = ["مرحبا بالعالم", "Hello world", "Hello مرحبا"]
+        >>> list(filter_by_script(docs, "Arab", 0.8))
+        ['مرحبا بالعالم']
+    """
+    # Validated here so that a bad ratio raises at the call, not at the first item
+    if not 0 <= min_ratio <= 1:
+        raise ValueError("min_ratio must be between 0 and 1")
+    return (text for text in texts if matches_script(text, script, min_ratio))
+
+
+class ScriptRouter:
+    """
+    Route documents to per-script sinks, cleaned for their dominant script.
+
+    Each document goes through clean_text once; the dominant script of the result
+    (get_dominant_script, so URLs and mentions do not count) picks the sink, and
+    clean_script keeps that script, so the output equals ``unscript(script, text)``.
+    Documents whose dominant script has no sink go to the ``None`` sink, cleaned by
+    clean_text only, or are dropped when there is none. Empty outputs are dropped.
+
+    A sink is a path (a UTF-8 file, opened on first write and rewritten, one
+    document per line), an object with a ``write`` method (one document per line;
+    not closed by the router) or a callable receiving lists of documents. Each
+    sink buffers up to ``buffer_size`` documents before writing them; use the
+    router as a context manager, or call close(), to flush the rest.
+
+    Args:
+        sinks (dict): Script code (or None) -> sink
+        config (ScriptConfig | dict, optional): Configuration for clean_script
+        lowercase (bool, optional): Whether to convert text to lowercase. Defaults to True.
+        min_percentage (float): Minimum share of a script to be dominant.
+                                Defaults to 30.0.
+        buffer_size (int): Documents buffered per sink. Defaults to 1,000.
+        dedupe (Deduplicator, optional): Drop outputs that were already routed
+
+    Attributes:
+        counts (dict): Sink key -> number of documents routed to it
+        unrouted (int): Documents dropped because their script has no sink
+        empty (int): Documents dropped because nothing was left after cleaning
+
+    Example:
+        >>> from unscript import ScriptRouter
+        >>> with ScriptRouter({"Latn": "latn.txt", "Arab": "arab.txt"}) as router:
+        ...     router.route_all(docs)
+        >>> router.counts
+        {'Latn': 8120, 'Arab': 1650}
+    """
+
+    def __init__(
+        self,
+        sinks,
+        config=None,
+        lowercase=True,
+        min_percentage=30.0,
+        buffer_size=1000,
+        dedupe=None,
+    ):
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        for key, sink in sinks.items():
+            if not (
+                isinstance(sink, (str, os.PathLike))
+                or hasattr(sink, "write")
+                or callable(sink)
+            ):
+                raise TypeError(
+                    f"Sink for {key!r} must be a path, a writable object or a callable"
+                )
+        self.sinks = dict(sinks)
+        # Converted (and validated) once rather than for every routed document
+        self.config = ScriptConfig.coerce(config)
+        self.lowercase = lowercase
+        self.min_percentage = min_percentage
+        self.buffer_size = buffer_size
+        self.dedupe = dedupe
+        self._buffers = {key: [] for key in self.sinks}
+        self._files = {}
+        self._closed = False
+        self.counts = {key: 0 for key in self.sinks}
+        self.unrouted = 0
+        self.empty = 0
+
+    def route(self, text):
+        """
+        Clean one document and buffer it for the sink of its dominant script.
+
+        Args:
+            text (str): The document
+
+        Returns:
+            bool: True if the document was routed, False if it was dropped (no
+                  sink, empty output or duplicate)
+
+        Raises:
+            ValueError: If the router is closed
+        """
+        self._check_open()
+        cleaned = clean_text(text, lowercase=self.lowercase)
+        script = get_dominant_script(cleaned, self.min_percentage)
+        if script is not None and script in self.sinks:
+            cleaned = clean_script(script, cleaned, self.config)
+        elif None in self.sinks:
+            script = None
+        else:
+            self.unrouted += 1
+            return False
+        if not cleaned:
+            self.empty += 1
+            return False
+        if self.dedupe is not None and not self.dedupe.add(cleaned):
+            return False
+        buffer = self._buffers[script]
+        buffer.append(cleaned)
+        self.counts[script] += 1
+        if len(buffer) >= self.buffer_size:
+            self._flush(script)
+        return True
+
+    def route_all(self, texts):
+        """
+        Route every document of ``texts``.
+
+        Args:
+            texts (Iterable[str]): Documents
+
+        Returns:
+            dict: The routing counts (``counts``)
+        """
+        route = self.route
+        for text in texts:
+            route(text)
+        return self.counts
+
+    def _check_open(self):
+        # Path sinks are reopened for writing, so routing after close would
+        # truncate the shards already written
+        if self._closed:
+            raise ValueError("ScriptRouter is closed")
+
+    def _flush(self, key):
+        buffer = self._buffers[key]
+        if not buffer:
+            return
+        sink = self.sinks[key]
+        if isinstance(sink, (str, os.PathLike)):
+            if key not in self._files:
+                self._files[key] = open(sink, "w", encoding="utf-8")
+            sink = self._files[key]
+        if hasattr(sink, "write"):
+            sink.write("\n".join(buffer) + "\n")
+        else:
+            sink(list(buffer))
+        buffer.clear()
+
+    def flush(self):
+        """
+        Write the buffered documents of every sink.
+
+        Raises:
+            ValueError: If the router is closed
+        """
+        self._check_open()
+        for key in self.sinks:
+            self._flush(key)
+
+    def close(self):
+        """
+        Flush every sink and close the files opened by the router.
+
+        Routing or flushing afterwards raises ValueError.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"ScriptRouter(counts={self.counts}, unrouted={self.unrouted})"
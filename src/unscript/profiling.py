@@ -0,0 +1,141 @@
+"""
+Opt-in per-stage profiling of the cleaning pipeline.
+
+Inside a ``with profile() as report:`` block, clean_text, remove_emoji,
+clean_script (and therefore unscript), split_by_script and clean_script_variants
+record the wall time and call count of each of their stages into ``report``.
+Outside of it, the pipeline only checks that no profiler is active once per stage:
+no timer is read.
+"""
+
+from contextlib import contextmanager
+from time import perf_counter
+
+# Report collecting stage timings, or None when profiling is disabled
+ACTIVE = None
+
+
+class StageTiming:
+    """Call count and cumulative wall time of one pipeline stage."""
+
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self, calls=0, seconds=0.0):
+        self.calls = calls
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"StageTiming(calls={self.calls}, seconds={self.seconds:.6f})"
+
+
+class ProfileReport:
+    """
+    Per-stage timings collected by profile().
+
+    Stages are named ``"<function>.<stage>"`` (e.g. ``"clean_text.urls"``).
+    Stages of nested calls are included in the stage that made the call, e.g.
+    ``"clean_text.emoji"`` includes every ``"remove_emoji.*"`` stage.
+
+    Attributes:
+        stages (dict): Stage name -> StageTiming, in first-recorded order
+    """
+
+    def __init__(self):
+        self.stages = {}
+
+    def lap(self, stage, start):
+        """
+        Record a stage that started at ``start`` and ends now.
+
+        Args:
+            stage (str): Stage name
+            start (float): perf_counter() value when the stage started
+
+        Returns:
+            float: The current perf_counter() value, i.e. the start of the next stage
+        """
+        now = perf_counter()
+        timing = self.stages.get(stage)
+        if timing is None:
+            timing = self.stages[stage] = StageTiming()
+        timing.calls += 1
+        timing.seconds += now - start
+        return now
+
+    def total(self, function):
+        """
+        Get the total time spent in the stages of one function.
+
+        Args:
+            function (str): Function name (e.g. "clean_script")
+
+        Returns:
+            float: Seconds
+        """
+        prefix = function + "."
+        return sum(
+            timing.seconds
+            for stage, timing in self.stages.items()
+            if stage.startswith(prefix)
+        )
+
+    def as_dict(self):
+        """
+        Get the timings as plain data (e.g. for JSON).
+
+        Returns:
+            dict: Stage name -> {"calls": int, "seconds": float}
+        """
+        return {
+            stage: {"calls": timing.calls, "seconds": timing.seconds}
+            for stage, timing in self.stages.items()
+        }
+
+    def format(self):
+        """
+        Format the timings as a table, slowest stage first.
+
+        Returns:
+            str: One line per stage with calls, total milliseconds and
+                 microseconds per call
+        """
+        lines = [f"{'stage':<28} {'calls':>8} {'total ms':>10} {'us/call':>9}"]
+        for stage, timing in sorted(
+            self.stages.items(), key=lambda item: -item[1].seconds
+        ):
+            lines.append(
+                f"{stage:<28} {timing.calls:>8} {timing.seconds * 1e3:>10.2f} "
+                f"{timing.seconds * 1e6 / timing.calls:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<ProfileReport: {len(self.stages)} stages>"
+
+
+@contextmanager
+def profile():
+    """
+    Record per-stage timings of the cleaning functions called inside the block.
+
+    Profiling is process-wide: calls from other threads made while the block is
+    active are recorded too. Nested blocks each get their own report.
+
+    Yields:
+        ProfileReport: The report being filled
+
+    Example:
+        >>> from unscript import profile, unscript
+        >>> with profile() as report:
+        ...     _ = unscript("Latn", "Hello @user! https://example.com 😊")
+        >>> report.stages["clean_text.urls"].calls
+        1
+    """
+    global ACTIVE
+    previous = ACTIVE
+    report = ProfileReport()
+    ACTIVE = report
+    try:
+        yield report
+    finally:
+        ACTIVE = previous
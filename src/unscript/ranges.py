@@ -5,7 +5,29 @@ This module provides easy access to Unicode script ranges and character categori
 as well as utility functions for checking if characters belong to specific ranges.
 """
 
-from .script_ranges import SCRIPT_CORE_RANGES, SHARED_RANGES
+import re
+import sys
+from array import array
+
+from .script_ranges import (
+    SCRIPT_CORE_RANGES,
+    SHARED_RANGES,
+    CATEGORIES_PRIORITY,
+    PAGE_SHIFT,
+    PAGE_MASK,
+    intervals_to_pages,
+    merge_ranges,
+    get_char_class,
+    get_class_labels,
+    register_script,
+    register_category,
+)
+
+# Label id used by scripts_of for characters with neither a script nor a category
+UNLABELED = 0xFFFF
+
+# Native-order UTF-16 codec, so encoded label ids can be loaded into array("H")
+_UTF16_NATIVE = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
 
 
 class RangeAccessor:
@@ -115,6 +137,295 @@ def in_range(character, *ranges):
     return False
 
 
+class RangeMatcher:
+    """
+    A compiled set of Unicode ranges for fast membership tests over many characters.
+
+    Create one with ``ranges.compile(...)``. Single characters are checked with an
+    O(1) two-stage lookup table, and whole strings are processed by a precompiled
+    regular expression character class, so ``mask``, ``count`` and ``filter`` run
+    at C speed instead of one Python call per character.
+
+    Example:
+        >>> from unscript import ranges
+        >>> latin_or_digit = ranges.compile(ranges.Latn, "numbers")
+        >>> "a" in latin_or_digit
+        True
+        >>> latin_or_digit.filter("Hello مرحبا 123")
+        'Hello123'
+        >>> latin_or_digit.count("Hello مرحبا 123")
+        8
+        >>> latin_or_digit.mask("a!1")
+        b'\\x01\\x00\\x01'
+    """
+
+    def __init__(self, ranges):
+        # Merge overlapping and adjacent ranges
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self.ranges = merged
+
+        # Two-stage lookup over alternating out/in intervals
+        starts, values = [0], [0]
+        for start, end in merged:
+            if start == starts[-1]:
+                values[-1] = 1
+            else:
+                starts.append(start)
+                values.append(1)
+            if end < 0x10FFFF:
+                starts.append(end + 1)
+                values.append(0)
+        self._stage1, self._stage2 = intervals_to_pages(starts, values)
+
+        char_class = "".join(
+            f"\\U{start:08X}-\\U{end:08X}" if start != end else f"\\U{start:08X}"
+            for start, end in merged
+        )
+        if merged:
+            self._inside = re.compile(f"[{char_class}]")
+            self._outside = re.compile(f"[^{char_class}]")
+        else:
+            self._inside = None
+            self._outside = re.compile(r"[\s\S]")
+
+        # A character guaranteed to be outside the ranges, used to build masks. It
+        # must differ from "\x01", which marks the characters inside the ranges.
+        candidate = 0
+        for start, end in merged:
+            if candidate == 1:
+                candidate = 2
+            if candidate < start:
+                break
+            candidate = max(candidate, end + 1)
+        else:
+            if candidate == 1:
+                candidate = 2
+        self._sentinel = chr(candidate) if candidate <= 0x10FFFF else None
+        if self._sentinel is not None:
+            self._not_sentinel = re.compile(f"[^{re.escape(self._sentinel)}]")
+
+    def __contains__(self, character):
+        if isinstance(character, str):
+            if len(character) != 1:
+                return False
+            code_point = ord(character)
+        elif isinstance(character, int) and 0 <= character <= 0x10FFFF:
+            code_point = character
+        else:
+            return False
+        page = self._stage1[code_point >> PAGE_SHIFT] << PAGE_SHIFT
+        return bool(self._stage2[page | (code_point & PAGE_MASK)])
+
+    def mask(self, text):
+        """
+        Flag every character of text.
+
+        Args:
+            text (str): The text to scan
+
+        Returns:
+            bytes: One byte per character, 1 if it is in the ranges and 0 otherwise
+        """
+        if self._sentinel is None:
+            return b"\x01" * len(text)
+        marked = self._outside.sub(self._sentinel, text)
+        marked = self._not_sentinel.sub("\x01", marked)
+        return marked.replace(self._sentinel, "\x00").encode("latin-1")
+
+    def count(self, text):
+        """
+        Count the characters of text that are in the ranges.
+
+        Args:
+            text (str): The text to scan
+
+        Returns:
+            int: Number of matching characters
+        """
+        if self._inside is None:
+            return 0
+        return sum(1 for _ in self._inside.finditer(text))
+
+    def filter(self, text, replacement=""):
+        """
+        Keep only the characters of text that are in the ranges.
+
+        Args:
+            text (str): The text to filter
+            replacement (str): String substituted for every character outside the
+                               ranges. Defaults to "" (drop them).
+
+        Returns:
+            str: The filtered text
+        """
+        return self._outside.sub(replacement, text)
+
+    def __repr__(self):
+        return f"<RangeMatcher: {len(self.ranges)} ranges>"
+
+
+def compile(*range_lists_or_names):
+    """
+    Compile one or more ranges into a RangeMatcher for bulk character checks.
+
+    Use this instead of calling in_range in a per-character loop: the arguments are
+    validated and merged once, and the returned matcher answers membership queries
+    with a precomputed lookup table.
+
+    Args:
+        *range_lists_or_names: Range lists (e.g. ranges.Arab, ranges.numbers) and/or
+                               script or category names (e.g. "Arab", "numbers").
+
+    Returns:
+        RangeMatcher: Matcher for the union of all given ranges
+
+    Raises:
+        ValueError: If no ranges are provided, a name is unknown, or an argument is
+                    not a list of (start, end) tuples
+
+    Example:
+        >>> from unscript import ranges
+        >>> arabic = ranges.compile("Arab", ranges.numbers)
+        >>> "ا" in arabic
+        True
+        >>> arabic.filter("مرحبا Hello 123")
+        'مرحبا123'
+    """
+    if not range_lists_or_names:
+        raise ValueError("At least one range must be provided")
+
+    combined = []
+    for item in range_lists_or_names:
+        if isinstance(item, str):
+            if item in SCRIPT_CORE_RANGES:
+                item = SCRIPT_CORE_RANGES[item]
+            elif item in SHARED_RANGES:
+                item = SHARED_RANGES[item]
+            else:
+                available = sorted(
+                    list(SCRIPT_CORE_RANGES.keys()) + list(SHARED_RANGES.keys())
+                )
+                raise ValueError(
+                    f"Unknown range '{item}'. Available: {', '.join(available)}"
+                )
+        combined.extend(merge_ranges(item))
+
+    return RangeMatcher(combined)
+
+
+def _validate_character(character):
+    if not isinstance(character, str) or len(character) != 1:
+        raise ValueError("character must be a single character string")
+
+
+def script_of(character):
+    """
+    Get the script a character belongs to.
+
+    Scripts with overlapping ranges resolve to the first match in
+    SCRIPT_CORE_RANGES order, exactly as detect_script counts them.
+
+    Args:
+        character (str): A single character
+
+    Returns:
+        str or None: Script code, or None if the character is in no script
+
+    Raises:
+        ValueError: If character is not a single character
+
+    Example:
+        >>> from unscript import ranges
+        >>> ranges.script_of("ا")
+        'Arab'
+        >>> ranges.script_of("5") is None
+        True
+    """
+    _validate_character(character)
+    return get_class_labels()[get_char_class(ord(character))][0]
+
+
+def category_of(character):
+    """
+    Get the category detect_script attributes a character to.
+
+    Only characters outside every script get a category; when several categories
+    match, the priority is punctuation > numbers > symbols > spaces.
+
+    Args:
+        character (str): A single character
+
+    Returns:
+        str or None: Category name, or None for script characters and characters
+                     in no category
+
+    Raises:
+        ValueError: If character is not a single character
+
+    Example:
+        >>> from unscript import ranges
+        >>> ranges.category_of("5")
+        'numbers'
+        >>> ranges.category_of("a") is None
+        True
+    """
+    _validate_character(character)
+    return get_class_labels()[get_char_class(ord(character))][1]
+
+
+def list_labels():
+    """
+    Get the label names used by scripts_of, in label id order.
+
+    Returns:
+        list: Script codes in SCRIPT_CORE_RANGES order followed by the categories
+              in detection priority order
+
+    Example:
+        >>> from unscript import ranges
+        >>> labels = ranges.list_labels()
+        >>> labels[-4:]
+        ['punctuation', 'numbers', 'symbols', 'spaces']
+    """
+    return list(SCRIPT_CORE_RANGES.keys()) + CATEGORIES_PRIORITY
+
+
+def scripts_of(text):
+    """
+    Label every character of a text in one vectorized pass.
+
+    Each distinct character is classified once; the text is then mapped to label
+    ids with str.translate. Label ids index into list_labels(), and characters
+    with no script or category get UNLABELED.
+
+    Args:
+        text (str): Input text
+
+    Returns:
+        array.array: Label id of each character (typecode "H")
+
+    Example:
+        >>> from unscript import ranges
+        >>> labels = ranges.list_labels()
+        >>> [labels[i] for i in ranges.scripts_of("a1 ")]
+        ['Latn', 'numbers', 'spaces']
+    """
+    label_ids = {name: i for i, name in enumerate(list_labels())}
+    class_labels = get_class_labels()
+    mapping = {}
+    for char in set(text):
+        script, category = class_labels[get_char_class(ord(char))]
+        label = script if script is not None else category
+        mapping[ord(char)] = chr(label_ids[label] if label is not None else UNLABELED)
+    return array("H", text.translate(mapping).encode(_UTF16_NATIVE))
+
+
 def list_scripts():
     """
     Get a list of all available script names.
@@ -210,6 +521,15 @@ def __dir__():
             "scripts",
             "categories",
             "in_range",
+            "compile",
+            "RangeMatcher",
+            "script_of",
+            "category_of",
+            "scripts_of",
+            "list_labels",
+            "UNLABELED",
+            "register_script",
+            "register_category",
             "list_scripts",
             "list_categories",
             "get_range_info",
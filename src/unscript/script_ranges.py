@@ -3,8 +3,17 @@ Unicode script ranges for character detection and filtering.
 
 This module contains the core character ranges for each supported Unicode script
 and shared character ranges for optional inclusion (spaces, numbers, punctuation, symbols).
+It also builds a class table mapping every code point to the bitmask of scripts and
+categories it belongs to, which detection and cleaning use for single-lookup checks.
 """
 
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
 # Define character ranges for each script (core ranges only)
 SCRIPT_CORE_RANGES = {
     "Latn": [
@@ -263,6 +272,13 @@ PUNCTUATION_ALL = (
     ]
 )
 
+# Punctuation levels accepted by clean_script's "punctuation" option
+PUNCTUATION_LEVELS = {
+    "ascii": PUNCTUATION_ASCII,
+    "extended": PUNCTUATION_EXTENDED,
+    "all": PUNCTUATION_ALL,
+}
+
 # Shared ranges that can be optionally included
 SHARED_RANGES = {
     "spaces": [
@@ -427,39 +443,657 @@ SHARED_RANGES = {
 }
 
 
+# Categories with built-in clean_script semantics (exclusion rules, detection
+# priority); categories added with register_category are include-only
+BUILTIN_CATEGORIES = ("spaces", "numbers", "punctuation", "symbols")
+
+# Explicitly listed symbol ranges, before the uncovered code points are added
+_EXPLICIT_SYMBOLS = list(SHARED_RANGES["symbols"])
+
+
 def initialize_shared_ranges():
     """
     Initialize SHARED_RANGES by adding uncovered Unicode points to symbols.
-    This function should be called once when the module is first imported.
+    This function is called when the module is first imported, and again
+    whenever a script or category is registered.
     """
-    # Add uncovered ranges to symbols
-    covered_points = set()
-    for ranges in SCRIPT_CORE_RANGES.values():
-        for start, end in ranges:
-            covered_points.update(range(start, end + 1))
-    for ranges in SHARED_RANGES.values():
-        for start, end in ranges:
-            covered_points.update(range(start, end + 1))
+    symbols = SHARED_RANGES["symbols"]
+    symbols[:] = _EXPLICIT_SYMBOLS
+
+    # Merge all covered ranges and collect the gaps between them
+    covered = sorted(
+        (start, end)
+        for range_dict in (
+            SCRIPT_CORE_RANGES,
+            {category: SHARED_RANGES[category] for category in BUILTIN_CATEGORIES},
+        )
+        for ranges in range_dict.values()
+        for start, end in ranges
+    )
 
     uncovered = []
-    start = None
-    for point in range(0x0000, 0x110000):
-        if point not in covered_points:
-            if start is None:
-                start = point
-        elif start is not None:
-            uncovered.append((start, point - 1))
-            start = None
-    if start is not None:
-        uncovered.append((start, 0x10FFFF))
+    next_point = 0x0000
+    for start, end in covered:
+        if start > next_point:
+            uncovered.append((next_point, start - 1))
+        next_point = max(next_point, end + 1)
+    if next_point <= 0x10FFFF:
+        uncovered.append((next_point, 0x10FFFF))
 
-    SHARED_RANGES["symbols"].extend(uncovered)
+    symbols.extend(uncovered)
 
 
 # Initialize the shared ranges when module is imported
 initialize_shared_ranges()
 
 
+# Bit assigned to each script, category and punctuation level in the class table.
+# Scripts get bits in SCRIPT_CORE_RANGES order, so the lowest set bit of a script
+# mask is the script that first-match iteration over SCRIPT_CORE_RANGES would pick.
+SCRIPT_BITS = {}
+CATEGORY_BITS = {}
+PUNCTUATION_LEVEL_BITS = {}
+
+# Per-class script and category masks (indexed by class id)
+CLASS_SCRIPT_MASKS = []
+CLASS_CATEGORY_MASKS = []
+
+# Category attribution order for characters outside every script
+CATEGORIES_PRIORITY = ["punctuation", "numbers", "symbols", "spaces"]
+
+# Per-class (script, category) labels, as reported by detection
+CLASS_LABELS = []
+
+# Two-stage lookup: the class of code point cp is
+#   _STAGE2[(_STAGE1[cp >> PAGE_SHIFT] << PAGE_SHIFT) | (cp & PAGE_MASK)]
+# _STAGE1 maps each 256-code-point block to a page, and identical pages (most
+# of the astral planes and the synthetic "symbols" gaps) are stored once in _STAGE2.
+PAGE_SHIFT = 8
+PAGE_SIZE = 1 << PAGE_SHIFT
+PAGE_MASK = PAGE_SIZE - 1
+BLOCK_COUNT = 0x110000 >> PAGE_SHIFT
+_STAGE1 = None
+_STAGE2 = None
+_SCRIPT_BY_BIT_INDEX = []
+
+# Guards the one-time construction of the class table (see ensure_class_table)
+_TABLE_LOCK = threading.Lock()
+
+# Precomputed binary class table shipped with the package.
+# Regenerate it with `python scripts/build_tables.py` after editing any range above.
+CLASS_TABLE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "class_table.bin"
+)
+_TABLE_MAGIC = b"UNSCTBL\x00"
+_TABLE_FORMAT_VERSION = 2
+# magic, format version, page count, class count, fingerprint
+_TABLE_HEADER = struct.Struct("<8sIII32s")
+
+# Keeps the mapped table file alive while lookups hold views into it
+_TABLE_MMAP = None
+
+# Bumped whenever register_script/register_category changes the ranges; caches
+# of data derived from the class table (keep tables, compiled plans) key on it
+_TABLE_VERSION = 0
+
+# clean_script config keys that cannot double as category names
+_RESERVED_NAMES = {"max_foreign_words", "foreign_scripts"}
+
+
+def table_fingerprint():
+    """
+    Compute a digest of every range list that feeds the class table.
+
+    The digest is stored in the binary table file so that a stale file (ranges
+    edited without regenerating it) is detected and ignored.
+
+    Returns:
+        bytes: SHA-256 digest of the script, category and punctuation level ranges
+    """
+    import hashlib
+
+    source = repr(
+        (
+            _TABLE_FORMAT_VERSION,
+            list(SCRIPT_CORE_RANGES.items()),
+            list(SHARED_RANGES.items()),
+            list(PUNCTUATION_LEVELS.items()),
+        )
+    )
+    return hashlib.sha256(source.encode("utf-8")).digest()
+
+
+def _assign_bits():
+    """Assign a bit to every script, category and punctuation level."""
+    SCRIPT_BITS.clear()
+    CATEGORY_BITS.clear()
+    PUNCTUATION_LEVEL_BITS.clear()
+    for index, script in enumerate(SCRIPT_CORE_RANGES):
+        SCRIPT_BITS[script] = 1 << index
+    for index, category in enumerate(SHARED_RANGES):
+        CATEGORY_BITS[category] = 1 << index
+    for index, level in enumerate(PUNCTUATION_LEVELS, start=len(SHARED_RANGES)):
+        PUNCTUATION_LEVEL_BITS[level] = 1 << index
+    _SCRIPT_BY_BIT_INDEX[:] = list(SCRIPT_CORE_RANGES)
+
+
+def compute_class_table():
+    """
+    Compute the code point -> class table from SCRIPT_CORE_RANGES, SHARED_RANGES
+    and PUNCTUATION_LEVELS.
+
+    Each class is a distinct combination of a script mask (every script the code
+    point belongs to) and a category mask (every shared category and punctuation
+    level it belongs to). Overlapping scripts such as Hans/Hant/Jpan or Latn/Viet
+    simply share a class whose mask has several bits set.
+
+    Returns:
+        tuple: ``(stage1, stage2, script_masks, category_masks)`` where stage1
+               and stage2 form the two-stage code point -> class id lookup.
+    """
+    _assign_bits()
+
+    # Sweep over range boundaries: +bit where a range starts, -bit after it ends
+    events = []
+    for script, ranges in SCRIPT_CORE_RANGES.items():
+        for start, end in ranges:
+            events.append((start, 0, SCRIPT_BITS[script], 1))
+            events.append((end + 1, 0, SCRIPT_BITS[script], -1))
+    category_ranges = [(CATEGORY_BITS[c], r) for c, r in SHARED_RANGES.items()]
+    category_ranges += [
+        (PUNCTUATION_LEVEL_BITS[l], r) for l, r in PUNCTUATION_LEVELS.items()
+    ]
+    for bit, ranges in category_ranges:
+        for start, end in ranges:
+            events.append((start, 1, bit, 1))
+            events.append((end + 1, 1, bit, -1))
+    events.sort()
+
+    palette = {}
+    starts = []
+    class_ids = []
+    counts = [{}, {}]
+    masks = [0, 0]
+
+    def emit(position):
+        key = (masks[0], masks[1])
+        class_id = palette.setdefault(key, len(palette))
+        if class_ids and class_ids[-1] == class_id:
+            return
+        starts.append(position)
+        class_ids.append(class_id)
+
+    position = 0
+    emit(0)
+    for point, kind, bit, delta in events:
+        if point != position:
+            emit(position)
+            position = point
+        count = counts[kind].get(bit, 0) + delta
+        counts[kind][bit] = count
+        if count:
+            masks[kind] |= bit
+        else:
+            masks[kind] &= ~bit
+    emit(position)
+
+    script_masks = [0] * len(palette)
+    category_masks = [0] * len(palette)
+    for (script_mask, category_mask), class_id in palette.items():
+        script_masks[class_id] = script_mask
+        category_masks[class_id] = category_mask
+
+    stage1, stage2 = intervals_to_pages(starts, class_ids)
+    return stage1, stage2, script_masks, category_masks
+
+
+def intervals_to_pages(starts, class_ids):
+    """
+    Split an interval table (sorted starts covering 0..0x10FFFF) into a block
+    index and a list of deduplicated 256-entry pages.
+
+    Args:
+        starts (list): Sorted interval starts; the first must be 0
+        class_ids (list): Value (< 65536) of each interval
+
+    Returns:
+        tuple: ``(stage1, stage2)`` as ``array('H')`` objects
+    """
+    ends = starts[1:] + [0x110000]
+    pages = {}
+    stage1 = array("H")
+    stage2 = array("H")
+    i = 0
+    for block in range(BLOCK_COUNT):
+        low = block << PAGE_SHIFT
+        high = low + PAGE_SIZE
+        while ends[i] <= low:
+            i += 1
+        if ends[i] >= high:
+            # Block inside a single interval: a uniform page
+            page = None
+            key = class_ids[i]
+        else:
+            page = array("H")
+            j = i
+            while j < len(starts) and starts[j] < high:
+                page.extend([class_ids[j]] * (min(ends[j], high) - max(starts[j], low)))
+                j += 1
+            key = page.tobytes()
+        page_index = pages.get(key)
+        if page_index is None:
+            page_index = pages[key] = len(pages)
+            if page is None:
+                page = array("H", [key]) * PAGE_SIZE
+            stage2.extend(page)
+        stage1.append(page_index)
+    return stage1, stage2
+
+
+def serialize_class_table(table, fingerprint):
+    """
+    Encode a class table into the binary layout of CLASS_TABLE_FILE.
+
+    Layout (little-endian): header, uint16 stage1 block index, uint16 stage2
+    pages, uint64 class script masks, uint64 class category masks.
+
+    Args:
+        table (tuple): Table as returned by compute_class_table
+        fingerprint (bytes): Digest from table_fingerprint
+
+    Returns:
+        bytes: The encoded table
+    """
+    stage1, stage2, script_masks, category_masks = table
+    if max(script_masks + category_masks).bit_length() > 64:
+        raise ValueError("Class masks do not fit the 64-bit binary table format")
+
+    header = _TABLE_HEADER.pack(
+        _TABLE_MAGIC,
+        _TABLE_FORMAT_VERSION,
+        len(stage2) // PAGE_SIZE,
+        len(script_masks),
+        fingerprint,
+    )
+    return b"".join(
+        [
+            header,
+            struct.pack(f"<{len(stage1)}H", *stage1),
+            struct.pack(f"<{len(stage2)}H", *stage2),
+            struct.pack(f"<{len(script_masks)}Q", *script_masks),
+            struct.pack(f"<{len(category_masks)}Q", *category_masks),
+        ]
+    )
+
+
+def _load_class_table_file(path, fingerprint):
+    """
+    Map the binary class table file into memory.
+
+    The stage1/stage2 arrays are returned as read-only views into the mapping,
+    so every process using the package shares the same physical pages through
+    the OS page cache.
+
+    Returns:
+        tuple or None: ``(mapping, table)`` or None when the file is missing,
+                       stale, or cannot be mapped on this platform.
+    """
+    if sys.byteorder != "little":
+        return None
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapping) < _TABLE_HEADER.size:
+        mapping.close()
+        return None
+    magic, version, n_pages, n_classes, file_fingerprint = _TABLE_HEADER.unpack_from(
+        mapping, 0
+    )
+    stage1_size = 2 * BLOCK_COUNT
+    stage2_size = 2 * PAGE_SIZE * n_pages
+    expected_size = _TABLE_HEADER.size + stage1_size + stage2_size + 16 * n_classes
+    if (
+        magic != _TABLE_MAGIC
+        or version != _TABLE_FORMAT_VERSION
+        or file_fingerprint != fingerprint
+        or len(mapping) != expected_size
+    ):
+        mapping.close()
+        return None
+
+    view = memoryview(mapping)
+    offset = _TABLE_HEADER.size
+    stage1 = view[offset : offset + stage1_size].cast("H")
+    offset += stage1_size
+    stage2 = view[offset : offset + stage2_size].cast("H")
+    offset += stage2_size
+    masks = view[offset : offset + 16 * n_classes].cast("Q")
+    # The class palette is tiny; keep it as plain lists of ints
+    table = (stage1, stage2, masks[:n_classes].tolist(), masks[n_classes:].tolist())
+    return mapping, table
+
+
+def _resolve_labels(script_mask, category_mask):
+    """
+    Resolve class masks to ``(script, category)`` labels.
+
+    The script is the first matching script in SCRIPT_CORE_RANGES order. Only
+    characters outside every script get a category, the first matching one in
+    CATEGORIES_PRIORITY order (punctuation > numbers > symbols > spaces).
+    """
+    script = first_script(script_mask)
+    if script is not None:
+        return script, None
+    for category in CATEGORIES_PRIORITY:
+        if category_mask & CATEGORY_BITS[category]:
+            return None, category
+    return None, None
+
+
+def build_class_table(use_file=True):
+    """
+    Install the code point -> class table used by detection and cleaning.
+
+    The precomputed CLASS_TABLE_FILE is memory-mapped when it matches the current
+    ranges; otherwise the table is computed in memory.
+
+    Args:
+        use_file (bool): Whether to try the shipped binary table first. Defaults to True.
+    """
+    global _STAGE1, _STAGE2, _TABLE_MMAP
+
+    loaded = None
+    if use_file:
+        loaded = _load_class_table_file(CLASS_TABLE_FILE, table_fingerprint())
+    if loaded is not None:
+        _assign_bits()
+        mapping, table = loaded
+    else:
+        mapping, table = None, compute_class_table()
+
+    stage1, stage2, script_masks, category_masks = table
+    CLASS_SCRIPT_MASKS[:] = script_masks
+    CLASS_CATEGORY_MASKS[:] = category_masks
+    CLASS_LABELS[:] = [
+        _resolve_labels(script_mask, category_mask)
+        for script_mask, category_mask in zip(script_masks, category_masks)
+    ]
+    _TABLE_MMAP = mapping
+    _STAGE2 = stage2
+    # Published last: a non-None _STAGE1 means the whole table is ready
+    _STAGE1 = stage1
+
+
+def ensure_class_table():
+    """
+    Build (or map) the class table on first use.
+
+    The table is derived state, so it is only constructed when detection or
+    cleaning first needs it. Safe to call from several threads at once; the
+    table is built exactly once.
+    """
+    if _STAGE1 is None:
+        with _TABLE_LOCK:
+            if _STAGE1 is None:
+                build_class_table()
+
+
+# Bits depend only on the order of the range dicts and are cheap to assign
+_assign_bits()
+
+
+def get_table_version():
+    """
+    Get the version of the script and category ranges.
+
+    The version starts at 0 and is incremented by every register_script and
+    register_category call. Caches of anything derived from the class table
+    should include it in their keys.
+
+    Returns:
+        int: Current table version
+    """
+    return _TABLE_VERSION
+
+
+def merge_ranges(ranges):
+    """
+    Validate a list of code point ranges and merge overlapping or adjacent ones.
+
+    Args:
+        ranges (list): (start, end) tuples of code points, ends inclusive
+
+    Returns:
+        list: Sorted, non-overlapping (start, end) tuples
+
+    Raises:
+        ValueError: If ranges is not a list of valid (start, end) tuples
+    """
+    if not isinstance(ranges, (list, tuple)):
+        raise ValueError("ranges must be a list of (start, end) tuples")
+    merged = []
+    for item in sorted(ranges):
+        if (
+            not isinstance(item, tuple)
+            or len(item) != 2
+            or not all(isinstance(point, int) for point in item)
+        ):
+            raise ValueError("ranges must be a list of (start, end) tuples")
+        start, end = item
+        if not 0 <= start <= end <= 0x10FFFF:
+            raise ValueError(f"Invalid range ({start:#x}, {end:#x})")
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _register(target, other, kind, name, ranges):
+    """Add ranges to a script or category and rebuild the derived tables."""
+    global _TABLE_VERSION
+
+    if not isinstance(name, str) or not name.isidentifier():
+        raise ValueError(f"{kind} name must be an identifier string, got {name!r}")
+    if name in other or name in _RESERVED_NAMES:
+        raise ValueError(f"'{name}' is already used and cannot name a {kind}")
+    merged = merge_ranges(ranges)
+    if not merged:
+        raise ValueError("At least one range must be provided")
+
+    with _TABLE_LOCK:
+        if name == "symbols" and target is SHARED_RANGES:
+            _EXPLICIT_SYMBOLS.extend(merged)
+        else:
+            target.setdefault(name, []).extend(merged)
+            if name == "punctuation" and target is SHARED_RANGES:
+                # Extra punctuation is kept at the broadest punctuation level
+                PUNCTUATION_LEVELS["all"].extend(merged)
+        initialize_shared_ranges()
+        _TABLE_VERSION += 1
+        if _STAGE1 is None:
+            # Table not built yet: it will be computed on first use
+            _assign_bits()
+        else:
+            build_class_table(use_file=False)
+        return _TABLE_VERSION
+
+
+def register_script(code, ranges):
+    """
+    Register a custom script, or add ranges to an existing one.
+
+    The ranges are validated and merged, then the class table is rebuilt, so the
+    script gets the same single-lookup fast path as the built-in ones in
+    detection, cleaning and ranges. New scripts come last in SCRIPT_CORE_RANGES
+    order, i.e. they lose to built-in scripts where ranges overlap. Code points
+    of a new script stop counting as (uncovered) symbols.
+
+    Registration is meant for start-up configuration: it must not run while
+    other threads detect or clean text.
+
+    Args:
+        code (str): Script code (e.g., 'Xtrl'); must not be a category name
+        ranges (list): (start, end) tuples of code points, ends inclusive
+
+    Returns:
+        int: The new table version (see get_table_version)
+
+    Raises:
+        ValueError: If the code or the ranges are invalid
+
+    Example:
+        >>> from unscript import register_script, clean_script
+        >>> version = register_script("Xtrl", [(0xE000, 0xE0FF)])
+        >>> clean_script("Xtrl", "\ue000\ue001 abc")
+        '\ue000\ue001'
+    """
+    return _register(SCRIPT_CORE_RANGES, SHARED_RANGES, "script", code, ranges)
+
+
+def register_category(name, ranges):
+    """
+    Register a custom category, or add ranges to an existing one.
+
+    Custom categories are include-only: clean_script keeps their characters when
+    the category is enabled in the config (``{name: True}``), regardless of the
+    punctuation/numbers/symbols exclusions. Adding ranges to a built-in category
+    extends it (extra punctuation joins the "all" punctuation level). The class
+    table is rebuilt and the table version bumped, as for register_script.
+
+    Args:
+        name (str): Category name; must not be a script code or a config key
+        ranges (list): (start, end) tuples of code points, ends inclusive
+
+    Returns:
+        int: The new table version (see get_table_version)
+
+    Raises:
+        ValueError: If the name or the ranges are invalid
+
+    Example:
+        >>> from unscript import register_category, clean_script
+        >>> version = register_category("currency", [(0x0024, 0x0024), (0x20AC, 0x20AC)])
+        >>> clean_script("Latn", "Price: $5", {"currency": True})
+        'Price $'
+    """
+    return _register(SHARED_RANGES, SCRIPT_CORE_RANGES, "category", name, ranges)
+
+
+def get_char_class(char_code):
+    """
+    Get the class id of a code point in the precomputed class table.
+
+    Args:
+        char_code (int): Unicode code point of the character
+
+    Returns:
+        int: Index into CLASS_SCRIPT_MASKS and CLASS_CATEGORY_MASKS
+    """
+    if _STAGE1 is None:
+        ensure_class_table()
+    page = _STAGE1[char_code >> PAGE_SHIFT] << PAGE_SHIFT
+    return _STAGE2[page | (char_code & PAGE_MASK)]
+
+
+def get_class_table():
+    """
+    Get the two-stage code point -> class id lookup arrays.
+
+    The class of code point ``cp`` is
+    ``stage2[(stage1[cp >> PAGE_SHIFT] << PAGE_SHIFT) | (cp & PAGE_MASK)]``.
+    Both arrays expose the buffer protocol (uint16), so they can be wrapped by
+    NumPy without copying.
+
+    Returns:
+        tuple: ``(stage1, stage2)``
+    """
+    ensure_class_table()
+    return _STAGE1, _STAGE2
+
+
+def get_class_masks():
+    """
+    Get the per-class script and category masks.
+
+    Returns:
+        tuple: ``(CLASS_SCRIPT_MASKS, CLASS_CATEGORY_MASKS)``, indexed by class id
+    """
+    ensure_class_table()
+    return CLASS_SCRIPT_MASKS, CLASS_CATEGORY_MASKS
+
+
+def get_class_labels():
+    """
+    Get the ``(script, category)`` label of every class.
+
+    Returns:
+        list: CLASS_LABELS, indexed by class id
+    """
+    ensure_class_table()
+    return CLASS_LABELS
+
+
+def get_script_mask(char_code):
+    """
+    Get the bitmask of every script a code point belongs to.
+
+    Args:
+        char_code (int): Unicode code point of the character
+
+    Returns:
+        int: OR of SCRIPT_BITS for all matching scripts (0 if none)
+    """
+    return CLASS_SCRIPT_MASKS[get_char_class(char_code)]
+
+
+def get_category_mask(char_code):
+    """
+    Get the bitmask of the shared categories and punctuation levels of a code point.
+
+    Args:
+        char_code (int): Unicode code point of the character
+
+    Returns:
+        int: OR of CATEGORY_BITS and PUNCTUATION_LEVEL_BITS for all matches (0 if none)
+    """
+    return CLASS_CATEGORY_MASKS[get_char_class(char_code)]
+
+
+def scripts_to_mask(scripts):
+    """
+    Combine script codes into a single bitmask, ignoring unknown codes.
+
+    Args:
+        scripts (Iterable[str]): Script codes (e.g., ['Latn', 'Arab'])
+
+    Returns:
+        int: OR of the SCRIPT_BITS of the known scripts
+    """
+    mask = 0
+    for script in scripts:
+        mask |= SCRIPT_BITS.get(script, 0)
+    return mask
+
+
+def first_script(script_mask):
+    """
+    Resolve a script mask to a single script using SCRIPT_CORE_RANGES order.
+
+    Args:
+        script_mask (int): A mask as returned by get_script_mask
+
+    Returns:
+        str or None: The first matching script code, or None for an empty mask
+    """
+    if not script_mask:
+        return None
+    return _SCRIPT_BY_BIT_INDEX[(script_mask & -script_mask).bit_length() - 1]
+
+
 def is_char_in_script(char_code, script):
     """
     Check if a character code point belongs to a specific script.
@@ -471,13 +1105,10 @@ def is_char_in_script(char_code, script):
     Returns:
         bool: True if character belongs to the script, False otherwise
     """
-    if script not in SCRIPT_CORE_RANGES:
+    bit = SCRIPT_BITS.get(script)
+    if bit is None:
         return False
-
-    for start, end in SCRIPT_CORE_RANGES[script]:
-        if start <= char_code <= end:
-            return True
-    return False
+    return bool(get_script_mask(char_code) & bit)
 
 
 def is_char_in_category(char_code, category):
@@ -491,13 +1122,10 @@ def is_char_in_category(char_code, category):
     Returns:
         bool: True if character belongs to the category, False otherwise
     """
-    if category not in SHARED_RANGES:
+    bit = CATEGORY_BITS.get(category)
+    if bit is None:
         return False
-
-    for start, end in SHARED_RANGES[category]:
-        if start <= char_code <= end:
-            return True
-    return False
+    return bool(get_category_mask(char_code) & bit)
 
 
 def get_supported_scripts():
@@ -0,0 +1,105 @@
+"""
+Removal statistics gathered while cleaning.
+
+clean_text, clean_script and unscript return a CleaningStats object alongside the
+cleaned text when called with ``return_stats=True``. The counts are collected
+during the normal cleaning pass, and stats of several documents add up.
+"""
+
+# CleaningStats counters, in constructor order
+_FIELDS = (
+    "documents",
+    "input_chars",
+    "output_chars",
+    "mentions",
+    "hashtags",
+    "urls",
+    "emojis",
+    "foreign",
+    "punctuation",
+    "numbers",
+    "symbols",
+    "spaces",
+)
+
+
+class CleaningStats:
+    """
+    What cleaning removed from one document, or from a batch of documents.
+
+    Occurrence counts (removed by clean_text):
+        mentions: @mentions, @@mentions and +mentions
+        hashtags: #hashtags
+        urls: URLs, email addresses and bare domain names
+
+    Character counts:
+        emojis: Emoji characters (removed by clean_text)
+        foreign: Characters of scripts other than the selected ones
+        punctuation, numbers, symbols, spaces: Characters of these categories
+            dropped by the clean_script config, including those of the selected
+            scripts (attributed by priority: punctuation > numbers > symbols >
+            spaces)
+
+    Totals:
+        documents: Number of documents the stats cover
+        input_chars, output_chars: Length of the text before and after cleaning
+
+    Stats support ``+``, ``+=`` and ``sum()``.
+
+    Example:
+        >>> from unscript import clean_script
+        >>> text, stats = clean_script("Latn", "Hello مرحبا 123!", return_stats=True)
+        >>> stats.foreign, stats.numbers, stats.punctuation
+        (5, 3, 1)
+    """
+
+    __slots__ = _FIELDS
+
+    def __init__(self, **counts):
+        for name in _FIELDS:
+            setattr(self, name, counts.pop(name, 0))
+        if counts:
+            raise TypeError(f"Unknown CleaningStats fields: {', '.join(counts)}")
+
+    @property
+    def removed_chars(self):
+        """Number of characters removed overall (input minus output length)."""
+        return self.input_chars - self.output_chars
+
+    def as_dict(self):
+        """
+        Get the counts as plain data.
+
+        Returns:
+            dict: Field name -> count
+        """
+        return {name: getattr(self, name) for name in _FIELDS}
+
+    def __iadd__(self, other):
+        if not isinstance(other, CleaningStats):
+            return NotImplemented
+        for name in _FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    def __add__(self, other):
+        if not isinstance(other, CleaningStats):
+            return NotImplemented
+        total = CleaningStats(**self.as_dict())
+        total += other
+        return total
+
+    def __radd__(self, other):
+        # Lets sum() start from its default of 0
+        if other == 0:
+            return CleaningStats(**self.as_dict())
+        return NotImplemented
+
+    def __eq__(self, other):
+        if not isinstance(other, CleaningStats):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        counts = ", ".join(f"{name}={getattr(self, name)}" for name in _FIELDS)
+        return f"CleaningStats({counts})"
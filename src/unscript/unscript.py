@@ -1,15 +1,28 @@
-import time
 import unicodedata
 import re
+from array import array
+from functools import lru_cache
+from time import perf_counter
 
-# Import script ranges from the shared module
+# Import the shared class table from the script ranges module
 from unscript.script_ranges import (
-    SCRIPT_CORE_RANGES,
-    SHARED_RANGES,
-    PUNCTUATION_ASCII,
-    PUNCTUATION_EXTENDED,
-    PUNCTUATION_ALL,
+    SCRIPT_BITS,
+    CATEGORY_BITS,
+    PUNCTUATION_LEVEL_BITS,
+    BUILTIN_CATEGORIES,
+    PAGE_SHIFT,
+    PAGE_MASK,
+    get_table_version,
+    get_class_table,
+    get_class_masks,
+    get_class_labels,
+    get_script_mask,
+    scripts_to_mask,
+    first_script,
 )
+from unscript.config import ScriptConfig
+from unscript import profiling
+from unscript.stats import CleaningStats
 
 DEFAULT_CONFIG = {
     "spaces": True,
@@ -20,20 +33,519 @@ DEFAULT_CONFIG = {
     "foreign_scripts": None,
 }
 
-def clean_script(script, text, config=None):
+# Decimal numbers (including various decimal separators) kept whole by clean_script
+_DECIMAL_PATTERN = re.compile(r"\b\d+[.,]\d+(?:[.,]\d+)*\b")
+
+# Whitespace-delimited tokens containing "@"; anchoring at token starts keeps the
+# email address check linear on long runs without whitespace
+_AT_TOKEN_PATTERN = re.compile(r"(?<!\S)\S*@\S*")
+
+
+def _remove_email(match):
+    """Drop a token if it matches ``\\S+@\\S+\\.\\S+`` (an email address)."""
+    token = match.group(0)
+    at = token.find("@", 1)
+    dot = token.rfind(".", 0, len(token) - 1)
+    return "" if at != -1 and dot >= at + 2 else token
+
+
+def _subn(pattern, repl, text, offsets):
+    """
+    re.subn that keeps the offset map of ``text`` in step with the substitution.
+
+    ``offsets`` is an ``array('I')`` holding the original position of every
+    character of ``text``, or None (plain re.subn). Replacements are never longer
+    than their match, so each replacement character takes the position of the
+    match character it stands in for (a collapsed run maps to its first
+    character) and the map is compacted in place.
+    """
+    if offsets is None:
+        return re.subn(pattern, repl, text)
+
+    pieces = []
+    count = 0
+    last = 0
+    write = 0
+    for match in re.finditer(pattern, text):
+        start, end = match.span()
+        if callable(repl):
+            replacement = repl(match)
+        elif "\\" in repl:
+            replacement = match.expand(repl)
+        else:
+            replacement = repl
+        kept = start - last + len(replacement)
+        offsets[write : write + kept] = offsets[last : start + len(replacement)]
+        write += kept
+        pieces.append(text[last:start])
+        pieces.append(replacement)
+        last = end
+        count += 1
+    if not count:
+        return text, 0
+    pieces.append(text[last:])
+    offsets[write:] = offsets[last:]
+    return "".join(pieces), count
+
+
+def _strip(text, offsets):
+    """str.strip, dropping the offsets of the stripped characters."""
+    stripped = text.strip()
+    if offsets is not None and len(stripped) != len(text):
+        lead = len(text) - len(text.lstrip())
+        del offsets[lead + len(stripped) :]
+        del offsets[:lead]
+    return stripped
+
+
+def _normalize_nfd(text, offsets):
+    """NFD-normalize text; decomposed characters map to the original character."""
+    normalized = unicodedata.normalize("NFD", text)
+    if offsets is None or normalized == text:
+        return normalized
+
+    positions = array("I")
+    pieces = []
+    for char, position in zip(text, offsets):
+        decomposed = unicodedata.normalize("NFD", char)
+        pieces.append(decomposed)
+        positions.extend([position] * len(decomposed))
+    decomposed = "".join(pieces)
+    if decomposed != normalized:
+        # Canonical ordering sorted combining marks across characters: apply the
+        # same stable sort by combining class to each run of non-starters
+        combining = unicodedata.combining
+        i = 0
+        while i < len(decomposed):
+            if not combining(decomposed[i]):
+                i += 1
+                continue
+            run_end = i
+            while run_end < len(decomposed) and combining(decomposed[run_end]):
+                run_end += 1
+            order = sorted(range(i, run_end), key=lambda k: combining(decomposed[k]))
+            positions[i:run_end] = array("I", [positions[k] for k in order])
+            i = run_end
+    offsets[:] = positions
+    return normalized
+
+
+def _lower(text, offsets):
+    """Lowercase text; characters lowercasing to several map to the original one."""
+    lowered = text.lower()
+    if offsets is not None and len(lowered) != len(text):
+        positions = array("I")
+        for char, position in zip(text, offsets):
+            positions.extend([position] * len(char.lower()))
+        offsets[:] = positions
+    return lowered
+
+
+def _clean_chunk(chunk, keep_by_class, numbers):
+    """
+    Filter one token or whitespace run like the clean_script character loop.
+
+    Used by the WordCache engine, which never has foreign token spans.
+    """
+    stage1, stage2 = get_class_table()
+    spans = []
+    if numbers:
+        spans = [m.span() for m in _DECIMAL_PATTERN.finditer(chunk)]
+    spans.append((len(chunk), len(chunk)))
+    result = []
+    i = 0
+    for decimal_start, decimal_end in spans:
+        for char in chunk[i:decimal_start]:
+            code_point = ord(char)
+            page = stage1[code_point >> PAGE_SHIFT] << PAGE_SHIFT
+            if keep_by_class[stage2[page | (code_point & PAGE_MASK)]]:
+                result.append(char)
+            elif not char.isspace():
+                result.append(" ")
+        # Decimal numbers are kept as a whole
+        result.append(chunk[decimal_start:decimal_end])
+        i = decimal_end
+    return "".join(result)
+
+
+def _token_dominant_script(token):
+    """The script most characters of the token belong to (first one on ties), or None."""
+    counts = {}
+    for ch in token:
+        sc = first_script(get_script_mask(ord(ch)))
+        if sc is not None:
+            counts[sc] = counts.get(sc, 0) + 1
+    if not counts:
+        return None
+    return max(counts.items(), key=lambda x: x[1])[0]
+
+
+def _script_key(script):
+    """A hashable form of a script selection, for result cache keys."""
+    try:
+        return tuple(script)
+    except TypeError:
+        return str(script)
+
+
+def _initial_offsets(text):
+    """The identity offset map of the input text."""
+    return array("I", range(len(text))) if isinstance(text, str) else array("I")
+
+
+def _with_extras(cleaned, stats, offsets):
+    """Build the ``(text, [stats], [offsets])`` result of the public functions."""
+    result = (cleaned,)
+    if stats is not None:
+        stats.output_chars = len(cleaned or "")
+        result += (stats,)
+    if offsets is not None:
+        result += (offsets,)
+    return result
+
+
+@lru_cache(maxsize=256)
+def _keep_table(version, script_mask, include_mask, level_mask, numbers, symbols):
+    """
+    Decide, for every class of the shared class table, whether clean_script keeps it.
+
+    A class is included if it belongs to one of the selected scripts or enabled
+    categories. Included characters are still excluded when they fall into a
+    disabled category, checked by priority: punctuation > numbers > symbols.
+    Punctuation is only kept when it belongs to the active punctuation level.
+    Characters of an enabled custom (registered) category are always kept.
+
+    ``version`` is the table version the masks refer to; it only keys the cache,
+    so tables built before a register_script/register_category call are not reused.
+
+    Returns:
+        bytes: One flag per class id (1 = keep, 0 = drop)
+    """
+    punct_bit = CATEGORY_BITS["punctuation"]
+    numbers_bit = CATEGORY_BITS["numbers"]
+    symbols_bit = CATEGORY_BITS["symbols"]
+    custom_mask = include_mask & ~level_mask
+    for category in BUILTIN_CATEGORIES:
+        custom_mask &= ~CATEGORY_BITS[category]
+
+    script_masks, category_masks = get_class_masks()
+    keep = bytearray(len(script_masks))
+    for class_id, (s_mask, c_mask) in enumerate(zip(script_masks, category_masks)):
+        if not (s_mask & script_mask or c_mask & include_mask):
+            continue
+        if c_mask & custom_mask:
+            keep[class_id] = 1
+            continue
+        if c_mask & punct_bit:
+            if not c_mask & level_mask:
+                continue
+        elif c_mask & numbers_bit:
+            if not numbers:
+                continue
+        elif c_mask & symbols_bit:
+            if not symbols:
+                continue
+        keep[class_id] = 1
+    return bytes(keep)
+
+
+@lru_cache(maxsize=256)
+def _config_masks(config, version):
+    """
+    Resolve a ScriptConfig into ``(include_mask, level_mask)`` over the class table.
+
+    The include mask holds the bits of every enabled category (spaces, the active
+    punctuation level, numbers, symbols and custom categories); the level mask is
+    the bit of the active punctuation level (0 when punctuation is disabled).
+    """
+    include_mask = 0
+    if config.spaces:
+        include_mask |= CATEGORY_BITS["spaces"]
+    level_mask = PUNCTUATION_LEVEL_BITS.get(config.punctuation.value, 0)
+    include_mask |= level_mask
+    if config.numbers:
+        include_mask |= CATEGORY_BITS["numbers"]
+    if config.symbols:
+        include_mask |= CATEGORY_BITS["symbols"]
+    for category in config.categories:
+        include_mask |= CATEGORY_BITS.get(category, 0)
+    return include_mask, level_mask
+
+
+def _removal_stats(removed_by_class, stats, script_mask):
+    """
+    Attribute per-class removed character counts to CleaningStats fields.
+
+    Characters are counted by why they were removed: characters of a selected
+    script (``script_mask``) were dropped by their disabled category (punctuation >
+    numbers > symbols), other script characters are foreign, and characters
+    outside every script count under their category label.
+    """
+    script_masks, category_masks = get_class_masks()
+    labels = get_class_labels()
+    for class_id, count in enumerate(removed_by_class):
+        if not count:
+            continue
+        s_mask = script_masks[class_id]
+        field = None
+        if s_mask & script_mask:
+            c_mask = category_masks[class_id]
+            for category in ("punctuation", "numbers", "symbols"):
+                if c_mask & CATEGORY_BITS[category]:
+                    field = category
+                    break
+        if field is None:
+            script, category = labels[class_id]
+            field = "foreign" if script is not None else category
+        if field is not None:
+            setattr(stats, field, getattr(stats, field) + count)
+
+
+def clean_script(
+    script, text, config=None, return_stats=False, offsets=False, word_cache=None
+):
     """
     Remove any characters that don't belong to the specified script.
 
     Args:
         script (str | list | tuple | set): One or more script codes (e.g., 'Latn', 'Arab')
         text (str): The text to clean
-        config (dict): Configuration overriding DEFAULT_CONFIG
+        config (ScriptConfig | dict): Configuration; dicts override DEFAULT_CONFIG
+        return_stats (bool): Also return what was removed. Defaults to False.
+        offsets (bool): Also return the position in ``text`` of every output
+                        character. Defaults to False.
+        word_cache (WordCache, optional): Clean each distinct token once and reuse
+                                          it (ignored with max_foreign_words,
+                                          return_stats or offsets).
+
+    Raises:
+        ValueError: If a config dict has an unknown key
+
+    Returns:
+        str: Text with only characters from the specified script, or
+        tuple: ``(text, CleaningStats)`` when return_stats is True,
+               ``(text, array('I'))`` when offsets is True, or
+               ``(text, CleaningStats, array('I'))`` when both are True
+
+    Example:
+        >>> text, offsets = clean_script("Latn", "Hi, مرحبا you!", offsets=True)
+        >>> text, list(offsets)
+        ('Hi you', [0, 1, 2, 10, 11, 12])
+    """
+    if not (return_stats or offsets):
+        return _clean_script(script, text, config, None, None, word_cache=word_cache)
+    stats = None
+    if return_stats:
+        stats = CleaningStats(documents=1, input_chars=len(text or ""))
+    offset_map = _initial_offsets(text) if offsets else None
+    cleaned = _clean_script(
+        script, text, config, stats, offset_map, word_cache=word_cache
+    )
+    return _with_extras(cleaned, stats, offset_map)
+
+
+def clean_script_tokens(script, text, config=None, with_scripts=False, word_cache=None):
+    """
+    Clean text like clean_script and return its tokens.
+
+    Equivalent to ``clean_script(script, text, config).split()``, but the tokens are
+    split from the filtered characters directly, without building the collapsed
+    string first.
+
+    Args:
+        script (str | list | tuple | set): One or more script codes (e.g., 'Latn', 'Arab')
+        text (str): The text to clean
+        config (ScriptConfig | dict): Configuration; dicts override DEFAULT_CONFIG
+        with_scripts (bool): Return ``(token, script)`` pairs, where script is the
+                             dominant script of the token (None if it has no
+                             script characters). Defaults to False.
+        word_cache (WordCache, optional): Clean each distinct token once and reuse it
+
+    Raises:
+        ValueError: If a config dict has an unknown key
+
+    Returns:
+        list: Tokens (str), or ``(token, script)`` tuples when with_scripts is True
+
+    Example:
+        >>> clean_script_tokens(["Latn", "Arab"], "Hello مرحبا 123!", with_scripts=True)
+        [('Hello', 'Latn'), ('مرحبا', 'Arab')]
+    """
+    tokens = _clean_script(
+        script, text, config, None, None, tokens=True, word_cache=word_cache
+    )
+    if with_scripts:
+        return [(token, _token_dominant_script(token)) for token in tokens]
+    return tokens
+
+
+def split_by_script(text, scripts, config=None):
+    """
+    Clean text for several scripts at once.
+
+    Returns the same texts as calling ``clean_script(script, text, config)`` for
+    each script, but every distinct character is classified only once: each
+    script's output is then produced with a single ``str.translate`` over the
+    text, built from the shared classification and the script's keep table.
+    Configs with ``max_foreign_words`` plan foreign tokens per script and are
+    cleaned with clean_script for each script instead.
+
+    Args:
+        text (str): The text to clean
+        scripts (str | Iterable[str]): Script codes (e.g., ['Latn', 'Arab'])
+        config (ScriptConfig | dict): Configuration shared by every script;
+                                      dicts override DEFAULT_CONFIG
+
+    Raises:
+        ValueError: If a config dict has an unknown key
+
+    Returns:
+        dict: Script code -> cleaned text, in the order of ``scripts``
+
+    Example:
+        >>> split_by_script("Hello مرحبا 12.5!", ["Latn", "Arab"], {"numbers": True})
+        {'Latn': 'Hello 12.5', 'Arab': 'مرحبا 12.5'}
+    """
+    scripts = [scripts] if isinstance(scripts, str) else list(scripts)
+    config = ScriptConfig.coerce(config)
+    outputs = _clean_many(
+        text, [(script, config) for script in scripts], "split_by_script"
+    )
+    return dict(zip(scripts, outputs))
+
+
+def clean_script_variants(script, text, configs):
+    """
+    Clean text for one script with several configs at once.
+
+    Returns the same texts as calling ``clean_script(script, text, config)`` for
+    each config, e.g. to publish dataset variants with and without numbers, but
+    every distinct character is classified only once and each variant is produced
+    with a single ``str.translate`` over the text (see split_by_script). Configs
+    with ``max_foreign_words`` are cleaned with clean_script instead.
+
+    Args:
+        script (str | list | tuple | set): One or more script codes (e.g., 'Latn', 'Arab')
+        text (str): The text to clean
+        configs (dict | Iterable): Variant name -> config (ScriptConfig, dict or
+                                   None), or a sequence of configs
+
+    Raises:
+        ValueError: If a config dict has an unknown key
+
+    Returns:
+        dict: Variant name -> cleaned text when ``configs`` is a dict, or
+        list: The cleaned texts in the order of ``configs``
+
+    Example:
+        >>> clean_script_variants("Latn", "Hi, 2 you!", {
+        ...     "plain": None,
+        ...     "numbers": {"numbers": True},
+        ...     "punctuation": {"numbers": True, "punctuation": "ascii"},
+        ... })
+        {'plain': 'Hi you', 'numbers': 'Hi 2 you', 'punctuation': 'Hi, 2 you!'}
+    """
+    if isinstance(configs, dict):
+        names = list(configs)
+        configs = configs.values()
+    else:
+        names = None
+    plans = [(script, ScriptConfig.coerce(config)) for config in configs]
+    outputs = _clean_many(text, plans, "clean_script_variants")
+    return outputs if names is None else dict(zip(names, outputs))
+
+
+def _clean_many(text, plans, name):
+    """
+    clean_script for every ``(script, ScriptConfig)`` plan, classifying once.
+
+    Each distinct character is looked up in the class table once; every plan's
+    keep table then becomes a ``str.translate`` table over those characters.
+    ``name`` prefixes the profiling stages.
 
     Returns:
-        str: Text with only characters from the specified script
+        list: The cleaned text of each plan, in order
+    """
+    if not isinstance(text, str) or not text:
+        return [
+            _clean_script(script, text, config, None, None) for script, config in plans
+        ]
+
+    report = profiling.ACTIVE
+    if report is not None:
+        start = perf_counter()
+
+    # Classify every distinct character once: code point -> (class id, is space)
+    stage1, stage2 = get_class_table()
+    classes = {}
+    for char in set(text):
+        code_point = ord(char)
+        page = stage1[code_point >> PAGE_SHIFT] << PAGE_SHIFT
+        classes[code_point] = (stage2[page | (code_point & PAGE_MASK)], char.isspace())
+    # Decimal numbers are kept as a whole by every plan with numbers enabled
+    decimal_spans = None
+    if any(config.numbers for _, config in plans):
+        decimal_spans = [m.span() for m in _DECIMAL_PATTERN.finditer(text)]
+    if report is not None:
+        start = report.lap(f"{name}.classify", start)
+
+    version = get_table_version()
+    outputs = []
+    for script, config in plans:
+        if config.max_foreign_words:
+            # Foreign token budgets are planned per script by clean_script
+            outputs.append(_clean_script(script, text, config, None, None))
+            continue
+        scripts = [script] if isinstance(script, str) else list(script)
+        scripts = [s for s in scripts if s in SCRIPT_BITS]
+        if not scripts:
+            # Like clean_script, unknown scripts leave the text unchanged
+            outputs.append(text)
+            continue
+        include_mask, level_mask = _config_masks(config, version)
+        keep_by_class = _keep_table(
+            version,
+            scripts_to_mask(scripts),
+            include_mask,
+            level_mask,
+            config.numbers,
+            config.symbols,
+        )
+        # Dropped whitespace is deleted, other dropped characters become spaces
+        table = {
+            code_point: None if is_space else " "
+            for code_point, (class_id, is_space) in classes.items()
+            if not keep_by_class[class_id]
+        }
+        if config.numbers and decimal_spans:
+            pieces = []
+            i = 0
+            for decimal_start, decimal_end in decimal_spans:
+                pieces.append(text[i:decimal_start].translate(table))
+                pieces.append(text[decimal_start:decimal_end])
+                i = decimal_end
+            pieces.append(text[i:].translate(table))
+            filtered = "".join(pieces)
+        else:
+            filtered = text.translate(table)
+        cleaned, _ = _subn(r"\s+", " ", filtered, None)
+        outputs.append(_strip(cleaned, None))
+    if report is not None:
+        report.lap(f"{name}.filter", start)
+    return outputs
+
+
+def _clean_script(script, text, config, stats, offsets, tokens=False, word_cache=None):
+    """
+    clean_script, counting removed characters into stats unless it is None.
+
+    ``offsets`` (or None) maps every character of ``text`` to its original
+    position; it is updated in place to map the returned text. With ``tokens``,
+    the whitespace-separated tokens of the result are returned instead of the text.
+    A ``word_cache`` (WordCache) is used when cleaning per token is equivalent.
     """
     if not text:
-        return text
+        return [] if tokens else text
 
     # Normalize scripts argument to a list of valid script codes
     if isinstance(script, str):
@@ -44,219 +556,179 @@ def clean_script(script, text, config=None):
         except TypeError:
             primary_scripts = [str(script)]
 
-    primary_scripts = [s for s in primary_scripts if s in SCRIPT_CORE_RANGES]
+    primary_scripts = [s for s in primary_scripts if s in SCRIPT_BITS]
     if not primary_scripts:
-        return text
-
-    # Merge configs
-    current_config = DEFAULT_CONFIG.copy()
-    if config:
-        current_config.update(config)
-
-    # If numbers are enabled, protect decimal numbers first
-    if current_config.get("numbers", False):
-        # Pattern to match decimal numbers (including various decimal separators)
-        # This matches patterns like: 123.45, 123,45, 1.234.567, 1,234,567, etc.
-        decimal_pattern = r"\b\d+[.,]\d+(?:[.,]\d+)*\b"
-        decimal_numbers = re.findall(decimal_pattern, text)
-
-        # Replace decimal numbers with placeholders
-        placeholders = {}
-        protected_text = text
-        for i, number in enumerate(decimal_numbers):
-            placeholder = f"__DECIMAL_{i}__"
-            placeholders[placeholder] = number
-            protected_text = protected_text.replace(number, placeholder, 1)
+        return text.split() if tokens else text
+
+    report = profiling.ACTIVE
+    if report is not None:
+        start = perf_counter()
+
+    config = ScriptConfig.coerce(config)
+    use_word_cache = word_cache is not None
+    if use_word_cache and (
+        config.max_foreign_words or stats is not None or offsets is not None
+    ):
+        # Foreign word budgets, stats and offsets need the whole-document pass
+        word_cache.bypassed += 1
+        use_word_cache = False
+
+    # If numbers are enabled, protect decimal numbers first: their spans are
+    # copied verbatim (separators included) by the character loop below
+    if config.numbers and not use_word_cache:
+        # Matches patterns like: 123.45, 123,45, 1.234.567, 1,234,567, etc.
+        decimal_spans = [m.span() for m in _DECIMAL_PATTERN.finditer(text)]
     else:
-        protected_text = text
-        placeholders = {}
-
-    # Build ranges to use (non-cached)
-    ranges_to_use = []
-    for s in primary_scripts:
-        ranges_to_use.extend(SCRIPT_CORE_RANGES[s])
-    # Add spaces based on config
-    if current_config.get("spaces", True):
-        ranges_to_use.extend(SHARED_RANGES["spaces"])
-
-    # Handle punctuation levels (boolean or string)
-    punct_cfg = current_config.get("punctuation", False)
-    active_punct_ranges = []
-    if isinstance(punct_cfg, str):
-        level = punct_cfg.lower()
-        if level == "ascii":
-            active_punct_ranges = list(PUNCTUATION_ASCII)
-        elif level == "extended":
-            active_punct_ranges = list(PUNCTUATION_EXTENDED)
-        elif level == "all":
-            active_punct_ranges = list(PUNCTUATION_ALL)
-        # Unknown string -> keep active empty (no punctuation)
-    elif punct_cfg:
-        # Backward-compatible mapping: True -> ASCII level
-        active_punct_ranges = list(PUNCTUATION_ASCII)
-
-    # Include active punctuation ranges in the allowed set
-    if active_punct_ranges:
-        ranges_to_use.extend(active_punct_ranges)
-
-    # Add other shared ranges based on config (exclude punctuation handled above and spaces handled already)
-    for category, include in current_config.items():
-        if category in ("spaces", "punctuation"):
-            continue
-        if include and category in SHARED_RANGES:
-            ranges_to_use.extend(SHARED_RANGES[category])
+        decimal_spans = []
+    if report is not None:
+        start = report.lap("clean_script.decimals", start)
+
+    # Resolve the configuration into masks over the shared class table
+    version = get_table_version()
+    script_mask = scripts_to_mask(primary_scripts)
+    include_mask, level_mask = _config_masks(config, version)
+    keep_by_class = _keep_table(
+        version, script_mask, include_mask, level_mask, config.numbers, config.symbols
+    )
 
-    # Precompute up to N other-script token spans on protected_text
-    allow_n = int(current_config.get("max_foreign_words", 0) or 0)
-    allowed_whitelist = current_config.get("foreign_scripts", None)
-    if isinstance(allowed_whitelist, str):
-        allowed_whitelist = [allowed_whitelist]
-    if allowed_whitelist is not None:
-        allowed_whitelist = [s for s in allowed_whitelist if s in SCRIPT_CORE_RANGES]
+    # Precompute up to N other-script token spans
+    allow_n = config.max_foreign_words
+    whitelist_mask = None
+    if config.foreign_scripts is not None:
+        whitelist_mask = scripts_to_mask(config.foreign_scripts)
 
     other_token_spans = []
     if allow_n > 0:
-        def token_dominant_script(tok: str):
-            counts = {}
-            for ch in tok:
-                cp = ord(ch)
-                for sc in SCRIPT_CORE_RANGES:
-                    for a, b in SCRIPT_CORE_RANGES[sc]:
-                        if a <= cp <= b:
-                            counts[sc] = counts.get(sc, 0) + 1
-                            break
-                    else:
-                        continue
-                    break
-            if not counts:
-                return None
-            return max(counts.items(), key=lambda x: x[1])[0]
-
         taken = 0
-        for m in re.finditer(r"\S+", protected_text):
+        for m in re.finditer(r"\S+", text):
             if taken >= allow_n:
                 break
             tok = m.group(0)
-            dom = token_dominant_script(tok)
+            dom = _token_dominant_script(tok)
             if dom is None:
                 continue
-            if dom in primary_scripts:
+            dom_bit = SCRIPT_BITS[dom]
+            if dom_bit & script_mask:
                 continue
-            if allowed_whitelist is not None and dom not in allowed_whitelist:
+            if whitelist_mask is not None and not dom_bit & whitelist_mask:
                 continue
-            other_token_spans.append((m.start(), m.end(), dom))
+            # Inside the token, letters from its dominant script are allowed as well
+            span_keep = _keep_table(
+                version,
+                script_mask | dom_bit,
+                include_mask,
+                level_mask,
+                config.numbers,
+                config.symbols,
+            )
+            other_token_spans.append((m.start(), m.end(), span_keep))
             taken += 1
+    if report is not None:
+        start = report.lap("clean_script.plan", start)
 
-    # Process each character: keep included characters, replace excluded punctuation with spaces
-    result = []
-    i = 0
-    span_idx = 0
-    current_span = other_token_spans[span_idx] if other_token_spans else None
-    while i < len(protected_text):
-        # Check if we're at a placeholder
-        if protected_text[i:].startswith("__DECIMAL_"):
-            # Find the end of the placeholder
-            end_pos = protected_text.find("__", i + 2) + 2
-            placeholder = protected_text[i:end_pos]
-            if placeholder in placeholders:
-                result.append(placeholders[placeholder])
-                i = end_pos
+    if use_word_cache:
+        # Token-level engine: each distinct token is cleaned once per configuration
+        plan = (
+            version,
+            script_mask,
+            include_mask,
+            level_mask,
+            config.numbers,
+            config.symbols,
+        )
+        numbers = config.numbers
+        result = [
+            word_cache.clean(
+                plan, text, lambda chunk: _clean_chunk(chunk, keep_by_class, numbers)
+            )
+        ]
+        dropped = None
+    else:
+        # Process each character: keep included characters, replace excluded punctuation with spaces
+        stage1, stage2 = get_class_table()
+        removed = None if stats is None else [0] * len(keep_by_class)
+        # Every input character yields one output character except dropped whitespace,
+        # so the offset map only needs the positions of those
+        dropped = None if offsets is None else []
+        result = []
+        i = 0
+        span_idx = 0
+        current_span = other_token_spans[span_idx] if other_token_spans else None
+        decimal_idx = 0
+        next_decimal = decimal_spans[0] if decimal_spans else None
+        while i < len(text):
+            # Decimal numbers are kept as a whole
+            if next_decimal is not None and i == next_decimal[0]:
+                result.append(text[i : next_decimal[1]])
+                i = next_decimal[1]
+                decimal_idx += 1
+                next_decimal = (
+                    decimal_spans[decimal_idx]
+                    if decimal_idx < len(decimal_spans)
+                    else None
+                )
                 continue
 
-        char = protected_text[i]
-        code_point = ord(char)
-        in_included_range = False
+            char = text[i]
 
-        # Advance current span pointer if needed
-        if current_span is not None and i >= current_span[1]:
-            span_idx += 1
-            current_span = other_token_spans[span_idx] if span_idx < len(other_token_spans) else None
+            # Advance current span pointer if needed
+            if current_span is not None and i >= current_span[1]:
+                span_idx += 1
+                current_span = other_token_spans[span_idx] if span_idx < len(other_token_spans) else None
 
-        # Check if character is in included ranges
-        for start, end in ranges_to_use:
-            if start <= code_point <= end:
-                in_included_range = True
-                break
+            # A single class lookup decides inclusion and category exclusions
+            # (priority: punctuation > numbers > symbols, see _keep_table)
+            code_point = ord(char)
+            page = stage1[code_point >> PAGE_SHIFT] << PAGE_SHIFT
+            class_id = stage2[page | (code_point & PAGE_MASK)]
+            if current_span is not None and current_span[0] <= i < current_span[1]:
+                keep = current_span[2][class_id]
+            else:
+                keep = keep_by_class[class_id]
 
-        # If not included, but inside an allowed other-script token, allow letters from that token's dominant script
-        if not in_included_range and current_span is not None and current_span[0] <= i < current_span[1]:
-            dom_script = current_span[2]
-            for start, end in SCRIPT_CORE_RANGES[dom_script]:
-                if start <= code_point <= end:
-                    in_included_range = True
-                    break
+            if keep:
+                result.append(char)
+            else:
+                if removed is not None:
+                    removed[class_id] += 1
+                # Character is not in included ranges or should be excluded
+                # Replace any non-letter character with space to prevent word merging
+                # Only skip replacement if character is a space (already handled by spaces config)
+                if not char.isspace():
+                    result.append(
+                        " "
+                    )  # Replace non-letter with space to prevent word merging
+                elif dropped is not None:
+                    dropped.append(i)
+                # If it's a space, just remove it (don't append anything) since spaces are handled by config
 
-        # Even if character is in included ranges, check if it should be excluded
-        # due to configuration (e.g., numbers=False should exclude digits even if in script range)
-        should_exclude = False
-        if in_included_range:
-            # Check if this character is in excluded categories
-            # Use priority: punctuation > numbers > symbols (most specific first)
-            category_priority = ["punctuation", "numbers", "symbols"]
-
-            matched_primary = False
-            for category in category_priority:
-                if category in current_config:
-                    include = current_config[category]
-                    # Treat string punctuation levels as enabled for category checks
-                    if category == "punctuation" and isinstance(include, str):
-                        include_bool = True
-                    else:
-                        include_bool = bool(include)
-
-                    if category == "punctuation":
-                        # Detect punctuation using the shared superset first
-                        is_punct = False
-                        for start, end in SHARED_RANGES["punctuation"]:
-                            if start <= code_point <= end:
-                                is_punct = True
-                                break
-                        if is_punct:
-                            # If punctuation is disabled entirely -> exclude
-                            if not include_bool:
-                                should_exclude = True
-                            else:
-                                # If enabled with a level, only allow if inside the active set
-                                if active_punct_ranges:
-                                    in_active = False
-                                    for s, e in active_punct_ranges:
-                                        if s <= code_point <= e:
-                                            in_active = True
-                                            break
-                                    if not in_active:
-                                        should_exclude = True
-                                else:
-                                    # include_bool True but no active ranges -> treat as disabled
-                                    should_exclude = True
-                            matched_primary = True
-                    else:
-                        if category in SHARED_RANGES:
-                            for start, end in SHARED_RANGES[category]:
-                                if start <= code_point <= end:
-                                    if not include_bool:
-                                        should_exclude = True
-                                    matched_primary = True
-                                    break
-                if matched_primary:
-                    # We matched a category; do not check lower-priority categories
-                    break
+            i += 1
+        if removed is not None:
+            _removal_stats(removed, stats, script_mask)
+    if report is not None:
+        start = report.lap("clean_script.filter", start)
 
-        if in_included_range and not should_exclude:
-            result.append(char)
-        else:
-            # Character is not in included ranges or should be excluded
-            # Replace any non-letter character with space to prevent word merging
-            # Only skip replacement if character is a space (already handled by spaces config)
-            if not char.isspace():
-                result.append(
-                    " "
-                )  # Replace non-letter with space to prevent word merging
-            # If it's a space, just remove it (don't append anything) since spaces are handled by config
+    if tokens:
+        # Splitting the filtered characters gives the tokens of the collapsed text
+        token_list = "".join(result).split()
+        if report is not None:
+            report.lap("clean_script.collapse", start)
+        return token_list
 
-        i += 1
+    if dropped:
+        write = dropped[0]
+        for index, next_index in zip(dropped, dropped[1:] + [len(offsets)]):
+            count = next_index - index - 1
+            offsets[write : write + count] = offsets[index + 1 : next_index]
+            write += count
+        del offsets[write:]
 
     # Collapse multiple spaces into one
-    return re.sub(r"\s+", " ", "".join(result)).strip()
+    cleaned, _ = _subn(r"\s+", " ", "".join(result), offsets)
+    cleaned = _strip(cleaned, offsets)
+    if report is not None:
+        report.lap("clean_script.collapse", start)
+    return cleaned
 
 
 def remove_emoji(text):
@@ -265,36 +737,51 @@ def remove_emoji(text):
     """
     if not isinstance(text, str):
         return ""
+    return _remove_emoji(text, None)
+
+
+def _remove_emoji(text, offsets):
+    """remove_emoji, keeping the offset map (or None) of text in step."""
+
+    report = profiling.ACTIVE
+    if report is not None:
+        start = perf_counter()
 
     str_copy = text
 
     # Emoji keycap regex (numbers with combining enclosing keycap)
     emoji_keycap_regex = r"[\u0023-\u0039]\ufe0f?\u20e3"
     if re.search(emoji_keycap_regex, str_copy):
-        str_copy = re.sub(emoji_keycap_regex, "", str_copy)
+        str_copy, _ = _subn(emoji_keycap_regex, "", str_copy, offsets)
+    if report is not None:
+        start = report.lap("remove_emoji.keycap", start)
 
     # Extended pictographic characters (general emoji pattern)
     # Python doesn't support \p{Extended_Pictographic} directly, so we use a simplified approach
     # This is an approximation of the emoji ranges
     emoji_regex = r"[\U0001F000-\U0001FFFF]"
     if re.search(emoji_regex, str_copy):
-        str_copy = re.sub(emoji_regex, "", str_copy)
+        str_copy, _ = _subn(emoji_regex, "", str_copy, offsets)
+    if report is not None:
+        start = report.lap("remove_emoji.pictographic", start)
 
     # Emoji component characters (like skin tone modifiers)
     # Again, this is an approximation as Python regex doesn't support \p{Emoji_Component}
     emoji_component_regex = (
         r"[\u200D\u20E3\uFE0F\u2640-\u2642\u2600-\u26FF\u2700-\u27BF]"
     )
+    # (none of these characters is a digit, "*" or "#", so every match is removed)
     if re.search(emoji_component_regex, str_copy):
-        for match in re.finditer(emoji_component_regex, str_copy):
-            emoji = match.group(0)
-            if not re.search(r"[\d|*|#]", emoji):
-                str_copy = str_copy.replace(emoji, "")
+        str_copy, _ = _subn(emoji_component_regex, "", str_copy, offsets)
+    if report is not None:
+        report.lap("remove_emoji.components", start)
 
     return str_copy
 
 
-def clean_text(text, lowercase=True):
+def clean_text(
+    text, lowercase=True, return_stats=False, offsets=False, result_cache=None
+):
     """
     Cleans text by removing @mentions, @@mentions, +mentions, hashtags, URLs, emojis,
     invalid Unicode characters, collapsing letter repetition, and normalizing newlines.
@@ -303,62 +790,148 @@ def clean_text(text, lowercase=True):
     Args:
         text (str): The text to clean
         lowercase (bool): Whether to convert text to lowercase. Defaults to True.
+        return_stats (bool): Also return what was removed. Defaults to False.
+        offsets (bool): Also return the position in ``text`` of every output
+                        character. Defaults to False.
+        result_cache (ResultCache, optional): Return cached results for repeated
+                                              documents (not used with
+                                              return_stats or offsets).
 
     Returns:
-        str: Cleaned text
+        str: Cleaned text, or
+        tuple: ``(text, CleaningStats)`` when return_stats is True,
+               ``(text, array('I'))`` when offsets is True, or
+               ``(text, CleaningStats, array('I'))`` when both are True
+    """
+    if not (return_stats or offsets):
+        if result_cache is not None:
+            return result_cache.lookup(
+                text,
+                ("clean_text", lowercase),
+                lambda: _clean_text(text, lowercase, None, None),
+            )
+        return _clean_text(text, lowercase, None, None)
+    if result_cache is not None:
+        result_cache.skipped += 1
+    stats = None
+    if return_stats:
+        stats = CleaningStats(documents=1)
+        if isinstance(text, str):
+            stats.input_chars = len(text)
+    offset_map = _initial_offsets(text) if offsets else None
+    cleaned = _clean_text(text, lowercase, stats, offset_map)
+    return _with_extras(cleaned, stats, offset_map)
+
+
+def _clean_text(text, lowercase, stats, offsets):
+    """
+    clean_text, counting removals into stats unless it is None.
+
+    ``offsets`` (or None) maps every character of ``text`` to its original
+    position; it is updated in place to map the returned text.
     """
     if not isinstance(text, str):
         return ""
 
+    report = profiling.ACTIVE
+    if report is not None:
+        start = perf_counter()
+
     # Remove emojis
-    text = remove_emoji(text)
+    if stats is not None:
+        stats.emojis = len(text)
+    text = _remove_emoji(text, offsets)
+    if stats is not None:
+        stats.emojis -= len(text)
+    if report is not None:
+        start = report.lap("clean_text.emoji", start)
 
     # Remove @mentions and @@mentions
-    text = re.sub(r"@{1,2}[a-zA-Z0-9_]+", "", text)
+    text, mentions = _subn(r"@{1,2}[a-zA-Z0-9_]+", "", text, offsets)
 
     # Remove +mentions
-    text = re.sub(r"[+][a-zA-Z0-9_]+", "", text)
+    text, count = _subn(r"[+][a-zA-Z0-9_]+", "", text, offsets)
+    mentions += count
+    if report is not None:
+        start = report.lap("clean_text.mentions", start)
 
     # Remove hashtags
-    text = re.sub(r"#[a-zA-Z0-9_]+", "", text)
+    text, hashtags = _subn(r"#[a-zA-Z0-9_]+", "", text, offsets)
+    if report is not None:
+        start = report.lap("clean_text.hashtags", start)
 
     # Remove URLs (including those without protocol and email addresses)
-    text = re.sub(r"https?://\S+", "", text)  # http/https URLs
-    text = re.sub(r"ftp://\S+", "", text)  # ftp URLs
-    text = re.sub(r"www\.\S+", "", text)  # www URLs
-    text = re.sub(r"\S+@\S+\.\S+", "", text)  # email addresses
+    text, urls = _subn(r"https?://\S+", "", text, offsets)  # http/https URLs
+    text, count = _subn(r"ftp://\S+", "", text, offsets)  # ftp URLs
+    urls += count
+    text, count = _subn(r"www\.\S+", "", text, offsets)  # www URLs
+    urls += count
+    # Email addresses (whole tokens matching \S+@\S+\.\S+)
+    if "@" in text:
+        if stats is not None:
+            urls += sum(
+                1 for m in _AT_TOKEN_PATTERN.finditer(text) if not _remove_email(m)
+            )
+        text, _ = _subn(_AT_TOKEN_PATTERN, _remove_email, text, offsets)
     # Domain names like example.com (but not decimal numbers)
-    text = re.sub(r"\b[a-zA-Z]+\.[a-zA-Z]{2,}\b", "", text)
+    text, count = _subn(r"\b[a-zA-Z]+\.[a-zA-Z]{2,}\b", "", text, offsets)
+    urls += count
+    if stats is not None:
+        stats.mentions += mentions
+        stats.hashtags += hashtags
+        stats.urls += urls
+    if report is not None:
+        start = report.lap("clean_text.urls", start)
 
     # Normalize Unicode characters to handle invalid/error Unicode
     try:
-        text = unicodedata.normalize("NFD", text)
+        text = _normalize_nfd(text, offsets)
     except UnicodeError:
         # Handle invalid Unicode by filtering out problematic characters
         text = "".join(c for c in text if ord(c) < 0x110000)
-        text = unicodedata.normalize("NFD", text)
+        text = _normalize_nfd(text, offsets)
+    if report is not None:
+        start = report.lap("clean_text.normalize", start)
 
     # Convert to lowercase for normalization if requested
     if lowercase:
-        text = text.lower()
+        text = _lower(text, offsets)
+        if report is not None:
+            start = report.lap("clean_text.lowercase", start)
 
     # Collapse repeating characters to maximum of 2 characters (except for numbers)
-    text = re.sub(r"([^\d])\1{2,}", r"\1\1", text)
+    text, _ = _subn(r"([^\d])\1{2,}", r"\1\1", text, offsets)
+    if report is not None:
+        start = report.lap("clean_text.repeats", start)
 
     # Replace newlines and other whitespace characters with single spaces
-    text = re.sub(r"[\n\r\t]+", " ", text)
+    text, _ = _subn(r"[\n\r\t]+", " ", text, offsets)
 
     # Clean up multiple spaces into single spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    text, _ = _subn(r"\s+", " ", text, offsets)
+    text = _strip(text, offsets)
+    if report is not None:
+        report.lap("clean_text.whitespace", start)
 
     # Return empty string if the result is only numbers
     if re.match(r"^\d+$", text):
+        if offsets is not None:
+            del offsets[:]
         return ""
 
     return text
 
 
-def unscript(script, text, config=None, lowercase=True):
+def unscript(
+    script,
+    text,
+    config=None,
+    lowercase=True,
+    return_stats=False,
+    offsets=False,
+    word_cache=None,
+    result_cache=None,
+):
     """
     Complete text cleaning pipeline that combines general text cleaning with script filtering.
 
@@ -368,13 +941,25 @@ def unscript(script, text, config=None, lowercase=True):
     Args:
         script (str): The Unicode script code (e.g., 'Latn', 'Arab', 'Hans')
         text (str): The text string to be cleaned
-        config (dict, optional): Configuration for clean_script. Defaults to
+        config (ScriptConfig | dict, optional): Configuration for clean_script. Defaults to
                                {'spaces': True, 'numbers': False, 'punctuation': False, 'symbols': False}
         lowercase (bool, optional): Whether to convert text to lowercase. Defaults to True.
+        return_stats (bool, optional): Also return what was removed by both steps.
+                                       Defaults to False.
+        offsets (bool, optional): Also return the position in ``text`` of every
+                                  output character. Defaults to False.
+        word_cache (WordCache, optional): Clean each distinct token once and reuse
+                                          it in the script filtering step.
+        result_cache (ResultCache, optional): Return cached results for repeated
+                                              documents (not used with
+                                              return_stats or offsets).
 
     Returns:
         str: Cleaned text containing only characters from the specified script,
-             with mentions, URLs, and other noise removed
+             with mentions, URLs, and other noise removed, or
+        tuple: ``(text, CleaningStats)`` when return_stats is True,
+               ``(text, array('I'))`` when offsets is True, or
+               ``(text, CleaningStats, array('I'))`` when both are True
 
     Example:
         >>> unscript("Latn", "Hello @user! Check https://example.com 😊")
@@ -383,6 +968,39 @@ def unscript(script, text, config=None, lowercase=True):
         >>> unscript("Arab", "مرحبا @user بالعالم! https://example.com", {"punctuation": True})
         "مرحبا بالعالم!"
     """
+    if result_cache is not None:
+        if return_stats or offsets:
+            result_cache.skipped += 1
+        else:
+            key = (
+                "unscript",
+                script if isinstance(script, str) else _script_key(script),
+                ScriptConfig.coerce(config),
+                lowercase,
+                get_table_version(),
+            )
+            return result_cache.lookup(
+                text,
+                key,
+                lambda: unscript(
+                    script, text, config, lowercase, word_cache=word_cache
+                ),
+            )
+
+    if return_stats or offsets:
+        stats = CleaningStats(documents=1) if return_stats else None
+        offset_map = _initial_offsets(text) if offsets else None
+        if isinstance(text, str):
+            if stats is not None:
+                stats.input_chars = len(text)
+            text = _clean_text(text, lowercase, stats, offset_map)
+            text = _clean_script(
+                script, text, config, stats, offset_map, word_cache=word_cache
+            )
+        else:
+            text = ""
+        return _with_extras(text, stats, offset_map)
+
     if not isinstance(text, str):
         return ""
 
@@ -390,6 +1008,42 @@ def unscript(script, text, config=None, lowercase=True):
     text_cleaned = clean_text(text, lowercase=lowercase)
 
     # Then apply script filtering
-    script_filtered = clean_script(script, text_cleaned, config)
+    script_filtered = clean_script(script, text_cleaned, config, word_cache=word_cache)
 
     return script_filtered
+
+
+def unscript_tokens(
+    script, text, config=None, lowercase=True, with_scripts=False, word_cache=None
+):
+    """
+    Clean text like unscript and return its tokens.
+
+    Equivalent to ``unscript(script, text, config, lowercase).split()``, without
+    building the collapsed string of the script filtering step.
+
+    Args:
+        script (str): The Unicode script code (e.g., 'Latn', 'Arab', 'Hans')
+        text (str): The text string to be cleaned
+        config (ScriptConfig | dict, optional): Configuration for clean_script
+        lowercase (bool, optional): Whether to convert text to lowercase. Defaults to True.
+        with_scripts (bool, optional): Return ``(token, script)`` pairs with the
+                                       dominant script of each token. Defaults to False.
+        word_cache (WordCache, optional): Clean each distinct token once and reuse it
+
+    Returns:
+        list: Tokens (str), or ``(token, script)`` tuples when with_scripts is True
+
+    Example:
+        >>> unscript_tokens("Latn", "Hello @user! Check https://example.com 😊 World")
+        ['hello', 'check', 'world']
+    """
+    if not isinstance(text, str):
+        return []
+    return clean_script_tokens(
+        script,
+        _clean_text(text, lowercase, None, None),
+        config,
+        with_scripts,
+        word_cache,
+    )
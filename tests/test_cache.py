@@ -0,0 +1,179 @@
+"""
+Tests for the memoization caches.
+"""
+
+import unittest
+
+from unscript import (
+    ResultCache,
+    WordCache,
+    clean_script,
+    clean_script_tokens,
+    clean_text,
+    detect_script,
+    unscript,
+)
+
+
+class TestWordCache(unittest.TestCase):
+    TEXTS = [
+        "Hello world, hello WORLD! مرحبا 12.50 and 1,234 again",
+        "world hello\tworld\n\nhello  again 你好",
+        "",
+        "   ",
+    ]
+
+    def test_same_results(self):
+        """Cleaning through the cache gives exactly the uncached results."""
+        configs = [
+            None,
+            {"numbers": True},
+            {"spaces": False, "numbers": True},
+            {"punctuation": "all", "symbols": True},
+        ]
+        for config in configs:
+            cache = WordCache()
+            for _ in range(2):
+                for text in self.TEXTS:
+                    with self.subTest(config=config, text=text):
+                        self.assertEqual(
+                            clean_script("Latn", text, config, word_cache=cache),
+                            clean_script("Latn", text, config),
+                        )
+                        self.assertEqual(
+                            unscript("Latn", text, config, word_cache=cache),
+                            unscript("Latn", text, config),
+                        )
+                        self.assertEqual(
+                            clean_script_tokens("Latn", text, config, word_cache=cache),
+                            clean_script("Latn", text, config).split(),
+                        )
+
+    def test_hits_and_misses(self):
+        """Every distinct token is cleaned once."""
+        cache = WordCache()
+        clean_script("Latn", "hi hi hi yo", word_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        clean_script("Latn", "yo hi", word_cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (4, 2))
+        self.assertEqual(len(cache), 2)
+        self.assertAlmostEqual(cache.hit_rate, 4 / 6)
+        info = cache.info()
+        self.assertEqual(info["entries"], 2)
+        self.assertGreater(info["bytes"], 0)
+
+    def test_lru_eviction(self):
+        """The least recently used token is evicted first."""
+        cache = WordCache(max_entries=2)
+        clean_script("Latn", "a b", word_cache=cache)
+        clean_script("Latn", "a", word_cache=cache)  # "b" is now the oldest
+        clean_script("Latn", "c", word_cache=cache)
+        self.assertEqual(cache.evictions, 1)
+        misses = cache.misses
+        clean_script("Latn", "a c", word_cache=cache)
+        self.assertEqual(cache.misses, misses)
+        clean_script("Latn", "b", word_cache=cache)
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_memory_cap_and_long_tokens(self):
+        """The byte limit bounds the cache; long tokens are not cached."""
+        cache = WordCache(max_bytes=500)
+        clean_script("Latn", " ".join(f"word{i}" for i in range(100)), word_cache=cache)
+        self.assertLessEqual(cache.bytes, 500)
+        self.assertGreater(cache.evictions, 0)
+
+        cache = WordCache(max_token_length=5)
+        clean_script("Latn", "short muchlongertoken", word_cache=cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_bypass_and_config_change(self):
+        """Unsupported calls bypass the cache; configurations share it."""
+        cache = WordCache()
+        clean_script("Latn", "hello мир", {"max_foreign_words": 1}, word_cache=cache)
+        clean_script("Latn", "hello", return_stats=True, word_cache=cache)
+        self.assertEqual(cache.bypassed, 2)
+        self.assertEqual(len(cache), 0)
+
+        for _ in range(5):
+            for script in ("Latn", "Arab"):
+                self.assertEqual(
+                    unscript(script, "hello мир مرحبا", word_cache=cache),
+                    unscript(script, "hello мир مرحبا"),
+                )
+        self.assertEqual((cache.misses, cache.hits), (6, 24))
+        self.assertEqual(len(cache), 6)
+        cache.clear()
+        self.assertEqual((len(cache), cache.bytes), (0, 0))
+
+    def test_invalid_size(self):
+        """A cache must hold at least one entry."""
+        with self.assertRaises(ValueError):
+            WordCache(max_entries=0)
+
+
+class TestResultCache(unittest.TestCase):
+    DOC = "Hello @user, this is a retweet! https://example.com 😊 مرحبا"
+
+    def test_same_results(self):
+        """Cached results equal uncached ones; duplicates are hits."""
+        cache = ResultCache()
+        for _ in range(3):
+            self.assertEqual(
+                unscript("Latn", self.DOC, result_cache=cache),
+                unscript("Latn", self.DOC),
+            )
+            self.assertEqual(
+                clean_text(self.DOC, result_cache=cache), clean_text(self.DOC)
+            )
+            self.assertEqual(
+                detect_script(self.DOC, True, result_cache=cache),
+                detect_script(self.DOC, True),
+            )
+        self.assertEqual((cache.hits, cache.misses), (6, 3))
+        self.assertEqual(len(cache), 3)
+
+    def test_config_is_part_of_the_key(self):
+        """Different functions, scripts and configs do not share results."""
+        cache = ResultCache()
+        results = [
+            unscript("Latn", self.DOC, result_cache=cache),
+            unscript("Arab", self.DOC, result_cache=cache),
+            unscript(["Latn", "Arab"], self.DOC, result_cache=cache),
+            unscript("Latn", self.DOC, {"punctuation": True}, result_cache=cache),
+            unscript("Latn", self.DOC, lowercase=False, result_cache=cache),
+            clean_text(self.DOC, result_cache=cache),
+        ]
+        self.assertEqual(cache.misses, 6)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(len(set(results)), 6)
+
+    def test_length_thresholds(self):
+        """Very short and very long documents are not cached."""
+        cache = ResultCache(min_length=5, max_length=20)
+        self.assertEqual(unscript("Latn", "hi", result_cache=cache), "hi")
+        unscript("Latn", "x" * 21, result_cache=cache)
+        unscript("Latn", None, result_cache=cache)
+        unscript("Latn", "hello there", return_stats=True, result_cache=cache)
+        self.assertEqual(cache.skipped, 4)
+        self.assertEqual(len(cache), 0)
+
+    def test_byte_limit(self):
+        """The least recently used results are evicted to stay within max_bytes."""
+        cache = ResultCache(max_bytes=2000, min_length=1)
+        for i in range(50):
+            clean_text(f"document number {i} " * 3, result_cache=cache)
+        self.assertLessEqual(cache.bytes, 2000)
+        self.assertGreater(cache.evictions, 0)
+        self.assertEqual(cache.info()["entries"], len(cache))
+
+    def test_returned_dicts_are_copies(self):
+        """Modifying a returned detect_script dict does not change the cache."""
+        cache = ResultCache()
+        detect_script(self.DOC, result_cache=cache)["Latn"] = 0.0
+        self.assertEqual(
+            detect_script(self.DOC, result_cache=cache), detect_script(self.DOC)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,10 @@
 import unittest
-from unscript.unscript import clean_text, clean_script
+from unscript.unscript import (
+    clean_text,
+    clean_script,
+    clean_script_variants,
+    split_by_script,
+)
 
 
 class TestCleanScript(unittest.TestCase):
@@ -302,6 +307,23 @@ class TestCleanScript(unittest.TestCase):
             clean_script("Thai", "สวัสดี ๑๒๓", {"numbers": True}), "สวัสดี ๑๒๓"
         )
 
+    def test_decimal_numbers_kept_whole(self):
+        """Decimal numbers are kept with their separators, wherever they occur."""
+        self.assertEqual(
+            clean_script("Latn", "Pay 1,234.50 or 12,5!", {"numbers": True}),
+            "Pay 1,234.50 or 12,5",
+        )
+        # A repeated number keeps its separators at every occurrence
+        self.assertEqual(
+            clean_script("Latn", "x1.5 and 1.5 or 1.5", {"numbers": True}),
+            "x1 5 and 1.5 or 1.5",
+        )
+        # Text that looks like an internal placeholder is treated as plain text
+        self.assertEqual(
+            clean_script("Latn", "__DECIMAL_0__ 2.5", {"numbers": True}),
+            "DECIMAL 0 2.5",
+        )
+
     def test_punctuation_configuration(self):
         """Test punctuation handling across different scripts."""
         # Basic punctuation
@@ -825,5 +847,89 @@ class TestCleanScript(unittest.TestCase):
         )
 
 
+class TestSplitByScript(unittest.TestCase):
+    TEXTS = [
+        "Hello مرحبا 你好, world! 12.50 and 1,234 ٣.٥",
+        "  नमस्ते\tПривет\n\nworld -- €5 😊  ",
+        "",
+    ]
+    SCRIPTS = ["Latn", "Arab", "Hans", "Deva", "Cyrl"]
+
+    def test_same_as_clean_script(self):
+        """Every output equals clean_script for that script."""
+        configs = [
+            None,
+            {"numbers": True},
+            {"numbers": True, "spaces": False},
+            {"punctuation": "all", "symbols": True},
+            {"max_foreign_words": 1},
+        ]
+        for config in configs:
+            for text in self.TEXTS:
+                with self.subTest(config=config, text=text):
+                    result = split_by_script(text, self.SCRIPTS, config)
+                    self.assertEqual(list(result), self.SCRIPTS)
+                    for script, cleaned in result.items():
+                        self.assertEqual(cleaned, clean_script(script, text, config))
+
+    def test_example(self):
+        self.assertEqual(
+            split_by_script("Hello مرحبا 12.5!", ["Latn", "Arab"], {"numbers": True}),
+            {"Latn": "Hello 12.5", "Arab": "مرحبا 12.5"},
+        )
+
+    def test_single_and_unknown_scripts(self):
+        """A single code is accepted; unknown scripts leave the text unchanged."""
+        self.assertEqual(split_by_script("Hi مرحبا", "Arab"), {"Arab": "مرحبا"})
+        self.assertEqual(split_by_script("Hi!", ["Xxxx"]), {"Xxxx": "Hi!"})
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            split_by_script("Hi", ["Latn"], {"unknown": True})
+
+
+class TestCleanScriptVariants(unittest.TestCase):
+    CONFIGS = [
+        None,
+        {"numbers": True},
+        {"numbers": True, "spaces": False},
+        {"punctuation": "ascii"},
+        {"punctuation": "extended", "numbers": True, "symbols": True},
+        {"max_foreign_words": 1},
+    ]
+
+    def test_same_as_clean_script(self):
+        """Every variant equals clean_script with its config."""
+        texts = TestSplitByScript.TEXTS + ["“Quoted” text… 3.14, ok?"]
+        for script in ("Latn", ["Latn", "Arab"], "Xxxx"):
+            for text in texts:
+                with self.subTest(script=script, text=text):
+                    variants = clean_script_variants(script, text, self.CONFIGS)
+                    self.assertEqual(
+                        variants,
+                        [clean_script(script, text, c) for c in self.CONFIGS],
+                    )
+
+    def test_named_variants(self):
+        """A dict of configs gives a dict of outputs with the same names."""
+        variants = clean_script_variants(
+            "Latn",
+            "Hi, 2 you!",
+            {
+                "plain": None,
+                "numbers": {"numbers": True},
+                "punctuation": {"numbers": True, "punctuation": "ascii"},
+            },
+        )
+        self.assertEqual(
+            variants,
+            {"plain": "Hi you", "numbers": "Hi 2 you", "punctuation": "Hi, 2 you!"},
+        )
+
+    def test_empty_input(self):
+        self.assertEqual(clean_script_variants("Latn", "", [None, None]), ["", ""])
+        self.assertEqual(clean_script_variants("Latn", "abc", {}), {})
+
+
 if __name__ == "__main__":
     unittest.main()
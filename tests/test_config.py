@@ -0,0 +1,102 @@
+"""
+Tests for ScriptConfig.
+"""
+
+import pickle
+import unittest
+
+from unscript import PunctuationLevel, ScriptConfig, clean_script, unscript
+
+
+class TestScriptConfig(unittest.TestCase):
+    def test_defaults_match_dict_config(self):
+        """The default config matches DEFAULT_CONFIG."""
+        from unscript.unscript import DEFAULT_CONFIG
+
+        self.assertEqual(ScriptConfig(), ScriptConfig.from_dict(DEFAULT_CONFIG))
+        self.assertEqual(ScriptConfig.coerce(None), ScriptConfig())
+        self.assertEqual(ScriptConfig.coerce({}), ScriptConfig())
+
+    def test_punctuation_level_normalization(self):
+        """Booleans and level names normalize to PunctuationLevel."""
+        self.assertIs(
+            ScriptConfig(punctuation=True).punctuation, PunctuationLevel.ASCII
+        )
+        self.assertIs(
+            ScriptConfig(punctuation=False).punctuation, PunctuationLevel.NONE
+        )
+        self.assertIs(
+            ScriptConfig(punctuation="EXTENDED").punctuation, PunctuationLevel.EXTENDED
+        )
+        self.assertIs(
+            ScriptConfig(punctuation=PunctuationLevel.ALL).punctuation,
+            PunctuationLevel.ALL,
+        )
+        # Unknown level names keep no punctuation, as with dict configs
+        self.assertIs(
+            ScriptConfig(punctuation="bogus").punctuation, PunctuationLevel.NONE
+        )
+
+    def test_hashable_and_immutable(self):
+        """Equal configs hash equally; attributes cannot be changed."""
+        a = ScriptConfig(numbers=True, foreign_scripts=["Arab", "Hans"])
+        b = ScriptConfig.from_dict(
+            {"numbers": True, "foreign_scripts": ("Hans", "Arab")}
+        )
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, ScriptConfig()}), 2)
+        with self.assertRaises(AttributeError):
+            a.numbers = False
+        with self.assertRaises(AttributeError):
+            a.extra = 1
+        self.assertFalse(hasattr(a, "__dict__"))
+
+    def test_replace_and_round_trip(self):
+        """replace, to_dict and pickling produce equivalent configs."""
+        config = ScriptConfig(punctuation="extended", max_foreign_words=2)
+        changed = config.replace(numbers=True)
+        self.assertTrue(changed.numbers)
+        self.assertFalse(config.numbers)
+        self.assertEqual(ScriptConfig.from_dict(changed.to_dict()), changed)
+        self.assertEqual(pickle.loads(pickle.dumps(changed)), changed)
+
+    def test_unknown_key(self):
+        """Unknown dict keys raise ValueError instead of being ignored."""
+        with self.assertRaises(ValueError):
+            ScriptConfig.from_dict({"numbrs": True})
+        with self.assertRaises(ValueError):
+            clean_script("Latn", "Hello", {"numbrs": True})
+        with self.assertRaises(ValueError):
+            ScriptConfig(categories=["not_registered"])
+
+    def test_same_results_as_dicts(self):
+        """clean_script and unscript accept ScriptConfig like dicts."""
+        cases = [
+            ("Latn", "Hello, World! 123.45 $", {"numbers": True, "punctuation": True}),
+            (
+                "Arab",
+                "مرحبا، بالعالم! 123",
+                {"punctuation": "extended", "numbers": True},
+            ),
+            (
+                "Latn",
+                "Hello مرحبا 你好 world",
+                {"max_foreign_words": 1, "foreign_scripts": "Hans"},
+            ),
+            ("Latn", "Price: $5 #1", {"symbols": True, "spaces": False}),
+        ]
+        for script, text, config in cases:
+            with self.subTest(config=config):
+                self.assertEqual(
+                    clean_script(script, text, ScriptConfig.from_dict(config)),
+                    clean_script(script, text, config),
+                )
+                self.assertEqual(
+                    unscript(script, text, ScriptConfig.from_dict(config)),
+                    unscript(script, text, config),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,17 @@ import unittest
 from unscript.detect_script import (
     detect_script,
     detect_script_detailed,
+    detect_script_matrix,
     get_dominant_script,
     is_script_mixed,
+    matches_script,
 )
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestDetectScript(unittest.TestCase):
 
@@ -346,5 +353,92 @@ class TestIntegration(unittest.TestCase):
         self.assertNotEqual(default_result["Latn"], categories_result["Latn"])
 
 
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestDetectScriptMatrix(unittest.TestCase):
+    """Tests for the vectorized batch script counter."""
+
+    def test_matrix_matches_detect_script(self):
+        """Per-document counts reproduce detect_script percentages."""
+        texts = [
+            "Hello World",
+            "Hello مرحبا 你好",
+            "こんにちは世界",
+            "Tiếng Việt",
+            "",
+            "123 !!!",
+        ]
+        counts, columns = detect_script_matrix(texts)
+        self.assertEqual(counts.shape, (len(texts), len(columns)))
+
+        for row, text in zip(counts, texts):
+            total = row.sum()
+            expected = detect_script(text, min_threshold=0)
+            observed = {
+                columns[i]: round(int(c) / total * 100, 2)
+                for i, c in enumerate(row)
+                if c
+            }
+            self.assertEqual(observed, expected)
+
+    def test_matrix_with_categories(self):
+        """Category columns follow the detect_script priority order."""
+        text = "Hello, World! 123"
+        counts, columns = detect_script_matrix([text], include_categories=True)
+        self.assertEqual(int(counts[0].sum()), len(text))
+        self.assertEqual(int(counts[0, columns.index("Latn")]), 10)
+        self.assertEqual(int(counts[0, columns.index("punctuation")]), 2)
+        self.assertEqual(int(counts[0, columns.index("numbers")]), 3)
+        self.assertEqual(int(counts[0, columns.index("spaces")]), 2)
+
+    def test_matrix_empty_and_invalid(self):
+        """Empty batches and non-string documents are handled."""
+        counts, columns = detect_script_matrix([])
+        self.assertEqual(counts.shape, (0, len(columns)))
+
+        counts, _ = detect_script_matrix([None, "abc"])
+        self.assertEqual(int(counts[0].sum()), 0)
+        self.assertEqual(int(counts[1].sum()), 3)
+
+
+class TestMatchesScript(unittest.TestCase):
+
+    def test_same_as_detect_script(self):
+        """The outcome equals the full-text ratio reported by detect_script."""
+        texts = [
+            "Hello world",
+            "Hello مرحبا",
+            "مرحبا بالعالم hi",
+            "123 !!!",
+            "a" * 500 + "ب" * 2000,
+            "ب" * 2000 + "a" * 500,
+            ("ab 12 مرحبا 你好 " * 300)[:3001],
+        ]
+        for text in texts:
+            shares = detect_script(text, min_threshold=0)
+            for script in ("Latn", "Arab", "Hans"):
+                for ratio in (0.0, 0.2, 0.5, 0.8, 1.0):
+                    with self.subTest(text=text[:20], script=script, ratio=ratio):
+                        expected = bool(shares) and (
+                            shares.get(script, 0) >= ratio * 100 - 0.01
+                        )
+                        self.assertEqual(
+                            matches_script(text, script, ratio), expected
+                        )
+
+    def test_several_scripts(self):
+        """Characters of all the given scripts count together."""
+        self.assertTrue(matches_script("Hello مرحبا", ["Latn", "Arab"], 1.0))
+        self.assertFalse(matches_script("Hello مرحبا 你好", ["Latn", "Arab"], 0.9))
+
+    def test_no_script_characters(self):
+        """Empty, non-string and script-free texts never match."""
+        for text in ("", None, "123 !?", 5):
+            self.assertFalse(matches_script(text, "Latn", 0.0))
+
+    def test_invalid_ratio(self):
+        with self.assertRaises(ValueError):
+            matches_script("abc", "Latn", 80)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests for offset maps from cleaned output back to the input (offsets=True).
+"""
+
+import unittest
+from array import array
+
+from unscript import CleaningStats, clean_script, clean_text, unscript
+
+
+class TestCleanTextOffsets(unittest.TestCase):
+    def test_removed_entities(self):
+        """Characters after removed entities map to their original positions."""
+        text = "Hi @user see https://x.com 😊 now"
+        cleaned, offsets = clean_text(text, offsets=True)
+        self.assertEqual(cleaned, clean_text(text))
+        self.assertIsInstance(offsets, array)
+        self.assertEqual(offsets.typecode, "I")
+        self.assertEqual(len(offsets), len(cleaned))
+        self.assertEqual(cleaned, "hi see now")
+        self.assertEqual(list(offsets), [0, 1, 2, 9, 10, 11, 12, 29, 30, 31])
+
+    def test_normalization_and_lowercase(self):
+        """Characters that expand map to the character they came from."""
+        cleaned, offsets = clean_text("Ré İ", offsets=True)
+        self.assertEqual(cleaned, "ré i̇")
+        self.assertEqual(list(offsets), [0, 1, 1, 2, 3, 3])
+
+    def test_canonical_reordering(self):
+        """Combining marks reordered by NFD keep their own positions."""
+        text = "ẹ́"
+        cleaned, offsets = clean_text(text, offsets=True)
+        self.assertEqual(cleaned, "ẹ́")
+        self.assertEqual(list(offsets), [0, 2, 1])
+
+    def test_collapsed_runs(self):
+        """Collapsed repeats and whitespace map to the start of the run."""
+        cleaned, offsets = clean_text("  so   cooool \n ok ", offsets=True)
+        self.assertEqual(cleaned, "so cool ok")
+        self.assertEqual(list(offsets), [2, 3, 4, 7, 8, 9, 12, 13, 16, 17])
+
+    def test_empty_results(self):
+        """Empty and number-only results have empty offset maps."""
+        self.assertEqual(clean_text("12345", offsets=True), ("", array("I")))
+        self.assertEqual(clean_text(None, offsets=True), ("", array("I")))
+
+
+class TestCleanScriptOffsets(unittest.TestCase):
+    def test_removed_characters(self):
+        """Replaced punctuation and dropped characters keep positions aligned."""
+        text = "Hi, مرحبا you!"
+        cleaned, offsets = clean_script("Latn", text, offsets=True)
+        self.assertEqual(cleaned, "Hi you")
+        self.assertEqual(list(offsets), [0, 1, 2, 10, 11, 12])
+        # The space stands in for the removed comma
+        self.assertEqual("".join(text[i] for i in offsets), "Hi,you")
+
+    def test_decimals_and_spaces(self):
+        """Decimal numbers are mapped character by character."""
+        text = "a 1,5 b"
+        cleaned, offsets = clean_script(
+            "Latn", text, {"numbers": True, "spaces": False}, offsets=True
+        )
+        self.assertEqual(cleaned, "a1,5b")
+        self.assertEqual(list(offsets), [0, 2, 3, 4, 6])
+
+    def test_unchanged_text(self):
+        """Text returned unchanged has the identity map."""
+        self.assertEqual(
+            clean_script("Xxxx", "abc", offsets=True), ("abc", array("I", [0, 1, 2]))
+        )
+
+    def test_with_stats(self):
+        """Stats and offsets can be requested together."""
+        cleaned, stats, offsets = clean_script(
+            "Latn", "ok 你好", return_stats=True, offsets=True
+        )
+        self.assertEqual(cleaned, "ok")
+        self.assertIsInstance(stats, CleaningStats)
+        self.assertEqual(stats.foreign, 2)
+        self.assertEqual(list(offsets), [0, 1])
+
+
+class TestUnscriptOffsets(unittest.TestCase):
+    def test_maps_to_raw_input(self):
+        """unscript offsets point into the raw input across both steps."""
+        text = "Café @user: İSTANBUL!!!! مرحبا https://x.com ok"
+        cleaned, offsets = unscript("Latn", text, offsets=True)
+        self.assertEqual(cleaned, unscript("Latn", text))
+        self.assertEqual(len(offsets), len(cleaned))
+        for position, char in zip(offsets, cleaned):
+            if char != " ":
+                self.assertIn(char, text[position].lower() + "cafe")
+        self.assertEqual(text[offsets[-2] : offsets[-1] + 1], "ok")
+
+    def test_invalid_input(self):
+        """Non-string input returns empty text and an empty map."""
+        self.assertEqual(unscript("Latn", None, offsets=True), ("", array("I")))
+
+
+if __name__ == "__main__":
+    unittest.main()
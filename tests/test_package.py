@@ -0,0 +1,118 @@
+"""
+Tests for the package's lazy public API.
+"""
+
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import unscript
+from unscript import script_ranges
+
+
+def run_isolated(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_is_lazy(self):
+        """Importing the package loads no submodule and builds no table."""
+        output = run_isolated(
+            """
+            import sys
+            import unscript
+            print(sorted(m for m in sys.modules if m.startswith("unscript.")))
+            """
+        )
+        self.assertEqual(output, "[]")
+
+    def test_in_range_does_not_build_class_table(self):
+        """in_range only needs the range lists, not the derived class table."""
+        output = run_isolated(
+            """
+            import sys
+            from unscript import in_range, ranges
+            print(in_range("a", ranges.Latn))
+            print("unscript.unscript" in sys.modules)
+            print(sys.modules["unscript.script_ranges"]._STAGE1 is None)
+            """
+        )
+        self.assertEqual(output.split(), ["True", "False", "True"])
+
+    def test_unscript_name_stays_the_function(self):
+        """Importing the unscript submodule does not shadow the unscript function."""
+        output = run_isolated(
+            """
+            import unscript.unscript
+            from unscript import unscript as fn
+            print(callable(fn), fn("Latn", "Hello 123"))
+            """
+        )
+        self.assertEqual(output, "True hello")
+
+    def test_detect_script_name_stays_the_function(self):
+        """Loading other names of the detect_script submodule keeps the function."""
+        output = run_isolated(
+            """
+            import unscript
+            unscript.get_dominant_script
+            from unscript import filter_by_script
+            import unscript.detect_script
+            print(callable(unscript.detect_script), unscript.detect_script("hello"))
+            """
+        )
+        self.assertEqual(output, "True {'Latn': 100.0}")
+
+    def test_public_api(self):
+        """Every name in __all__ resolves and appears in dir()."""
+        for name in unscript.__all__:
+            self.assertIsNotNone(getattr(unscript, name))
+            self.assertIn(name, dir(unscript))
+        with self.assertRaises(AttributeError):
+            unscript.not_a_function
+
+
+class TestEnsureClassTable(unittest.TestCase):
+    def test_concurrent_first_use(self):
+        """Concurrent first use builds the table once; every thread sees it."""
+        output = run_isolated(
+            """
+            import threading
+            from unscript import script_ranges
+
+            barrier = threading.Barrier(8)
+            tables = []
+
+            def worker():
+                barrier.wait()
+                tables.append(script_ranges.get_class_table())
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            final = script_ranges.get_class_table()
+            print(all(t[0] is final[0] and t[1] is final[1] for t in tables))
+            """
+        )
+        self.assertEqual(output, "True")
+
+    def test_table_ready_after_use(self):
+        """Accessors install the table on first use."""
+        script_ranges.ensure_class_table()
+        stage1, stage2 = script_ranges.get_class_table()
+        self.assertIsNotNone(stage1)
+        self.assertIsNotNone(stage2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Tests for the streaming pipeline stages.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from unscript import (
+    Deduplicator,
+    ScriptConfig,
+    ScriptRouter,
+    WordCache,
+    filter_by_script,
+    matches_script,
+    unscript,
+    unscript_stream,
+)
+
+
+class TestDeduplicator(unittest.TestCase):
+    def test_filter_and_counts(self):
+        """Repeats are dropped and counted, first occurrences keep their order."""
+        dedupe = Deduplicator()
+        kept = list(dedupe.filter(["b", "a", "b", "", "a", ""]))
+        self.assertEqual(kept, ["b", "a", ""])
+        self.assertEqual((dedupe.seen, dedupe.unique, dedupe.duplicates), (6, 3, 3))
+        self.assertIn("a", dedupe)
+        self.assertNotIn("c", dedupe)
+        self.assertEqual(dedupe.info()["in_memory"], 3)
+
+    def test_spill_to_disk(self):
+        """Digests spilled to disk are still found, also after reopening."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "digests")
+        texts = [f"document {i}" for i in range(25)]
+        with Deduplicator(spill_path=path, max_in_memory=10) as dedupe:
+            self.assertEqual(list(dedupe.filter(texts + texts)), texts)
+            self.assertEqual(dedupe.spilled, 20)
+            self.assertEqual(dedupe.info()["in_memory"], 5)
+            self.assertEqual(dedupe.duplicates, 25)
+        with Deduplicator(spill_path=path, max_in_memory=10) as dedupe:
+            self.assertEqual(list(dedupe.filter(texts + ["new"])), ["new"])
+        # Spilled digests are no longer checked once closed
+        with self.assertRaises(ValueError):
+            dedupe.add(texts[0])
+        with self.assertRaises(ValueError):
+            texts[0] in dedupe
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Deduplicator(max_in_memory=0)
+        with self.assertRaises(ValueError):
+            Deduplicator(digest_size=65)
+
+
+class TestUnscriptStream(unittest.TestCase):
+    DOCS = [
+        "Hi @ann see https://a.com",
+        "Hi @bob see https://b.com 😊",
+        "Bonjour مرحبا",
+        None,
+        "bonjour",
+    ]
+
+    def test_same_as_unscript(self):
+        """Without dedupe, every document is cleaned like unscript."""
+        expected = [unscript("Latn", doc) for doc in self.DOCS]
+        self.assertEqual(list(unscript_stream("Latn", self.DOCS)), expected)
+        cached = unscript_stream("Latn", iter(self.DOCS), word_cache=WordCache())
+        self.assertEqual(list(cached), expected)
+
+    def test_dedupe_cleaned_outputs(self):
+        """Documents that clean to the same text are emitted once."""
+        dedupe = Deduplicator()
+        output = list(unscript_stream("Latn", self.DOCS, dedupe=dedupe))
+        self.assertEqual(output, ["hi see", "bonjour", ""])
+        self.assertEqual(dedupe.duplicates, 2)
+
+
+class TestFilterByScript(unittest.TestCase):
+    def test_keeps_matching_documents(self):
+        """Documents reaching the ratio are yielded in input order."""
+        docs = ["مرحبا بالعالم", "Hello world", "Hello مرحبا", None, "بالعالم كله ok"]
+        self.assertEqual(
+            list(filter_by_script(iter(docs), "Arab", 0.8)),
+            ["مرحبا بالعالم", "بالعالم كله ok"],
+        )
+        self.assertEqual(
+            list(filter_by_script(docs, "Arab", 0.4)),
+            [doc for doc in docs if matches_script(doc, "Arab", 0.4)],
+        )
+
+    def test_invalid_ratio(self):
+        with self.assertRaises(ValueError):
+            filter_by_script([], "Arab", 1.5)
+
+
+class TestScriptRouter(unittest.TestCase):
+    DOCS = [
+        "Hello @user world https://example.com",
+        "مرحبا بالعالم hi",
+        "你好世界",
+        "Bonjour 😊 tout le monde",
+        "!!! 123",
+        "Hello @other world https://example.org",
+    ]
+
+    def test_routes_to_sinks(self):
+        """Each sink gets the documents of its script, cleaned like unscript."""
+        latin = io.StringIO()
+        batches = []
+        with ScriptRouter(
+            {"Latn": latin, "Arab": batches.append}, buffer_size=2
+        ) as router:
+            self.assertEqual(router.route_all(self.DOCS), {"Latn": 3, "Arab": 1})
+        self.assertEqual(
+            latin.getvalue().splitlines(),
+            [unscript("Latn", doc) for doc in self.DOCS if "o" in doc[:5]],
+        )
+        self.assertEqual(batches, [[unscript("Arab", self.DOCS[1])]])
+        self.assertEqual((router.unrouted, router.empty), (2, 0))
+
+    def test_fallback_sink_and_dedupe(self):
+        """Other scripts go to the None sink; repeats and empty outputs are dropped."""
+        other = []
+        dedupe = Deduplicator()
+        router = ScriptRouter({"Latn": [].extend, None: other.extend}, dedupe=dedupe)
+        self.assertTrue(router.route(self.DOCS[2]))
+        self.assertFalse(router.route("@user https://x.com 😊"))
+        self.assertTrue(router.route(self.DOCS[0]))
+        self.assertFalse(router.route(self.DOCS[5]))
+        router.close()
+        self.assertEqual(other, ["你好世界"])
+        self.assertEqual(router.counts, {"Latn": 1, None: 1})
+        self.assertEqual((router.empty, dedupe.duplicates), (1, 1))
+
+    def test_file_sinks(self):
+        """Path sinks are written as UTF-8 files with one document per line."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        paths = {script: os.path.join(directory, script) for script in ("Latn", "Hans")}
+        with ScriptRouter(paths, buffer_size=1) as router:
+            router.route_all(self.DOCS)
+        with open(paths["Hans"], encoding="utf-8") as f:
+            self.assertEqual(f.read(), "你好世界\n")
+        with open(paths["Latn"], encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+    def test_route_after_close(self):
+        """A closed router refuses documents instead of truncating its shards."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "Latn")
+        router = ScriptRouter({"Latn": path})
+        router.route("first doc")
+        router.close()
+        with self.assertRaises(ValueError):
+            router.route("second doc")
+        with self.assertRaises(ValueError):
+            router.flush()
+        router.close()
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "first doc\n")
+
+    def test_config_converted_once(self):
+        """A dict config is converted to a ScriptConfig (and validated) up front."""
+        router = ScriptRouter({"Latn": [].extend}, config={"numbers": True})
+        self.assertIsInstance(router.config, ScriptConfig)
+        self.assertTrue(router.config.numbers)
+        with self.assertRaises(ValueError):
+            ScriptRouter({"Latn": [].extend}, config={"unknown": True})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            ScriptRouter({"Latn": 5})
+        with self.assertRaises(ValueError):
+            ScriptRouter({"Latn": []}, buffer_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests for per-stage profiling.
+"""
+
+import unittest
+
+from unscript import clean_script, clean_text, profile, unscript
+from unscript import profiling
+
+
+class TestProfile(unittest.TestCase):
+    TEXT = "Hello @user #tag! Visit https://example.com 😊 12.5 cooool"
+
+    def test_records_pipeline_stages(self):
+        """unscript records every clean_text, remove_emoji and clean_script stage."""
+        with profile() as report:
+            for _ in range(3):
+                unscript("Latn", self.TEXT, {"numbers": True})
+
+        expected = {
+            "clean_text.emoji",
+            "clean_text.mentions",
+            "clean_text.hashtags",
+            "clean_text.urls",
+            "clean_text.normalize",
+            "clean_text.lowercase",
+            "clean_text.repeats",
+            "clean_text.whitespace",
+            "remove_emoji.keycap",
+            "remove_emoji.pictographic",
+            "remove_emoji.components",
+            "clean_script.decimals",
+            "clean_script.plan",
+            "clean_script.filter",
+            "clean_script.collapse",
+        }
+        self.assertEqual(set(report.stages), expected)
+        for stage, timing in report.stages.items():
+            self.assertEqual(timing.calls, 3, stage)
+            self.assertGreaterEqual(timing.seconds, 0.0)
+        self.assertGreater(report.total("clean_script"), 0.0)
+        self.assertEqual(report.as_dict()["clean_text.urls"]["calls"], 3)
+        self.assertIn("clean_script.filter", report.format())
+
+    def test_results_unchanged(self):
+        """Profiling does not change the output."""
+        with profile():
+            profiled = (
+                clean_text(self.TEXT),
+                clean_script("Latn", self.TEXT, {"punctuation": True}),
+            )
+        self.assertEqual(
+            profiled,
+            (
+                clean_text(self.TEXT),
+                clean_script("Latn", self.TEXT, {"punctuation": True}),
+            ),
+        )
+
+    def test_disabled_outside_block(self):
+        """Nothing is recorded outside the block; nested blocks are separate."""
+        self.assertIsNone(profiling.ACTIVE)
+        with profile() as outer:
+            clean_text("a")
+            with profile() as inner:
+                clean_script("Latn", "b")
+            clean_text("c")
+        self.assertIsNone(profiling.ACTIVE)
+        clean_text("d")
+
+        self.assertEqual(outer.stages["clean_text.emoji"].calls, 2)
+        self.assertNotIn("clean_script.filter", outer.stages)
+        self.assertEqual(list(inner.stages)[0], "clean_script.decimals")
+        self.assertNotIn("clean_text.emoji", inner.stages)
+
+
+if __name__ == "__main__":
+    unittest.main()
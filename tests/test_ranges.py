@@ -295,6 +295,129 @@ class TestUtilityFunctions:
             ranges.get_range_info("InvalidRange")
 
 
+class TestRangeMatcher:
+    """Test compiled range matchers."""
+
+    def test_contains_matches_in_range(self):
+        """Membership agrees with in_range for every character of a mixed text."""
+        text = "Hello مرحبا 你好 123!\t\U0001f600\u00a0"
+        matcher = ranges.compile(ranges.Latn, ranges.Arab, ranges.numbers)
+        for char in text:
+            assert (char in matcher) == in_range(
+                char, ranges.Latn, ranges.Arab, ranges.numbers
+            )
+        assert ord("A") in matcher
+        assert "ab" not in matcher
+        assert None not in matcher
+
+    def test_names_and_lists(self):
+        """Script and category names are accepted alongside range lists."""
+        by_name = ranges.compile("Arab", "numbers")
+        by_list = ranges.compile(ranges.Arab, ranges.numbers)
+        assert by_name.ranges == by_list.ranges
+
+    def test_filter_count_mask(self):
+        """Bulk operations agree with per-character checks."""
+        text = "Hello مرحبا 你好 123!"
+        matcher = ranges.compile("Latn", "numbers")
+        expected = [in_range(c, ranges.Latn, ranges.numbers) for c in text]
+
+        assert matcher.filter(text) == "Hello123"
+        assert matcher.filter(text, " ") == "Hello" + " " * 10 + "123 "
+        assert matcher.count(text) == sum(expected)
+        assert matcher.mask(text) == bytes(expected)
+        assert matcher.mask("") == b""
+        assert matcher.count("") == 0
+
+    def test_mask_when_nul_is_in_range(self):
+        """Masks stay correct when the sentinel-free NUL character is in range."""
+        matcher = ranges.compile("symbols")
+        text = "a\x00$\n"
+        assert matcher.mask(text) == bytes(c in matcher for c in text)
+
+        everything = ranges.compile([(0, 0x10FFFF)])
+        assert everything.mask("a\x00") == b"\x01\x01"
+        assert everything.filter("a\x00") == "a\x00"
+
+    def test_mask_when_only_nul_starts_the_ranges(self):
+        """A range of exactly U+0000 does not make the sentinel collide with 0x01."""
+        text = "\x00\x01\x02\x03a\n"
+        for range_list in ([(0, 0)], [(0, 0), (2, 2)], [(0, 0), (5, 200)]):
+            matcher = ranges.compile(range_list)
+            expected = bytes(in_range(c, range_list) for c in text)
+            assert matcher.mask(text) == expected
+
+    def test_merges_overlapping_ranges(self):
+        """Overlapping and adjacent ranges are merged."""
+        matcher = ranges.compile(
+            [(0x41, 0x45), (0x44, 0x50), (0x51, 0x52), (0x60, 0x60)]
+        )
+        assert matcher.ranges == [(0x41, 0x52), (0x60, 0x60)]
+
+    def test_compile_validation(self):
+        """Invalid arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            ranges.compile()
+        with pytest.raises(ValueError):
+            ranges.compile("NotAScript")
+        with pytest.raises(ValueError):
+            ranges.compile((0x41, 0x5A))
+        with pytest.raises(ValueError):
+            ranges.compile([(0x5A, 0x41)])
+        with pytest.raises(ValueError):
+            ranges.compile([(0x41, 0x5A, 0x61)])
+        with pytest.raises(ValueError):
+            ranges.compile([0x41])
+
+
+class TestCharacterLabels:
+    """Test script_of, category_of and scripts_of."""
+
+    TEXT = "Hello مرحبا 你好 123!\t\U0001f600\u00a0ε§"
+
+    @staticmethod
+    def reference_labels(char):
+        """Labels computed with in_range using detect_script priorities."""
+        for script in ranges.list_labels()[:-4]:
+            if in_range(char, getattr(ranges, script)):
+                return script, None
+        for category in ["punctuation", "numbers", "symbols", "spaces"]:
+            if in_range(char, getattr(ranges, category)):
+                return None, category
+        return None, None
+
+    def test_script_and_category_of(self):
+        """Per-character labels follow first-match script and category priority."""
+        for char in self.TEXT:
+            script, category = self.reference_labels(char)
+            assert ranges.script_of(char) == script
+            assert ranges.category_of(char) == category
+        assert ranges.script_of("ا") == "Arab"
+        assert ranges.category_of("ا") is None
+        assert ranges.category_of("!") == "punctuation"
+
+    def test_scripts_of(self):
+        """Vectorized labels agree with the per-character functions."""
+        labels = ranges.list_labels()
+        ids = ranges.scripts_of(self.TEXT)
+        assert ids.typecode == "H"
+        assert len(ids) == len(self.TEXT)
+        for char, label_id in zip(self.TEXT, ids):
+            expected = ranges.script_of(char) or ranges.category_of(char)
+            if expected is None:
+                assert label_id == ranges.UNLABELED
+            else:
+                assert labels[label_id] == expected
+        assert len(ranges.scripts_of("")) == 0
+
+    def test_validation(self):
+        """Non single-character input raises ValueError."""
+        with pytest.raises(ValueError):
+            ranges.script_of("ab")
+        with pytest.raises(ValueError):
+            ranges.category_of("")
+
+
 class TestRealWorldExamples:
     """Test real-world usage examples."""
 
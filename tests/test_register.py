@@ -0,0 +1,139 @@
+"""
+Tests for registering custom scripts and categories.
+
+Registration changes process-wide state, so each scenario runs in a fresh
+interpreter.
+"""
+
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from unscript import register_category, register_script, script_ranges
+
+
+def run_isolated(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestRegisterScript(unittest.TestCase):
+    def test_custom_script_uses_class_table(self):
+        """A registered script is detected, cleaned and labelled like a built-in."""
+        output = run_isolated(
+            """
+            from unscript import register_script, clean_script, detect_script, ranges
+            from unscript.script_ranges import get_table_version
+
+            # Build the table and fill the caches before registering
+            print(clean_script("Latn", "\\ue000 abc"))
+            print(register_script("Xtrl", [(0xE010, 0xE0FF), (0xE000, 0xE00F)]))
+            print(get_table_version())
+            print(clean_script("Xtrl", "\\ue000\\ue0ff abc"))
+            print(detect_script("\\ue000a"))
+            print(ranges.script_of("\\ue000"), ranges.Xtrl)
+            """
+        )
+        self.assertEqual(
+            output.splitlines(),
+            [
+                "abc",
+                "1",
+                "1",
+                "\ue000\ue0ff",
+                "{'Xtrl': 50.0, 'Latn': 50.0}",
+                "Xtrl [(57344, 57599)]",
+            ],
+        )
+
+    def test_register_before_first_use(self):
+        """Registering before the table is built keeps it lazy."""
+        output = run_isolated(
+            """
+            from unscript import register_script, script_ranges
+            register_script("Xtrl", [(0xE000, 0xE0FF)])
+            print(script_ranges._STAGE1 is None)
+            print(script_ranges.first_script(script_ranges.get_script_mask(0xE000)))
+            """
+        )
+        self.assertEqual(output.split(), ["True", "Xtrl"])
+
+    def test_extend_builtin_script(self):
+        """Ranges added to a built-in script are merged into it."""
+        output = run_isolated(
+            """
+            from unscript import register_script, clean_script
+            print(repr(clean_script("Arab", "\\u0870 ab")))
+            register_script("Arab", [(0x0870, 0x089F)])
+            print(repr(clean_script("Arab", "\\u0870 ab")))
+            """
+        )
+        self.assertEqual(output.splitlines(), ["''", "'ࡰ'"])
+
+    def test_new_script_is_not_symbols(self):
+        """Code points of a new script no longer count as uncovered symbols."""
+        output = run_isolated(
+            """
+            from unscript import register_script, ranges
+            print(ranges.category_of("\\ue000"))
+            register_script("Xtrl", [(0xE000, 0xE0FF)])
+            print(ranges.category_of("\\ue000"), ranges.category_of("\\ue100"))
+            """
+        )
+        self.assertEqual(output.split(), ["symbols", "None", "symbols"])
+
+
+class TestRegisterCategory(unittest.TestCase):
+    def test_custom_category_is_include_only(self):
+        """Enabled custom categories are kept despite the symbols exclusion."""
+        output = run_isolated(
+            """
+            from unscript import register_category, clean_script
+            register_category("currency", [(0x0024, 0x0024), (0x20AC, 0x20AC)])
+            print(repr(clean_script("Latn", "Price: $5 \\u20ac")))
+            print(repr(clean_script("Latn", "Price: $5 \\u20ac", {"currency": True})))
+            """
+        )
+        self.assertEqual(output.splitlines(), ["'Price'", "'Price $ €'"])
+
+
+class TestRegisterValidation(unittest.TestCase):
+    def test_invalid_arguments(self):
+        """Invalid names and ranges raise ValueError without changing the table."""
+        version = script_ranges.get_table_version()
+        with self.assertRaises(ValueError):
+            register_script("numbers", [(0xE000, 0xE0FF)])
+        with self.assertRaises(ValueError):
+            register_category("Latn", [(0xE000, 0xE0FF)])
+        with self.assertRaises(ValueError):
+            register_category("max_foreign_words", [(0xE000, 0xE0FF)])
+        with self.assertRaises(ValueError):
+            register_script("Xtrl", [(0xE0FF, 0xE000)])
+        with self.assertRaises(ValueError):
+            register_script("Xtrl", [(0xE000, 0x110000)])
+        with self.assertRaises(ValueError):
+            register_script("Xtrl", (0xE000, 0xE0FF))
+        with self.assertRaises(ValueError):
+            register_script("Xtrl", [])
+        with self.assertRaises(ValueError):
+            register_script("", [(0xE000, 0xE0FF)])
+        self.assertEqual(script_ranges.get_table_version(), version)
+        self.assertNotIn("Xtrl", script_ranges.SCRIPT_CORE_RANGES)
+
+    def test_merge_ranges(self):
+        """Overlapping and adjacent ranges are merged."""
+        self.assertEqual(
+            script_ranges.merge_ranges([(0x50, 0x60), (0x41, 0x4F), (0x55, 0x58)]),
+            [(0x41, 0x60)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for the precomputed class table in script_ranges.
+"""
+
+import unittest
+
+from unscript import script_ranges
+from unscript.script_ranges import (
+    SCRIPT_CORE_RANGES,
+    SHARED_RANGES,
+    PUNCTUATION_LEVELS,
+    SCRIPT_BITS,
+    CATEGORY_BITS,
+    PUNCTUATION_LEVEL_BITS,
+    get_script_mask,
+    get_category_mask,
+    scripts_to_mask,
+    first_script,
+)
+
+
+def _in_ranges(code_point, ranges):
+    return any(start <= code_point <= end for start, end in ranges)
+
+
+class TestClassTable(unittest.TestCase):
+    """The class table must agree with a direct scan of the range lists."""
+
+    SAMPLE_POINTS = sorted(
+        {
+            point
+            for ranges in list(SCRIPT_CORE_RANGES.values())
+            + list(SHARED_RANGES.values())
+            + list(PUNCTUATION_LEVELS.values())
+            for start, end in ranges
+            for point in (start - 1, start, (start + end) // 2, end, end + 1)
+            if 0 <= point < 0x110000
+        }
+    )
+
+    def test_script_masks_match_ranges(self):
+        """Every script bit is set exactly for the code points in its ranges."""
+        for point in self.SAMPLE_POINTS:
+            mask = get_script_mask(point)
+            for script, ranges in SCRIPT_CORE_RANGES.items():
+                self.assertEqual(
+                    bool(mask & SCRIPT_BITS[script]),
+                    _in_ranges(point, ranges),
+                    f"{script} at U+{point:04X}",
+                )
+
+    def test_category_masks_match_ranges(self):
+        """Category and punctuation level bits match their range lists."""
+        for point in self.SAMPLE_POINTS:
+            mask = get_category_mask(point)
+            for category, ranges in SHARED_RANGES.items():
+                self.assertEqual(
+                    bool(mask & CATEGORY_BITS[category]), _in_ranges(point, ranges)
+                )
+            for level, ranges in PUNCTUATION_LEVELS.items():
+                self.assertEqual(
+                    bool(mask & PUNCTUATION_LEVEL_BITS[level]),
+                    _in_ranges(point, ranges),
+                )
+
+    def test_overlapping_scripts(self):
+        """Overlapping scripts share a mask; first_script follows dict order."""
+        han = get_script_mask(ord("你"))
+        self.assertEqual(
+            han & scripts_to_mask(["Hans", "Hant", "Jpan"]),
+            scripts_to_mask(["Hans", "Hant", "Jpan"]),
+        )
+        self.assertEqual(first_script(han), "Hans")
+
+        viet = get_script_mask(0x1EA0)
+        self.assertEqual(viet, scripts_to_mask(["Latn", "Viet"]))
+        self.assertEqual(first_script(viet), "Latn")
+
+        self.assertEqual(first_script(get_script_mask(ord("あ"))), "Jpan")
+        self.assertIsNone(first_script(get_script_mask(ord("5"))))
+
+    def test_scripts_to_mask_ignores_unknown(self):
+        """Unknown script codes do not contribute bits."""
+        self.assertEqual(scripts_to_mask(["Bogus"]), 0)
+        self.assertEqual(scripts_to_mask(["Latn", "Bogus"]), SCRIPT_BITS["Latn"])
+
+    def test_two_stage_layout(self):
+        """The block index covers all planes and pages are deduplicated."""
+        stage1, stage2 = script_ranges.get_class_table()
+        self.assertEqual(len(stage1), 0x110000 // script_ranges.PAGE_SIZE)
+        self.assertEqual(len(stage2) % script_ranges.PAGE_SIZE, 0)
+        pages = [
+            bytes(stage2[i : i + script_ranges.PAGE_SIZE])
+            for i in range(0, len(stage2), script_ranges.PAGE_SIZE)
+        ]
+        self.assertEqual(len(pages), len(set(pages)))
+        # Whole table stays in the tens of kilobytes
+        self.assertLess(2 * (len(stage1) + len(stage2)), 64 * 1024)
+
+    def test_astral_lookups(self):
+        """Astral-plane code points resolve through the block index."""
+        self.assertEqual(first_script(get_script_mask(0x20000)), "Hans")
+        self.assertEqual(first_script(get_script_mask(0x2F800)), "Hant")
+        self.assertEqual(first_script(get_script_mask(0x1B000)), "Jpan")
+        self.assertEqual(first_script(get_script_mask(0x10330)), "Goth")
+        self.assertEqual(get_script_mask(0x10FFFF), 0)
+        self.assertTrue(get_category_mask(0x10FFFF) & CATEGORY_BITS["symbols"])
+
+
+class TestClassTableFile(unittest.TestCase):
+    """The shipped binary class table must match the ranges in script_ranges."""
+
+    def test_class_table_file_is_current(self):
+        """Fails when the ranges changed without running scripts/build_tables.py."""
+        expected = script_ranges.serialize_class_table(
+            script_ranges.compute_class_table(), script_ranges.table_fingerprint()
+        )
+        with open(script_ranges.CLASS_TABLE_FILE, "rb") as f:
+            self.assertEqual(
+                f.read(),
+                expected,
+                "class_table.bin is stale; run `python scripts/build_tables.py`",
+            )
+
+    def test_loaded_table_matches_computed(self):
+        """The memory-mapped table decodes to the computed table."""
+        loaded = script_ranges._load_class_table_file(
+            script_ranges.CLASS_TABLE_FILE, script_ranges.table_fingerprint()
+        )
+        self.assertIsNotNone(loaded)
+        _, table = loaded
+        computed = script_ranges.compute_class_table()
+        for loaded_part, computed_part in zip(table, computed):
+            self.assertEqual(list(loaded_part), list(computed_part))
+
+    def test_stale_file_is_ignored(self):
+        """A fingerprint mismatch makes the loader fall back to computing."""
+        self.assertIsNone(
+            script_ranges._load_class_table_file(
+                script_ranges.CLASS_TABLE_FILE, b"\x00" * 32
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
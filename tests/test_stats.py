@@ -0,0 +1,123 @@
+"""
+Tests for removal statistics (return_stats=True).
+"""
+
+import unittest
+
+from unscript import CleaningStats, clean_script, clean_text, unscript
+
+
+class TestCleanTextStats(unittest.TestCase):
+    def test_counts_removed_noise(self):
+        """Mentions, hashtags, URLs and emoji characters are counted."""
+        text = "Hi @user @@other +plus #tag #two https://a.com www.b.org x.com 😊😊"
+        cleaned, stats = clean_text(text, return_stats=True)
+        self.assertEqual(cleaned, clean_text(text))
+        self.assertEqual(stats.mentions, 3)
+        self.assertEqual(stats.hashtags, 2)
+        self.assertEqual(stats.urls, 3)
+        self.assertEqual(stats.emojis, 2)
+        self.assertEqual(stats.documents, 1)
+        self.assertEqual(stats.input_chars, len(text))
+        self.assertEqual(stats.output_chars, len(cleaned))
+
+    def test_invalid_input(self):
+        """Non-string input returns empty text and empty stats."""
+        self.assertEqual(
+            clean_text(None, return_stats=True), ("", CleaningStats(documents=1))
+        )
+
+
+class TestCleanScriptStats(unittest.TestCase):
+    def test_counts_removed_characters(self):
+        """Removed characters are attributed to foreign scripts or categories."""
+        cleaned, stats = clean_script(
+            "Latn", "Hello مرحبا 你好 123! $ ok", return_stats=True
+        )
+        self.assertEqual(cleaned, "Hello ok")
+        self.assertEqual(stats.foreign, 7)
+        self.assertEqual(stats.numbers, 3)
+        self.assertEqual(stats.punctuation, 1)
+        self.assertEqual(stats.symbols, 1)
+        self.assertEqual(stats.spaces, 0)
+
+    def test_config_changes_counts(self):
+        """Kept categories are not counted as removed."""
+        text = "Price: 12.50 $ 你好"
+        cleaned, stats = clean_script(
+            "Latn", text, {"numbers": True, "spaces": False}, return_stats=True
+        )
+        self.assertEqual(
+            cleaned, clean_script("Latn", text, {"numbers": True, "spaces": False})
+        )
+        self.assertEqual(stats.numbers, 0)
+        self.assertEqual(stats.foreign, 2)
+        self.assertEqual(stats.punctuation, 1)
+        self.assertEqual(stats.symbols, 1)
+        self.assertEqual(stats.spaces, 3)
+
+    def test_in_script_categories(self):
+        """Removed in-script digits, punctuation and symbols count by category."""
+        cleaned, stats = clean_script("Arab", "مرحبا ١٢٣ ، ؟", return_stats=True)
+        self.assertEqual(cleaned, "مرحبا")
+        self.assertEqual((stats.foreign, stats.numbers, stats.punctuation), (0, 3, 2))
+        _, stats = clean_script("Hans", "你好。", return_stats=True)
+        self.assertEqual((stats.foreign, stats.punctuation), (0, 1))
+        _, stats = clean_script("Latn", "a × b ÷ c 你", return_stats=True)
+        self.assertEqual((stats.foreign, stats.symbols), (1, 2))
+
+    def test_unknown_script(self):
+        """Text returned unchanged reports no removals."""
+        cleaned, stats = clean_script("Xxxx", "abc", return_stats=True)
+        self.assertEqual(cleaned, "abc")
+        self.assertEqual(stats.removed_chars, 0)
+
+
+class TestUnscriptStats(unittest.TestCase):
+    def test_combines_both_steps(self):
+        """unscript reports clean_text and clean_script removals together."""
+        text = "Hello @user #tag! Visit https://example.com 😊 مرحبا"
+        cleaned, stats = unscript("Latn", text, return_stats=True)
+        self.assertEqual(cleaned, unscript("Latn", text))
+        self.assertEqual(
+            (stats.mentions, stats.hashtags, stats.urls, stats.emojis), (1, 1, 1, 1)
+        )
+        self.assertEqual(stats.foreign, 5)
+        self.assertEqual(stats.punctuation, 1)
+        self.assertEqual(stats.documents, 1)
+        self.assertEqual(stats.input_chars, len(text))
+        self.assertEqual(stats.output_chars, len(cleaned))
+
+
+class TestAggregation(unittest.TestCase):
+    def test_sum_and_add(self):
+        """Stats of several documents add up."""
+        docs = ["Hello @a مرحبا", "#tag world 123", "https://x.com ok 😊"]
+        per_doc = [unscript("Latn", doc, return_stats=True)[1] for doc in docs]
+        total = sum(per_doc)
+        self.assertEqual(total.documents, 3)
+        self.assertEqual(total.input_chars, sum(len(doc) for doc in docs))
+        self.assertEqual(total.mentions, 1)
+        self.assertEqual(total.hashtags, 1)
+        self.assertEqual(total.urls, 1)
+        self.assertEqual(total.emojis, 1)
+
+        running = CleaningStats()
+        for stats in per_doc:
+            running += stats
+        self.assertEqual(running, total)
+        self.assertEqual(per_doc[0] + per_doc[1] + per_doc[2], total)
+        self.assertEqual(total.as_dict()["documents"], 3)
+        # Adding does not modify the operands
+        self.assertEqual(per_doc[0].documents, 1)
+
+    def test_unknown_field(self):
+        """Unknown fields are rejected."""
+        with self.assertRaises(TypeError):
+            CleaningStats(bogus=1)
+        with self.assertRaises(AttributeError):
+            CleaningStats().bogus = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
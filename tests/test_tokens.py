@@ -0,0 +1,66 @@
+"""
+Tests for token-list output (clean_script_tokens, unscript_tokens).
+"""
+
+import unittest
+
+from unscript import clean_script, clean_script_tokens, unscript, unscript_tokens
+
+
+class TestCleanScriptTokens(unittest.TestCase):
+    def test_matches_split(self):
+        """Tokens equal splitting the clean_script result."""
+        cases = [
+            ("Latn", "Hello, world!  مرحبا 123", None),
+            ("Latn", "Price: 12.50 $ today", {"numbers": True, "symbols": True}),
+            ("Arab", "مرحبا! Hello بالعالم", {"punctuation": True}),
+            (["Latn", "Arab"], "a\tb\n\nc مرحبا", None),
+            ("Latn", "Hello мир 你好", {"max_foreign_words": 1}),
+            ("Latn", "no spaces", {"spaces": False}),
+        ]
+        for script, text, config in cases:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    clean_script_tokens(script, text, config),
+                    clean_script(script, text, config).split(),
+                )
+
+    def test_with_scripts(self):
+        """Tokens can be tagged with their dominant script."""
+        self.assertEqual(
+            clean_script_tokens(["Latn", "Arab"], "Hello مرحبا 123", with_scripts=True),
+            [("Hello", "Latn"), ("مرحبا", "Arab")],
+        )
+        self.assertEqual(
+            clean_script_tokens("Latn", "ok 12", {"numbers": True}, with_scripts=True),
+            [("ok", "Latn"), ("12", None)],
+        )
+
+    def test_edge_cases(self):
+        """Empty input gives no tokens; unknown scripts split the text unchanged."""
+        self.assertEqual(clean_script_tokens("Latn", ""), [])
+        self.assertEqual(clean_script_tokens("Latn", None), [])
+        self.assertEqual(clean_script_tokens("Latn", "你好"), [])
+        self.assertEqual(clean_script_tokens("Xxxx", "a  b!"), ["a", "b!"])
+
+
+class TestUnscriptTokens(unittest.TestCase):
+    def test_matches_split(self):
+        """Tokens equal splitting the unscript result."""
+        text = "Hello @user #tag! Visit https://example.com 😊 مرحبا WORLD"
+        self.assertEqual(unscript_tokens("Latn", text), unscript("Latn", text).split())
+        self.assertEqual(
+            unscript_tokens("Latn", text, lowercase=False),
+            unscript("Latn", text, lowercase=False).split(),
+        )
+        self.assertEqual(
+            unscript_tokens("Arab", text, with_scripts=True), [("مرحبا", "Arab")]
+        )
+
+    def test_invalid_input(self):
+        """Non-string input gives no tokens."""
+        self.assertEqual(unscript_tokens("Latn", None), [])
+
+
+if __name__ == "__main__":
+    unittest.main()